@@ -0,0 +1,39 @@
+# benchmarks/bench_closed_loop.py
+# Closed-loop SP1/SP2 spray control: scenarios per minute vs batch size.
+# Run from repo root: python -m benchmarks.bench_closed_loop
+
+import os
+import time
+import numpy as np
+from steamlib.closed_loop import ClosedLoopSimulator, SprayLoop
+from steamlib.control import PID, SprayValve
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.platen_superheater import PlatenSuperheater
+from steamlib.steam_properties import GridBackend
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+def simulator(platen, final, n: int, seed: int = 0) -> ClosedLoopSimulator:
+    """SP1 single PI loop, SP2 cascade; gains scattered around a workable tuning."""
+    rng = np.random.default_rng(seed)
+    sp1 = SprayLoop(platen, PID(kp=-rng.uniform(1, 8, n), ti_s=rng.uniform(30, 120, n), u_min=0, u_max=100),
+                    valve=SprayValve(40.0, 5.0), k=0.6, setpoint_c=418.0)
+    sp2 = SprayLoop(final, PID(kp=rng.uniform(0.5, 2, n), ti_s=rng.uniform(60, 240, n), u_min=400, u_max=560),
+                    PID(kp=-3.0, ti_s=20.0, u_min=0, u_max=100), valve=SprayValve(40.0, 5.0), k=0.7)
+    return ClosedLoopSimulator([sp1, sp2], dt=1.0)
+
+
+if __name__ == "__main__":
+    backend = GridBackend.cached()
+    platen = PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml'), property_backend=backend)
+    final = FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'), property_backend=backend)
+    n_steps = 3600  # 1 h at 1 s
+    disturbance = np.r_[np.zeros(600), np.full(n_steps - 600, 10.0)]  # Firing step seen by the platen
+    for n in (1, 100, 1000, 5000):
+        sim = simulator(platen, final, n)
+        t0 = time.perf_counter()
+        result = sim.run(n_steps, 100.0, 500.0, 370.0, disturbance_c=[disturbance, None], record=False)
+        elapsed = time.perf_counter() - t0
+        print(f"{n:>5} scenarios x 1 h: {elapsed:6.3f} s ({n / elapsed * 60:>10,.0f} scenarios/min), "
+              f"SP1 IAE median {np.median(result[0]['iae']):.0f}")
@@ -0,0 +1,32 @@
+# benchmarks/bench_discretisation.py
+# Repeated scenarios at one load point: cold vs cached discretisation, discrete vs BDF distributed model.
+# Run from repo root: python -m benchmarks.bench_discretisation
+
+import os
+import time
+import numpy as np
+from steamlib.discretisation import shared_discretisation_cache
+from steamlib.distributed import DistributedTubeModel
+from steamlib.final_superheater import FinalSuperheater
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+if __name__ == "__main__":
+    sh = FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'))
+    model = DistributedTubeModel(sh, 170.0, cell_length_m=1.0)
+    rng = np.random.default_rng(0)
+    dt, n_steps, n_runs = 1.0, 3600, 50
+    t_in = sh.setpoint_inlet_C + np.cumsum(rng.normal(0, 0.2, (n_runs, n_steps)), axis=1)
+    cache = shared_discretisation_cache()
+    cache.clear()
+    start = time.perf_counter()
+    model.discretise(dt, 500.0)
+    print(f"discretise, cold: {1e3 * (time.perf_counter() - start):.1f} ms ({2 * model.n_cells} states)")
+    start = time.perf_counter()
+    for run in t_in:
+        model.simulate_discrete(dt, n_steps, run, 500.0)
+    print(f"simulate_discrete, {n_runs} x 1 h: {time.perf_counter() - start:.2f} s  cache {cache.stats()}")
+    start = time.perf_counter()
+    model.simulate(np.arange(n_steps + 1) * dt, np.r_[t_in[0, 0], t_in[0]], 500.0)
+    print(f"simulate (BDF), 1 x 1 h: {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,40 @@
+# benchmarks/bench_fopdt.py
+# fopdt_step_response: old per-sample loop vs vectorized, scaling to 10^7 samples.
+# Run from repo root: python -m benchmarks.bench_fopdt
+
+import os
+import time
+import numpy as np
+from steamlib.final_superheater import FinalSuperheater
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+def loop_step_response(t, k, theta_s, tau_s):
+    """The pre-vectorization implementation."""
+    y = np.zeros_like(t)
+    for i, ti in enumerate(t):
+        if ti > theta_s:
+            y[i] = k * (1 - np.exp(-(ti - theta_s) / tau_s))
+    return y
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    final = FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'))
+    k, theta_s, tau_s = 0.7, 30.0, 120.0
+    for n in (10**3, 10**4, 10**5, 10**6, 10**7):
+        t = np.linspace(0, n / 10, n)  # 10 Hz trace
+        y, t_vec = timed(final.fopdt_step_response, t, k, theta_s, tau_s)
+        line = f"n={n:>10,}: vectorized {t_vec * 1e3:8.2f} ms ({n / t_vec / 1e6:6.1f} M samples/s)"
+        if n <= 10**5:
+            y_loop, t_loop = timed(loop_step_response, t, k, theta_s, tau_s)
+            line += f", loop {t_loop * 1e3:8.1f} ms ({t_loop / t_vec:,.0f}x), max diff {np.abs(y - y_loop).max():.1e}"
+        print(line)
+    grid = np.linspace(0, 600, 6000).reshape(60, 100)  # 2-D time grids are fine too
+    assert final.fopdt_step_response(grid, k, theta_s, 0.0).shape == grid.shape
@@ -0,0 +1,32 @@
+# benchmarks/bench_gain_schedule.py
+# Gain-schedule generation over flow x pressure and runtime lookup latency.
+# Run from repo root: python -m benchmarks.bench_gain_schedule
+
+import os
+import time
+import timeit
+import numpy as np
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.steam_properties import GridBackend
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+if __name__ == "__main__":
+    sh = FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'),
+                          property_backend=GridBackend.cached())
+    flow_th, p_bar = np.linspace(150, 600, 46), np.linspace(60, 140, 41)  # 10 t/h x 2 bar
+    for method, kwargs in (('simc', {}), ('imc', {}), ('search', {'workers': os.cpu_count()})):
+        grid = (flow_th, p_bar) if method != 'search' else (flow_th[::5], p_bar[::5])
+        t0 = time.perf_counter()
+        schedule = sh.gain_schedule(*grid, k=0.7, method=method, **kwargs)
+        print(f"{method:>6}: {schedule.table.shape[0]}x{schedule.table.shape[1]} grid in {time.perf_counter() - t0:7.3f} s")
+    n = 200_000
+    per_call = timeit.timeit(lambda: schedule.interpolate(412.3, 113.7), number=n) / n
+    print(f"scalar interpolate: {per_call * 1e6:.2f} us/call; lookup dict: "
+          f"{timeit.timeit(lambda: schedule.lookup(412.3, 113.7), number=n) / n * 1e6:.2f} us/call")
+    rng = np.random.default_rng(0)
+    flows, ps = rng.uniform(150, 600, 10**6), rng.uniform(60, 140, 10**6)
+    t0 = time.perf_counter()
+    schedule.lookup_batch(flows, ps)
+    print(f"batch lookup: 1e6 points in {time.perf_counter() - t0:.3f} s")
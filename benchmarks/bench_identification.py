@@ -0,0 +1,30 @@
+# benchmarks/bench_identification.py
+# FOPDT/SOPDT identification from a year of 1 s spray-valve / outlet temperature data.
+# Run from repo root: python -m benchmarks.bench_identification
+
+import time
+import numpy as np
+from steamlib.fopdt import fopdt_simulate, sopdt_simulate
+from steamlib.identification import identify_fopdt, identify_sopdt
+
+
+def historian_trace(n: int, model: str, seed: int = 0):
+    """Valve [%] moved every 5 min, outlet temperature with 0.2 °C measurement noise."""
+    rng = np.random.default_rng(seed)
+    u = 30 + np.repeat(rng.normal(0, 5, n // 300 + 1), 300)[:n]
+    if model == 'fopdt':
+        y = fopdt_simulate(u - 30, 1.0, -0.8, 23.4, 45.0, u[0] - 30)
+    else:
+        y = sopdt_simulate(u - 30, 1.0, -0.8, 17.0, 40.0, 15.0, u[0] - 30)
+    return u, 540 + y + rng.normal(0, 0.2, n)
+
+
+if __name__ == "__main__":
+    for days in (1, 30, 365):
+        n = days * 86400
+        for model, identify in (('fopdt', identify_fopdt), ('sopdt', identify_sopdt)):
+            u, y = historian_trace(n, model)
+            t0 = time.perf_counter()
+            fit = identify(u, y, dt=1.0, max_delay_s=120.0, refine_samples=2_000_000)
+            lags = ', '.join(f"{key} {fit[key]:.2f}" for key in ('k', 'theta_s', 'tau_s', 'tau1_s', 'tau2_s') if key in fit)
+            print(f"{days:>3} d {model}: {time.perf_counter() - t0:6.2f} s  ({lags}, fit {fit['fit']:.3f})")
@@ -0,0 +1,30 @@
+# benchmarks/bench_lag_models.py
+# FOPDT vs SOPDT vs section lag chain: step responses and long-input simulation cost.
+# Run from repo root: python -m benchmarks.bench_lag_models
+
+import os
+import time
+import numpy as np
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.fopdt import fopdt_simulate, sopdt_simulate
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+if __name__ == "__main__":
+    sh = FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'))
+    props = sh.calculate_properties(100.0, 420.0, 300.0)
+    sopdt = sh.sopdt_parameters(props)
+    chain = sh.section_lag_chain(props)
+    print(f"theta {props['theta_s']:.2f} s, tau {props['tau_s']:.2f} s; SOPDT {sopdt}; "
+          f"chain lags {np.round(chain.taus_s, 3)}")
+    t = np.linspace(0, 10 * (props['theta_s'] + props['tau_s']), 2001)
+    gap = np.abs(chain.step(t) - sh.sopdt_step_response(t, **sopdt)).max()
+    print(f"max |chain - SOPDT| step gap: {gap:.4f} (k = {chain.k})")
+    u = np.repeat(np.random.default_rng(0).normal(0, 1, 10**5), 100)  # 1e7 samples
+    for name, run in (('fopdt', lambda: fopdt_simulate(u, 0.1, 0.7, props['theta_s'], props['tau_s'])),
+                      ('sopdt', lambda: sopdt_simulate(u, 0.1, 0.7, **sopdt)),
+                      ('chain', lambda: chain.simulate(u, 0.1))):
+        t0 = time.perf_counter()
+        run()
+        print(f"{name}: 1e7 samples in {time.perf_counter() - t0:.3f} s")
@@ -0,0 +1,39 @@
+# benchmarks/bench_lpv.py
+# LPV FOPDT over multi-hour startup traces: XSteam vs cached grid property path.
+# Run from repo root: python -m benchmarks.bench_lpv
+
+import os
+import time
+import numpy as np
+from steamlib.platen_superheater import PlatenSuperheater
+from steamlib.steam_properties import GridBackend
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+def startup_trace(hours: float, dt: float, seed: int = 0):
+    """Pressure, platen inlet temperature and flow ramping from low load; spray-like input."""
+    n = int(hours * 3600 / dt)
+    ramp = np.linspace(0, 1, n)
+    rng = np.random.default_rng(seed)
+    p_bar = 40 + 120 * ramp
+    t_c = 360 + 90 * ramp + rng.normal(0, 0.3, n)
+    flow_th = 150 + 450 * ramp
+    u = np.repeat(rng.normal(0, 1, n // 600 + 1), 600)[:n]  # Valve moves every 600 samples
+    return p_bar, t_c, flow_th, u
+
+
+if __name__ == "__main__":
+    xsteam = PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml'))
+    grid = PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml'),
+                             property_backend=GridBackend.cached())
+    for hours, dt in ((4, 1.0), (4, 0.1), (12, 0.1)):
+        p_bar, t_c, flow_th, u = startup_trace(hours, dt)
+        line = f"{hours:>2} h @ {1 / dt:>4.0f} Hz ({p_bar.size:>9,} samples):"
+        for name, sh in (('grid', grid), ('xsteam', xsteam)):
+            if name == 'xsteam' and p_bar.size > 20000:
+                continue
+            t0 = time.perf_counter()
+            sh.lpv_simulate(p_bar, t_c, flow_th, u, dt)
+            line += f" {name} {time.perf_counter() - t0:6.3f} s"
+        print(line)
@@ -0,0 +1,56 @@
+# benchmarks/bench_properties.py
+# Throughput: scalar calculate_properties loop vs calculate_properties_batch (XSteam and grid);
+# grid error against XSteam over the whole historian sample.
+# Run from repo root: python -m benchmarks.bench_properties
+
+import os
+import time
+import numpy as np
+from steamlib.platen_superheater import PlatenSuperheater
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.steam_properties import GridBackend
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+def historian_day(n: int = 86400, seed: int = 0):
+    """1 s samples around low load, quantised to sensor resolution (0.1 bar, 0.1 °C, 1 t/h)."""
+    rng = np.random.default_rng(seed)
+    p_bar = np.round(40.0 + np.cumsum(rng.normal(0, 0.02, n)).clip(-5, 5), 1)
+    t_c = np.round(350.0 + np.cumsum(rng.normal(0, 0.05, n)).clip(-15, 15), 1)
+    flow_th = np.round(200.0 + np.cumsum(rng.normal(0, 0.1, n)).clip(-40, 40), 0)
+    return p_bar, t_c, flow_th
+
+
+def bench(sh, n_scalar: int = 2000, reference=None):
+    """Scalar vs batch throughput; with `reference` (XSteam batch output for the same sample)
+    also the worst relative error of sh's backend over the whole sample."""
+    p_bar, t_c, flow_th = historian_day()
+    t0 = time.perf_counter()
+    for i in range(n_scalar):
+        sh.calculate_properties(p_bar[i], t_c[i], flow_th[i])
+    scalar_rate = n_scalar / (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    props = sh.calculate_properties_batch(p_bar, t_c, flow_th)
+    batch_rate = len(p_bar) / (time.perf_counter() - t0)
+    check = sh.calculate_properties(p_bar[0], t_c[0], flow_th[0])
+    err = max(abs(props[k][0] - check[k]) / abs(check[k]) for k in check)
+    backend = type(sh.property_backend).__name__
+    line = (f"{type(sh).__name__} [{backend}]: scalar {scalar_rate:,.0f} pts/s, batch {batch_rate:,.0f} pts/s "
+            f"({batch_rate / scalar_rate:.1f}x), batch vs scalar {err:.1e}")
+    if reference is not None:
+        worst = {k: np.max(np.abs(props[k] - reference[k]) / np.abs(reference[k]))
+                 for k in ('h', 'cp', 'rho', 'theta_s', 'tau_s')}
+        line += f"; vs XSteam over {len(p_bar):,} pts: " + ", ".join(f"{k} {e:.1e}" for k, e in worst.items())
+    print(line)
+    return props
+
+
+if __name__ == "__main__":
+    platen = bench(PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml')))
+    final = bench(FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml')))
+    grid = GridBackend()
+    bench(PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml'), property_backend=grid),
+          reference=platen)
+    bench(FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'), property_backend=grid),
+          reference=final)
@@ -0,0 +1,32 @@
+# benchmarks/bench_property_service.py
+# Per-call calculate_properties latency: XSteam() built per call (old) vs shared backend.
+# Run from repo root: python -m benchmarks.bench_property_service
+
+import os
+import timeit
+from pyXSteam.XSteam import XSteam
+from steamlib.platen_superheater import PlatenSuperheater
+from steamlib.final_superheater import FinalSuperheater
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+def per_call_xsteam(sh, p_bar, t_c, steam_flow_th):
+    """The pre-service pattern: new XSteam instance on every call."""
+    steam = XSteam(XSteam.UNIT_SYSTEM_MKS)
+    h_kjkg = steam.h_pt(p_bar, t_c)
+    cp_kjkgk = steam.Cp_pt(p_bar, t_c)
+    rho_kgm3 = 1 / steam.v_pt(p_bar, t_c)
+    return sh._lumped_properties(h_kjkg, cp_kjkgk, rho_kgm3, steam_flow_th)
+
+
+def bench(sh, t_c: float, n: int = 5000):
+    before = min(timeit.repeat(lambda: per_call_xsteam(sh, 40.0, t_c, 200.0), number=n, repeat=3)) / n
+    after = min(timeit.repeat(lambda: sh.calculate_properties(40.0, t_c, 200.0), number=n, repeat=3)) / n
+    print(f"{type(sh).__name__}: before {before * 1e6:.1f} us/call, after {after * 1e6:.1f} us/call "
+          f"({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    bench(PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml')), 350.0)
+    bench(FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml')), 410.0)
@@ -0,0 +1,24 @@
+# benchmarks/bench_sensitivity.py
+# Sobol indices of theta_s / tau_s over the YAML parameters: runtime vs sample count.
+# Run from repo root: python -m benchmarks.bench_sensitivity
+
+import os
+import time
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.platen_superheater import PlatenSuperheater
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+if __name__ == "__main__":
+    final = FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'))
+    for n in (1 << 12, 1 << 16, 1 << 20):
+        start = time.perf_counter()
+        result = final.sobol_sensitivity(170.0, n_samples=n)
+        print(f"N = {n:>8}: {result['n_evaluations']:>9} evaluations in {time.perf_counter() - start:.2f} s")
+    platen = PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml'))
+    for name, sh, p_bar in (('final', final, 170.0), ('platen', platen, 120.0)):  # Platen inlet 350 °C: Tsat(120 bar) 324.7 °C
+        result = sh.sobol_sensitivity(p_bar, n_samples=1 << 16)
+        for output in ('theta_s', 'tau_s'):
+            ranked = sorted(zip(result['names'], result[output]['ST']), key=lambda item: -item[1])
+            print(f"{name} {output} ST: " + ', '.join(f"{p} {st:.3f}" for p, st in ranked))
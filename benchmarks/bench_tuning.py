@@ -0,0 +1,27 @@
+# benchmarks/bench_tuning.py
+# PI/PID auto-tuning over the load range: serial vs process pool.
+# Run from repo root: python -m benchmarks.bench_tuning
+
+import os
+import time
+import numpy as np
+from steamlib.platen_superheater import PlatenSuperheater
+from steamlib.steam_properties import GridBackend
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+if __name__ == "__main__":
+    sh = PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml'),
+                           property_backend=GridBackend.cached())
+    load = np.linspace(0.3, 1.0, 36)
+    # Sliding pressure capped at 140 bar: 350 °C platen inlet stays >= 13 °C superheated (Tsat 336.7 °C)
+    p_bar, t_c, flow_th = 60 + 80 * load, np.full(load.shape, sh.setpoint_inlet_C), 600 * load
+    workers = os.cpu_count() or 1
+    for mode in ('pi', 'pid'):
+        for n_workers in sorted({1, workers}):
+            t0 = time.perf_counter()
+            gains = sh.tune_pid(p_bar, t_c, flow_th, mode=mode, workers=n_workers)
+            print(f"{mode:>3}, {load.size} load points, {n_workers:>2} worker(s): {time.perf_counter() - t0:6.2f} s; "
+                  f"kc {gains['kc'].min():.2f}..{gains['kc'].max():.2f}, median IAE "
+                  f"{np.median(gains['iae']):.1f}")
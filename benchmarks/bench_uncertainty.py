@@ -0,0 +1,34 @@
+# benchmarks/bench_uncertainty.py
+# Monte Carlo bands on theta_s / tau_s / outlet response: throughput and streaming-quantile accuracy.
+# Run from repo root: python -m benchmarks.bench_uncertainty
+
+import os
+import time
+import numpy as np
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.uncertainty import StreamingQuantiles
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+if __name__ == "__main__":
+    sh = FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'))
+    parameters = {'U_W_m2K_low_load': ('normal', sh.U_W_m2K_low_load, 0.1 * sh.U_W_m2K_low_load),
+                  'tube_id_mm': ('uniform', sh.tube_id_mm - 1, sh.tube_id_mm + 1),
+                  'tube_od_mm': ('uniform', sh.tube_od_mm - 0.5, sh.tube_od_mm + 0.5),
+                  'steam_flow_th': ('uniform', 400.0, 600.0)}
+    mc = sh.monte_carlo(parameters, p_bar=170.0, steam_flow_th=500.0, t_s=np.arange(0.0, 120.0 + 1e-9, 1.0))
+    for n in (1 << 16, 1 << 20):
+        start = time.perf_counter()
+        result = mc.run(n)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>8} samples: {elapsed:.2f} s  theta_s 5/50/95% {np.round(result['theta_s']['bands'], 3)}"
+              f"  tau_s {np.round(result['tau_s']['bands'], 3)}")
+    rng = np.random.default_rng(0)
+    x = rng.lognormal(0.0, 0.5, (1 << 20, 4))
+    sketch = StreamingQuantiles(4)
+    for block in np.array_split(x, 64):
+        sketch.update(block)
+    q = [0.01, 0.05, 0.5, 0.95, 0.99]
+    error = np.abs(sketch.quantile(q) - np.quantile(x, q, axis=0)).max()
+    print(f"sketch vs exact quantiles, 2^20 lognormal samples: max error {error:.2e} (range {np.ptp(x):.1f}, 1024 bins)")
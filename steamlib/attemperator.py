@@ -0,0 +1,100 @@
+# steamlib/attemperator.py
+# Spray desuperheater (attemperator): IF97 mass + energy balance, vectorized over arrays.
+# m_out = m_s + m_w ; m_out * h_out = m_s * h_s(p, T_s) + m_w * h_w(p_w, T_w) ; T_out from (p, h_out).
+
+from dataclasses import dataclass, field
+import numpy as np
+from pyXSteam.XSteam import XSteam
+from scipy.interpolate import RegularGridInterpolator
+from typing import Dict, Optional, Tuple
+from steamlib.steam_properties import PropertyBackend, shared_property_backend
+
+
+@dataclass
+class Attemperator:
+    """Downstream temperature for given spray flow (and the spray needed for a target)."""
+    backend: Optional[PropertyBackend] = field(default=None, repr=False)  # None: shared XSteam; GridBackend for speed
+    newton_iter: int = 4  # T(p, h) iterations; converged to <1e-6 °C from the cp estimate
+    p_sat_range_bar: Tuple[float, float] = (1.0, 220.0)  # Saturation table, 0.1 bar steps
+    spray_t_range_c: Tuple[float, float] = (20.0, 340.0)  # Compressed-liquid h table, 5 bar x 5 °C
+    spray_subcool_margin_c: float = 10.0  # Closer to Tsat: spray enthalpy from the backend
+
+    def __post_init__(self):
+        if self.backend is None:
+            self.backend = shared_property_backend()
+        steam = XSteam(XSteam.UNIT_SYSTEM_MKS)
+        self._p_sat = np.arange(self.p_sat_range_bar[0], self.p_sat_range_bar[1] + 0.05, 0.1)
+        self._t_sat = np.array([steam.tsat_p(p) for p in self._p_sat])
+        self._h_vap = np.array([steam.hV_p(p) for p in self._p_sat])
+        p_nodes = np.linspace(*self.p_sat_range_bar, int(np.ceil(np.ptp(self.p_sat_range_bar) / 5.0)) + 1)
+        t_nodes = np.linspace(*self.spray_t_range_c, int(np.ceil(np.ptp(self.spray_t_range_c) / 5.0)) + 1)
+        self._liquid_step = (p_nodes[1] - p_nodes[0], t_nodes[1] - t_nodes[0])
+        h_liq = np.array([[steam.h_pt(p, min(t, steam.tsat_p(p) - 0.1)) for t in t_nodes] for p in p_nodes])
+        self._h_liquid = RegularGridInterpolator((p_nodes, t_nodes), h_liq, bounds_error=False)
+
+    def spray_enthalpy(self, p_bar, t_c) -> np.ndarray:
+        """Compressed-liquid enthalpy [kJ/kg]; bilinear table (<0.1 kJ/kg below 300 °C) away from saturation."""
+        p_bar, t_c = np.broadcast_arrays(np.asarray(p_bar, dtype=float), np.asarray(t_c, dtype=float))
+        shape, p_bar, t_c = p_bar.shape, p_bar.ravel(), t_c.ravel()
+        h = self._h_liquid(np.column_stack([p_bar, t_c]))
+        dp_bar, dt_c = self._liquid_step
+        t_sat, _ = self.saturation(p_bar - dp_bar)  # Whole interpolation cell must be subcooled
+        fallback = np.isnan(h) | (t_c + dt_c > t_sat - self.spray_subcool_margin_c)
+        if fallback.any():
+            h[fallback] = self.backend.props_pt(p_bar[fallback], t_c[fallback])[0]
+        return h.reshape(shape)
+
+    def saturation(self, p_bar) -> Tuple[np.ndarray, np.ndarray]:
+        """Tsat [°C] and saturated vapour enthalpy [kJ/kg] (interpolated table)."""
+        return np.interp(p_bar, self._p_sat, self._t_sat), np.interp(p_bar, self._p_sat, self._h_vap)
+
+    def mix(self, p_bar, t_steam_c, steam_flow_th, spray_flow_th, t_spray_c,
+            p_spray_bar=None) -> Dict[str, np.ndarray]:
+        """Outlet state for arrays of operating points (spray at p_spray_bar, default line pressure).
+
+        'saturated' marks points sprayed into the two-phase region; their
+        t_out_c is clamped to Tsat.
+        """
+        p_bar, t_steam_c, steam_flow_th, spray_flow_th, t_spray_c = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (p_bar, t_steam_c, steam_flow_th, spray_flow_th, t_spray_c)))
+        p_spray_bar = p_bar if p_spray_bar is None else np.broadcast_to(np.asarray(p_spray_bar, dtype=float), p_bar.shape)
+        h_s, cp_s, _ = self.backend.props_pt(p_bar, t_steam_c)
+        h_w = self.spray_enthalpy(p_spray_bar, t_spray_c)
+        flow_out_th = steam_flow_th + spray_flow_th
+        h_out = (steam_flow_th * h_s + spray_flow_th * h_w) / flow_out_th
+        t_sat, h_vap = self.saturation(p_bar)
+        saturated = h_out <= h_vap
+        t_out = t_steam_c - (h_s - h_out) / cp_s  # cp estimate, then Newton on h(p, T) = h_out
+        t_out = np.maximum(t_out, t_sat + 1e-3)
+        for _ in range(self.newton_iter):
+            h, cp, _ = self.backend.props_pt(p_bar, t_out)
+            t_out = np.maximum(t_out - (h - h_out) / cp, t_sat + 1e-3)
+        t_out = np.where(saturated, t_sat, t_out)
+        return {'t_out_c': t_out, 'flow_out_th': flow_out_th, 'h_out_kjkg': h_out, 'saturated': saturated}
+
+    def outlet(self, p_bar, t_steam_c, steam_flow_th, spray_flow_th, t_spray_c) -> Tuple[np.ndarray, np.ndarray]:
+        """(T_out, flow_out); the stage interface used by SteamPath."""
+        result = self.mix(p_bar, t_steam_c, steam_flow_th, spray_flow_th, t_spray_c)
+        return result['t_out_c'], result['flow_out_th']
+
+    def valve_gain(self, p_bar, t_steam_c, steam_flow_th, t_spray_c, max_flow_th,
+                   spray_flow_th=0.0) -> np.ndarray:
+        """Local outlet change per % spray valve [°C/%] at the given spray (negative).
+
+        dT_out/dw = m (h_w - h_s) / ((m + w)^2 cp_out), times max_flow_th / 100.
+        """
+        m, w = np.asarray(steam_flow_th, dtype=float), np.asarray(spray_flow_th, dtype=float)
+        out = self.mix(p_bar, t_steam_c, m, w, t_spray_c)
+        h_s, _, _ = self.backend.props_pt(np.asarray(p_bar, dtype=float), np.asarray(t_steam_c, dtype=float))
+        _, cp_out, _ = self.backend.props_pt(np.asarray(p_bar, dtype=float), out['t_out_c'])
+        h_w = self.spray_enthalpy(p_bar, t_spray_c)
+        return m * (h_w - h_s) / ((m + w) ** 2 * cp_out) * np.asarray(max_flow_th, dtype=float) / 100.0
+
+    def spray_for_outlet(self, p_bar, t_steam_c, steam_flow_th, t_target_c, t_spray_c, p_spray_bar=None) -> np.ndarray:
+        """Spray flow [t/h] that brings the outlet to t_target_c (0 where no spray is needed)."""
+        p_bar = np.asarray(p_bar, dtype=float)
+        p_spray_bar = p_bar if p_spray_bar is None else p_spray_bar
+        h_s, _, _ = self.backend.props_pt(p_bar, t_steam_c)
+        h_t, _, _ = self.backend.props_pt(p_bar, t_target_c)
+        h_w = self.spray_enthalpy(p_spray_bar, t_spray_c)
+        return np.maximum(np.asarray(steam_flow_th, dtype=float) * (h_s - h_t) / (h_t - h_w), 0.0)
@@ -0,0 +1,88 @@
+# steamlib/cache.py
+# Small bounded LRU cache with hit/miss/eviction counters (thread-safe).
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """Bounded mapping; least recently used entries are evicted past `maxsize`.
+
+    With max_weight, entries are also evicted while the summed weigh(value)
+    (e.g. array bytes) exceeds it; a value heavier than max_weight is not kept,
+    and any older value under its key is dropped.
+    """
+
+    def __init__(self, maxsize: int = 65536, max_weight: Optional[float] = None,
+                 weigh: Optional[Callable[[Any], float]] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if (max_weight is None) != (weigh is None):
+            raise ValueError("max_weight and weigh go together")
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict = OrderedDict()
+        self._weights: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            if self.weigh is not None:
+                weight = self.weigh(value)
+                if weight > self.max_weight:
+                    if key in self._data:  # Never leave the superseded value behind
+                        del self._data[key]
+                        self.weight -= self._weights.pop(key)
+                    return
+                self.weight += weight - self._weights.get(key, 0)
+                self._weights[key] = weight
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize or (self.max_weight is not None and self.weight > self.max_weight):
+                evicted, _ = self._data.popitem(last=False)
+                self.weight -= self._weights.pop(evicted, 0)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self.weight = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                     'size': len(self._data), 'maxsize': self.maxsize}
+            if self.max_weight is not None:
+                stats.update(weight=self.weight, max_weight=self.max_weight)
+            return stats
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_MISSING = object()
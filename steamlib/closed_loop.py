@@ -0,0 +1,175 @@
+# steamlib/closed_loop.py
+# Discrete-time closed-loop simulation of the spray temperature loops (SP1 -> platen, SP2 -> final).
+# All scenarios advance together: one numpy operation per signal per sample, whatever the batch size.
+
+from dataclasses import dataclass, field
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from steamlib.attemperator import Attemperator
+from steamlib.control import PID, SprayValve
+from steamlib.fopdt import fopdt_discretise_batch
+
+
+@dataclass
+class SprayLoop:
+    """Attemperator + superheater stage with its temperature controllers.
+
+    Cascade (slave given): master holds the stage outlet by setting the
+    attemperator outlet setpoint, slave drives the valve [%] from the
+    attemperator outlet temperature. Single loop (slave None): master
+    output is the valve position. Stage dynamics as in SteamPath:
+    T_out = setpoint_out + FOPDT(k, θ, τ)(T_att - setpoint_in).
+    """
+    sh: object  # PlatenSuperheater / FinalSuperheater
+    master: PID
+    slave: Optional[PID] = None
+    valve: SprayValve = field(default_factory=SprayValve)
+    k: float = 0.6
+    sensor_tau_s: float = 10.0  # Thermocouple lag on both measurements
+    t_spray_c: float = 200.0
+    setpoint_c: Optional[float] = None  # None: sh.setpoint_outlet_C
+
+
+@dataclass
+class ClosedLoopSimulator:
+    """Loops in steam-flow order; each loop's outlet is the next loop's attemperator inlet.
+
+    The attemperator is linearised per scenario around its operating point
+    (energy balance with constant steam cp, exact spray enthalpy);
+    exact_mixing=True solves the IF97 balance every sample instead.
+    """
+    loops: Sequence[SprayLoop]
+    dt: float = 1.0
+    attemperator: Optional[Attemperator] = None
+    exact_mixing: bool = False
+
+    def __post_init__(self):
+        if self.attemperator is None:
+            self.attemperator = Attemperator(self.loops[-1].sh.property_backend)
+
+    def run(self, n_steps: int, p_bar, steam_flow_th, t_in_c, setpoint_c=None, disturbance_c=None,
+            record: bool = True) -> List[Dict[str, np.ndarray]]:
+        """Simulate n_steps samples from steady state; one result dict per loop.
+
+        p_bar, steam_flow_th: per scenario (scalar or (n,)); the flow enters
+        the first attemperator. t_in_c and the per-loop setpoint_c /
+        disturbance_c (inlet-equivalent heat pickup change, °C) are scalars,
+        time series (n_steps,) or (n_steps, n). Metrics ('ise', 'iae',
+        'max_error_c', 'overshoot_c', 'valve_travel_pct') are always returned;
+        'outlet_c', 'attemperator_c', 'valve_pct', 'spray_th' (n_steps, n) when record.
+        """
+        dt, loops = self.dt, self.loops
+        p_bar, steam_flow_th = (np.atleast_1d(np.asarray(x, dtype=float)) for x in (p_bar, steam_flow_th))
+        n = np.broadcast_shapes(p_bar.shape, steam_flow_th.shape, np.shape(np.asarray(t_in_c))[1:],
+                                *(np.shape(getattr(pid, name)) for loop in loops for pid in (loop.master, loop.slave)
+                                  if pid is not None for name in ('kp', 'ti_s', 'td_s')))
+        p_bar, steam_flow_th = np.broadcast_to(p_bar, n), np.broadcast_to(steam_flow_th, n)
+        series = lambda x: np.broadcast_to(_time_major(x, n_steps), (n_steps,) + n)
+        t_in = series(t_in_c)
+        setpoints = [series(loop.sh.setpoint_outlet_C if loop.setpoint_c is None else loop.setpoint_c)
+                     if setpoint_c is None or setpoint_c[i] is None else series(setpoint_c[i]) for i, loop in enumerate(loops)]
+        disturbances = [series(0.0 if disturbance_c is None or disturbance_c[i] is None else disturbance_c[i])
+                        for i in range(len(loops))]
+        stages, t_up, flow = [], t_in[0], steam_flow_th
+        for loop, sp, dist in zip(loops, setpoints, disturbances):
+            stage = _Stage(self, loop, dt, p_bar, flow, t_up, sp[0], dist[0], n_steps, record)
+            stages.append(stage)
+            t_up, flow = stage.t_out0, flow + stage.spray0
+        for i in range(n_steps):
+            t_up = t_in[i]
+            for stage, sp, dist in zip(stages, setpoints, disturbances):
+                t_up = stage.step(i, t_up, sp[i], dist[i])
+        return [stage.result() for stage in stages]
+
+
+def _time_major(x, n_steps: int) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    return x[:, None] if x.ndim == 1 and x.shape[0] == n_steps else x
+
+
+class _Stage:
+    """Per-loop plant/controller state for ClosedLoopSimulator.run."""
+
+    def __init__(self, sim: ClosedLoopSimulator, loop: SprayLoop, dt, p_bar, flow_th, t_up0, sp0, dist0,
+                 n_steps: int, record: bool):
+        sh, att = loop.sh, sim.attemperator
+        self.loop, self.sim, self.dt, self.p_bar, self.flow_th = loop, sim, dt, p_bar, flow_th
+        # Attemperator around the initial inlet: T_att = T_ref + (m cp (T_up - T_ref) + w (h_w - h_ref)) / ((m + w) cp)
+        self.t_ref = np.broadcast_to(t_up0, p_bar.shape).copy()
+        self.h_ref, self.cp, _ = (np.asarray(x) for x in att.backend.props_pt(p_bar, self.t_ref))
+        self.h_w = att.spray_enthalpy(p_bar, np.full(p_bar.shape, loop.t_spray_c))
+        self.t_sat, _ = att.saturation(p_bar)
+        # Initial spray for steady state at the setpoint (0 if the steam is already colder)
+        target = np.maximum(sh.setpoint_inlet_C + (sp0 - sh.setpoint_outlet_C) / loop.k - dist0, self.t_sat + 1.0)
+        w0 = flow_th * self.cp * (self.t_ref - target) / (self.h_ref + self.cp * (target - self.t_ref) - self.h_w)
+        loop.valve.reset(100.0 * np.clip(w0, 0, None) / np.asarray(loop.valve.max_flow_th, dtype=float))
+        self.spray0 = loop.valve.flow_th()
+        t_att0 = self.mix(self.t_ref, self.spray0)
+        props = sh.calculate_properties_batch(p_bar, np.full(p_bar.shape, float(sh.setpoint_inlet_C)), flow_th + self.spray0)
+        self.a, self.b0, self.b1, self.d = fopdt_discretise_batch(dt, loop.k, props['theta_s'], props['tau_s'])
+        self.theta_s, self.tau_s = props['theta_s'], props['tau_s']
+        u0 = t_att0 - sh.setpoint_inlet_C + dist0
+        self.y = loop.k * u0
+        self.buffer = np.broadcast_to(u0, (int(self.d.max()) + 2,) + p_bar.shape).copy()  # Dead-time ring
+        self.cols = np.arange(p_bar.size).reshape(p_bar.shape)
+        self.t_out0 = sh.setpoint_outlet_C + self.y
+        self.meas_out, self.meas_att = self.t_out0.copy(), t_att0.copy()
+        self.sensor = 1 - np.exp(-dt / loop.sensor_tau_s) if loop.sensor_tau_s > 0 else 1.0
+        if loop.slave is None:
+            loop.master.reset(dt, self.meas_out, loop.valve.position_pct, sp0)
+        else:
+            loop.master.reset(dt, self.meas_out, t_att0, sp0)
+            loop.slave.reset(dt, self.meas_att, loop.valve.position_pct, t_att0)
+        self.ise = np.zeros(p_bar.shape)
+        self.iae = np.zeros(p_bar.shape)
+        self.max_error = np.zeros(p_bar.shape)
+        self.overshoot = np.full(p_bar.shape, -np.inf)
+        self.travel = np.zeros(p_bar.shape)
+        self.trace = {key: np.empty((n_steps,) + p_bar.shape) for key in
+                      ('outlet_c', 'attemperator_c', 'valve_pct', 'spray_th')} if record else None
+
+    def mix(self, t_up, spray_th):
+        if self.sim.exact_mixing:
+            return self.sim.attemperator.outlet(self.p_bar, t_up, self.flow_th, spray_th, self.loop.t_spray_c)[0]
+        m = self.flow_th
+        t_att = self.t_ref + (m * self.cp * (t_up - self.t_ref) + spray_th * (self.h_w - self.h_ref)) / ((m + spray_th) * self.cp)
+        return np.maximum(t_att, self.t_sat)
+
+    def step(self, i: int, t_up, sp, dist) -> np.ndarray:
+        """Sample i: controllers on lagged measurements, valve, mixing, stage dynamics. Returns T_out."""
+        loop, sh = self.loop, self.loop.sh
+        t_out = sh.setpoint_outlet_C + self.y
+        position = loop.valve.position_pct
+        if loop.slave is None:
+            command = loop.master.step(sp, self.meas_out, track=position)
+        else:
+            t_att_sp = loop.master.step(sp, self.meas_out, freeze=loop.slave.saturated())
+            command = loop.slave.step(t_att_sp, self.meas_att, track=position)
+        spray = loop.valve.step(command, self.dt)
+        t_att = self.mix(t_up, spray)
+        slot = i % self.buffer.shape[0]
+        self.buffer[slot] = t_att - sh.setpoint_inlet_C + dist
+        size = self.buffer.shape[0]
+        self.y = (self.a * self.y + self.b0 * self.buffer[(i - self.d) % size, self.cols]
+                  + self.b1 * self.buffer[(i - self.d - 1) % size, self.cols])
+        self.meas_out = self.meas_out + self.sensor * (t_out - self.meas_out)
+        self.meas_att = self.meas_att + self.sensor * (t_att - self.meas_att)
+        error = t_out - sp
+        self.ise += error ** 2 * self.dt
+        self.iae += np.abs(error) * self.dt
+        np.maximum(self.max_error, np.abs(error), out=self.max_error)
+        np.maximum(self.overshoot, error, out=self.overshoot)
+        self.travel += np.abs(loop.valve.position_pct - position)
+        if self.trace is not None:
+            for key, value in (('outlet_c', t_out), ('attemperator_c', t_att), ('valve_pct', loop.valve.position_pct),
+                               ('spray_th', spray)):
+                self.trace[key][i] = value
+        return t_out
+
+    def result(self) -> Dict[str, np.ndarray]:
+        out = {'ise': self.ise, 'iae': self.iae, 'max_error_c': self.max_error,
+               'overshoot_c': np.maximum(self.overshoot, 0.0), 'valve_travel_pct': self.travel,
+               'theta_s': self.theta_s, 'tau_s': self.tau_s}
+        if self.trace is not None:
+            out.update(self.trace)
+        return out
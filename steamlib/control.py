@@ -0,0 +1,79 @@
+# steamlib/control.py
+# Discrete PID controller and spray valve for the attemperator loops (SP1/SP2).
+# Every gain/limit may be an array: one element per simulated scenario.
+
+from dataclasses import dataclass
+import numpy as np
+from typing import Optional
+
+
+@dataclass
+class PID:
+    """ISA PID for a batch of loops: u = kp * (e + 1/ti ∫e dt + td de/dt), e = sp - pv.
+
+    Derivative acts on the measurement (no setpoint kick) with a first-order
+    filter td/n_filter; back-calculation anti-windup with tracking time
+    tt_s (default sqrt(ti*td), or ti for PI). Loops driving the spray valve
+    are direct acting (more spray, lower temperature), i.e. kp < 0; a
+    cascade master setting the attemperator outlet setpoint has kp > 0.
+    """
+    kp: object = 1.0
+    ti_s: object = np.inf  # inf: no integral action
+    td_s: object = 0.0
+    u_min: object = -np.inf
+    u_max: object = np.inf
+    n_filter: float = 10.0
+    tt_s: object = None
+
+    def reset(self, dt: float, pv, u, sp=None):
+        """Bumpless start: output u with the current pv/sp (arrays broadcast to the batch)."""
+        kp, ti, td = (np.asarray(x, dtype=float) for x in (self.kp, self.ti_s, self.td_s))
+        tt = np.asarray(np.where(td > 0, np.sqrt(ti * td), ti) if self.tt_s is None else self.tt_s, dtype=float)
+        tf = td / self.n_filter
+        self._ki = kp * dt / ti
+        self._kt = np.where(np.isfinite(ti), dt / tt, 0.0)  # No integrator, nothing to wind up
+        self._ad = tf / (tf + dt)
+        self._bd = kp * td / (tf + dt)
+        pv = np.asarray(pv, dtype=float)
+        sp = pv if sp is None else np.asarray(sp, dtype=float)
+        self._pv = pv
+        self._d = np.zeros_like(pv)
+        self._i = np.asarray(u, dtype=float) - kp * (sp - pv)
+        self.u = np.clip(np.asarray(u, dtype=float), self.u_min, self.u_max)
+
+    def step(self, sp, pv, freeze: Optional[np.ndarray] = None, track: Optional[np.ndarray] = None) -> np.ndarray:
+        """One sample. freeze: hold the integral (e.g. inner loop saturated); track: output
+        actually applied downstream (e.g. rate-limited valve) for the back-calculation."""
+        e = sp - pv
+        self._d = self._ad * self._d - self._bd * (pv - self._pv)
+        self._pv = pv
+        v = self.kp * e + self._i + self._d
+        self.u = np.clip(v, self.u_min, self.u_max)
+        windup = self._kt * ((self.u if track is None else track) - v)
+        integral = self._ki * e if freeze is None else np.where(freeze, 0.0, self._ki * e)
+        self._i = self._i + integral + windup
+        return self.u
+
+    def saturated(self) -> np.ndarray:
+        """Output at a limit after the last step."""
+        return (self.u <= self.u_min) | (self.u >= self.u_max)
+
+
+@dataclass
+class SprayValve:
+    """Spray control valve: linear characteristic, optional stroke rate limit."""
+    max_flow_th: object = 40.0  # At 100 % open
+    rate_pct_s: object = np.inf  # Max stroke speed
+
+    def reset(self, position_pct):
+        self.position_pct = np.clip(np.asarray(position_pct, dtype=float), 0.0, 100.0)
+
+    def step(self, command_pct, dt: float) -> np.ndarray:
+        """Move towards the command; returns spray flow [t/h]."""
+        max_move = np.asarray(self.rate_pct_s, dtype=float) * dt
+        move = np.clip(np.clip(command_pct, 0.0, 100.0) - self.position_pct, -max_move, max_move)
+        self.position_pct = self.position_pct + move
+        return self.flow_th()
+
+    def flow_th(self) -> np.ndarray:
+        return self.position_pct / 100.0 * np.asarray(self.max_flow_th, dtype=float)
@@ -0,0 +1,73 @@
+# steamlib/convolution.py
+# Convolution engine for the linear FOPDT superheater models (platen/final chain).
+# Impulse responses precomputed from θ/τ, applied direct or by overlap-add FFT.
+
+import math
+import numpy as np
+from scipy.signal import lfilter, oaconvolve
+from typing import Dict, Optional
+from steamlib.discretisation import shared_discretisation_cache
+from steamlib.fopdt import fopdt_step
+
+# Measured crossover of the direct lfilter path vs overlap-add FFT: lfilter wins up to ~128 taps
+# on long or batched signals (1e5 samples, 100 x 1e4, 1000 x 2000); FFT is ahead from ~160.
+DIRECT_MAX_TAPS = 128
+
+
+def fopdt_impulse_response(dt: float, k: float, theta_s: float, tau_s: float, tol: float = 1e-9) -> np.ndarray:
+    """ZOH impulse response h with y[n] = sum_j h[j] u[n-j]; tail truncated below k*tol."""
+    tail_s = tau_s * math.log(1 / tol) if tau_s > 0 else 0.0
+    n_taps = int(math.ceil((theta_s + tail_s) / dt)) + 2
+    return np.diff(fopdt_step(np.arange(n_taps) * dt, k, theta_s, tau_s), prepend=0.0)
+
+
+def choose_method(n_samples: int, n_taps: int) -> str:
+    """'direct' when either operand is short, else 'fft' (overlap-add)."""
+    return 'direct' if min(n_samples, n_taps) <= DIRECT_MAX_TAPS else 'fft'
+
+
+class ConvolutionEngine:
+    """Linear time-invariant response via a precomputed impulse response."""
+
+    def __init__(self, impulse_response: np.ndarray, dt: float):
+        self.impulse_response = np.asarray(impulse_response, dtype=float)
+        self.dt = dt
+        self.gain = float(self.impulse_response.sum())  # Steady-state gain
+
+    @classmethod
+    def from_fopdt(cls, dt: float, k: float, theta_s: float, tau_s: float, tol: float = 1e-9) -> 'ConvolutionEngine':
+        """Impulse response shared through the discretisation cache (read-only array)."""
+        response = shared_discretisation_cache().get('fopdt_impulse', (float(k), float(theta_s), float(tau_s), tol), dt,
+                                                     lambda: fopdt_impulse_response(dt, k, theta_s, tau_s, tol))
+        return cls(response, dt)
+
+    @classmethod
+    def from_properties(cls, dt: float, k: float, props: Dict, tol: float = 1e-9) -> 'ConvolutionEngine':
+        """Engine from a calculate_properties() result (uses theta_s/tau_s)."""
+        return cls.from_fopdt(dt, k, float(props['theta_s']), float(props['tau_s']), tol)
+
+    def then(self, downstream: 'ConvolutionEngine') -> 'ConvolutionEngine':
+        """Series composition (e.g. platen -> final); intermediate signal treated as sampled,
+        so the chain is accurate for dt well below the smaller τ."""
+        if not math.isclose(self.dt, downstream.dt):
+            raise ValueError(f"dt mismatch: {self.dt} vs {downstream.dt}")
+        return ConvolutionEngine(np.convolve(self.impulse_response, downstream.impulse_response), self.dt)
+
+    def apply(self, u, u_initial: float = 0.0, method: Optional[str] = None) -> np.ndarray:
+        """Response to input signals along the last axis (batched over leading axes).
+
+        The process starts at steady state for `u_initial`; `method` is
+        'direct', 'fft' or None for the length-based crossover.
+        """
+        u = np.asarray(u, dtype=float)
+        n = u.shape[-1]
+        h = self.impulse_response[:n]  # Taps beyond the signal never contribute
+        method = method or choose_method(n, h.size)
+        du = u - u_initial
+        if method == 'direct':
+            y = lfilter(h, [1.0], du, axis=-1)  # FIR over all signals in one call
+        elif method == 'fft':
+            y = oaconvolve(du, h.reshape((1,) * (u.ndim - 1) + (-1,)), mode='full', axes=-1)[..., :n]
+        else:
+            raise ValueError(f"unknown method {method!r}")
+        return y + self.gain * u_initial
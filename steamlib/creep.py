@@ -0,0 +1,126 @@
+# steamlib/creep.py
+# Creep-life consumption (Larson-Miller + Robinson life-fraction rule) per tube and section.
+# Streams historian/simulation chunks in constant memory; checkpoint/resume via .npz.
+
+import os
+import zipfile
+import numpy as np
+from typing import Dict, List, Optional
+from steamlib.files import atomic_write
+from steamlib.materials import material
+
+CHECKPOINT_FIELDS = ('life_fraction', 'peak_metal_c', 'hours', 'last_time_s', 'samples', 'section_names', 'tube_mm')
+
+
+def hoop_stress_mpa(p_bar, tube_od_mm: float, tube_id_mm: float):
+    """Mean-diameter hoop stress sigma = p * (D_o - t) / (2 t)."""
+    wall_mm = (tube_od_mm - tube_id_mm) / 2
+    return np.asarray(p_bar, dtype=float) / 10 * (tube_od_mm - wall_mm) / (2 * wall_mm)
+
+
+def rupture_time_h(metal_c, stress_mpa, lmp_a, lmp_b, lmp_c):
+    """Larson-Miller rupture time t_r [h] at metal temperature and stress."""
+    lmp = lmp_a - lmp_b * np.log10(stress_mpa)
+    return 10.0 ** (lmp / (np.asarray(metal_c, dtype=float) + 273.15) - lmp_c)
+
+
+class CreepLifeAccumulator:
+    """Robinson sum of dt / t_r per (tube, section), fed chunk by chunk.
+
+    update() ignores samples at or before the last processed time, so a
+    restarted job can replay its chunk source from a checkpoint safely.
+    """
+
+    def __init__(self, sections: List[Dict], tube_od_mm: float, tube_id_mm: float, n_tubes: int = 1):
+        self.section_names = [s['name'] for s in sections]
+        rows = [material(s['material']) for s in sections]
+        self.lmp_a = np.array([r['lmp_a'] for r in rows])
+        self.lmp_b = np.array([r['lmp_b'] for r in rows])
+        self.lmp_c = np.array([r['lmp_c'] for r in rows])
+        self.tube_od_mm, self.tube_id_mm = tube_od_mm, tube_id_mm
+        self.n_tubes = n_tubes
+        self.life_fraction = np.zeros((n_tubes, len(sections)))
+        self.peak_metal_c = np.full((n_tubes, len(sections)), -np.inf)
+        self.hours = 0.0
+        self.last_time_s = -np.inf
+        self.samples = 0
+
+    def update(self, t_s, section_metal_c, p_bar) -> np.ndarray:
+        """Add one chunk: t_s (n,), metal (n, n_tubes, n_sections) or (n, n_sections), p_bar (n,) or scalar."""
+        t_s = np.asarray(t_s, dtype=float)
+        new = t_s > self.last_time_s
+        if not new.any():
+            return self.life_fraction
+        t_s = t_s[new]
+        metal_c = np.asarray(section_metal_c, dtype=float)[new]
+        if metal_c.ndim == 2:
+            metal_c = metal_c[:, None, :]
+        p_bar = np.broadcast_to(np.asarray(p_bar, dtype=float), new.shape)[new]
+        previous = t_s[0] if np.isinf(self.last_time_s) else self.last_time_s
+        dt_h = np.diff(t_s, prepend=previous) / 3600  # Each sample held over the interval before it
+        stress = hoop_stress_mpa(p_bar, self.tube_od_mm, self.tube_id_mm)[:, None, None]
+        lmp = self.lmp_a - self.lmp_b * np.log10(stress)  # (n, 1, n_sections)
+        rate = metal_c + 273.15  # 1 / t_r = 10^(C - LMP / T_K), computed in place
+        np.divide(lmp, rate, out=rate)
+        np.subtract(self.lmp_c, rate, out=rate)
+        np.multiply(rate, np.log(10.0), out=rate)
+        np.exp(rate, out=rate)
+        self.life_fraction += np.tensordot(dt_h, rate, axes=(0, 0))
+        np.maximum(self.peak_metal_c, metal_c.max(axis=0), out=self.peak_metal_c)
+        self.hours += float(dt_h.sum())
+        self.last_time_s = float(t_s[-1])
+        self.samples += t_s.size
+        return self.life_fraction
+
+    def consume(self, chunks, checkpoint_path: Optional[str] = None, checkpoint_every: int = 1) -> np.ndarray:
+        """Fold an iterable of (t_s, section_metal_c, p_bar) chunks, checkpointing as it goes."""
+        for i, (t_s, metal_c, p_bar) in enumerate(chunks, 1):
+            self.update(t_s, metal_c, p_bar)
+            if checkpoint_path and i % checkpoint_every == 0:
+                self.save(checkpoint_path)
+        if checkpoint_path:
+            self.save(checkpoint_path)
+        return self.life_fraction
+
+    def summary(self) -> Dict[str, np.ndarray]:
+        """Worst tube per section and the projected life at the average consumption rate."""
+        rate_per_h = self.life_fraction / self.hours if self.hours > 0 else np.zeros_like(self.life_fraction)
+        with np.errstate(divide='ignore'):
+            remaining_h = np.where(rate_per_h > 0, (1 - self.life_fraction) / rate_per_h, np.inf)
+        return {'max_life_fraction': self.life_fraction.max(axis=0),
+                'worst_tube': self.life_fraction.argmax(axis=0),
+                'min_remaining_h': remaining_h.min(axis=0), 'hours': self.hours}
+
+    def save(self, path: str):
+        """Atomic checkpoint (state + the configuration it belongs to)."""
+        with atomic_write(path) as f:
+            np.savez(f, life_fraction=self.life_fraction, peak_metal_c=self.peak_metal_c,
+                     hours=self.hours, last_time_s=self.last_time_s, samples=self.samples,
+                     section_names=np.array(self.section_names), tube_mm=[self.tube_od_mm, self.tube_id_mm])
+
+    def restore(self, path: str, missing_ok: bool = False) -> bool:
+        """Resume from a checkpoint; True when state was loaded.
+
+        A missing file raises FileNotFoundError unless missing_ok (then False:
+        start fresh); an unreadable or incomplete file raises ValueError, as
+        does one written for another section layout or tube size.
+        """
+        if missing_ok and not os.path.exists(path):
+            return False
+        try:
+            with np.load(path) as data:
+                state = {key: data[key] for key in CHECKPOINT_FIELDS}
+        except FileNotFoundError:
+            raise
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            raise ValueError(f"checkpoint {path} is corrupt: {e}") from e
+        if list(state['section_names']) != self.section_names or state['life_fraction'].shape != self.life_fraction.shape:
+            raise ValueError(f"checkpoint {path} belongs to a different tube/section layout")
+        if not np.allclose(state['tube_mm'], [self.tube_od_mm, self.tube_id_mm]):
+            raise ValueError(f"checkpoint {path} was written for different tube dimensions")
+        self.life_fraction = state['life_fraction'].copy()
+        self.peak_metal_c = state['peak_metal_c'].copy()
+        self.hours = float(state['hours'])
+        self.last_time_s = float(state['last_time_s'])
+        self.samples = int(state['samples'])
+        return True
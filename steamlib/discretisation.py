@@ -0,0 +1,79 @@
+# steamlib/discretisation.py
+# Bounded cache of discretised dynamics keyed by (model parameters, dt).
+# Sweeps revisit a few load points; their FOPDT impulse responses, lag-chain transfer
+# functions and distributed-model transition matrices are computed once.
+
+import hashlib
+import threading
+import numpy as np
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from steamlib.cache import LRUCache
+
+
+class DiscretisationCache:
+    """LRU of discretisations; key = (kind, parameters, dt) with exact float parameters.
+
+    Bounded by entry count and by the total nbytes of the cached arrays
+    (distributed-model transition matrices are dense, 2n x 2n per path).
+    """
+
+    def __init__(self, maxsize: int = 256, max_bytes: int = 32 * 2**20):
+        self._cache = LRUCache(maxsize, max_bytes, _nbytes)
+
+    def get(self, kind: str, params: Tuple, dt: float, compute: Callable[[], Any]) -> Any:
+        """Cached compute(); arrays in the result are made read-only since callers share them."""
+        return self._cache.get_or_compute((kind, params, float(dt)), lambda: _freeze(compute()))
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+
+def array_key(*arrays) -> Hashable:
+    """Content key for array-valued parameters (digest of dtype, shape and bytes)."""
+    digest = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _nbytes(value) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple):
+        return sum(_nbytes(item) for item in value)
+    return 0
+
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, tuple):
+        for item in value:
+            _freeze(item)
+    return value
+
+
+_shared_cache: Optional[DiscretisationCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_discretisation_cache() -> DiscretisationCache:
+    """Process-wide default cache, created on first use."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = DiscretisationCache()
+    return _shared_cache
+
+
+def set_shared_discretisation_cache(cache: Optional[DiscretisationCache]):
+    """Swap the process-wide cache (e.g. a larger one for big sweeps); None resets to the default."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = cache
@@ -0,0 +1,228 @@
+# steamlib/distributed.py
+# Distributed-parameter (1-D finite-volume) superheater tube along the YAML `sections`.
+# States per cell: steam enthalpy + tube metal temperature; implicit BDF with sparse Jacobian.
+
+import math
+from dataclasses import dataclass
+import numpy as np
+import scipy.sparse as sp
+from scipy.integrate import solve_ivp
+from scipy.linalg import expm
+from scipy.sparse.linalg import spsolve
+from typing import Dict, Optional, Tuple
+from steamlib.discretisation import array_key, shared_discretisation_cache
+from steamlib.materials import material, metal_limit_report, section_limits_c
+
+
+@dataclass
+class DistributedTubeModel:
+    """Finite-volume tube(s) of a PlatenSuperheater/FinalSuperheater at pressure p_bar.
+
+    Steam: rho*A*dz dh/dt = m (h_in - h) + U*Po*dz (Tm - Ts)
+    Metal: rho_m*c_m*Am*dz dTm/dt = q*Po*dz - U*Po*dz (Tm - Ts)
+    Ts(h) is linearised per cell around a reference profile running from
+    setpoint_inlet_C to setpoint_outlet_C, so the system is linear in the
+    states and the Jacobian is exact: constant plus flow times an upwind band.
+    """
+    sh: object  # PlatenSuperheater / FinalSuperheater
+    p_bar: float
+    cell_length_m: float = 1.0  # Max finite-volume length
+    n_paths: int = 1  # Parallel tubes simulated in one state vector
+
+    def __post_init__(self):
+        sections = self.sh.sections
+        n_per_section = [max(1, math.ceil(s['length_m'] / self.cell_length_m)) for s in sections]
+        self.cell_section = np.repeat(np.arange(len(sections)), n_per_section)
+        self.section_start = np.concatenate([[0], np.cumsum(n_per_section)[:-1]])
+        self.section_limits_c = section_limits_c(sections)
+        self.dz_m = np.repeat([s['length_m'] / n for s, n in zip(sections, n_per_section)], n_per_section)
+        self.n_cells = self.dz_m.size
+        self.z_m = np.cumsum(self.dz_m) - self.dz_m / 2  # Cell centres from the inlet
+        d_i, d_o = self.sh.tube_id_mm / 1000, self.sh.tube_od_mm / 1000
+        self.flow_area_m2 = np.pi * d_i ** 2 / 4
+        self.perimeter_m = np.pi * d_o
+        metal_area_m2 = np.pi * (d_o ** 2 - d_i ** 2) / 4
+        rows = [material(s['material']) for s in sections]
+        rho_m = np.array([r['density_kgm3'] for r in rows])[self.cell_section]
+        cp_m = np.array([r['cp_jkgk'] for r in rows])[self.cell_section]
+        # Reference steam profile for the linearisation Ts = t_ref + (h - h_ref) / cp_ref
+        length_m = self.dz_m.sum()
+        rise_c = self.sh.setpoint_outlet_C - self.sh.setpoint_inlet_C
+        self.t_ref_c = self.sh.setpoint_inlet_C + rise_c * self.z_m / length_m
+        backend = self.sh.property_backend
+        h_kjkg, cp_kjkgk, v_m3kg = backend.props_pt(np.full(self.n_cells, float(self.p_bar)), self.t_ref_c)
+        self.h_ref = np.asarray(h_kjkg) * 1000  # J/kg
+        self.cp_ref = np.asarray(cp_kjkgk) * 1000  # J/kgK
+        h_in_kjkg, cp_in_kjkgk, _ = backend.props_pt(float(self.p_bar), float(self.sh.setpoint_inlet_C))
+        self.h_in_ref, self.cp_in_ref = float(h_in_kjkg) * 1000, float(cp_in_kjkgk) * 1000
+        self.steam_mass_kg = self.flow_area_m2 * self.dz_m / np.asarray(v_m3kg)
+        self.metal_cap_jk = rho_m * cp_m * metal_area_m2 * self.dz_m
+        self.conductance_wk = self.sh.U_W_m2K_low_load * self.perimeter_m * self.dz_m
+        self.surface_m2 = self.perimeter_m * self.dz_m
+        self._assemble()
+
+    def _assemble(self):
+        """Per-path sparse blocks: J(t) = J_const + diag(m_rows(t)) @ J_flow (states [h_i, Tm_i])."""
+        n, ms, cm, g, cp = self.n_cells, self.steam_mass_kg, self.metal_cap_jk, self.conductance_wk, self.cp_ref
+        hi, mi = 2 * np.arange(n), 2 * np.arange(n) + 1
+        rows = np.concatenate([hi, hi, mi, mi])
+        cols = np.concatenate([hi, mi, mi, hi])
+        vals = np.concatenate([-g / (ms * cp), g / ms, -g / cm, g / (cm * cp)])
+        j_const = sp.csr_matrix((vals, (rows, cols)), shape=(2 * n, 2 * n))
+        rows = np.concatenate([hi, hi[1:]])
+        cols = np.concatenate([hi, hi[:-1]])
+        vals = np.concatenate([-1 / ms, 1 / ms[1:]])
+        j_flow = sp.csr_matrix((vals, (rows, cols)), shape=(2 * n, 2 * n))
+        eye = sp.identity(self.n_paths, format='csr')
+        self.j_const = sp.kron(eye, j_const, format='csr')
+        self.j_flow = sp.kron(eye, j_flow, format='csr')
+        offset = self.t_ref_c - self.h_ref / cp  # Ts = offset + h / cp
+        b = np.empty(2 * n)
+        b[hi] = -g * offset / ms
+        b[mi] = g * offset / cm
+        self.b_const = np.tile(b, self.n_paths)
+        self._path_blocks = (j_const.toarray(), j_flow.toarray(), b)  # One path, for discretise()
+        self._discrete_key = array_key(*self._path_blocks, self.surface_m2 / cm,
+                                       [ms[0], self.h_in_ref, self.cp_in_ref, self.sh.setpoint_inlet_C])
+        self.inlet_rows = 2 * n * np.arange(self.n_paths)  # h_0 of each path
+        self.metal_rows = (mi[None, :] + 2 * n * np.arange(self.n_paths)[:, None]).ravel()
+
+    def tube_flow_kgs(self, steam_flow_th) -> np.ndarray:
+        """Per-tube mass flow (uniform split over total_tube_count), broadcast to paths."""
+        m = np.asarray(steam_flow_th, dtype=float) * 1000 / 3600 / self.sh.total_tube_count
+        return np.broadcast_to(m[..., None], m.shape + (self.n_paths,))
+
+    def design_heat_flux(self, steam_flow_th: float) -> float:
+        """Uniform outer heat flux [W/m2] that lifts steam from the inlet to the outlet setpoint."""
+        m = float(steam_flow_th) * 1000 / 3600 / self.sh.total_tube_count
+        h_out = self.h_ref[-1] + self.cp_ref[-1] * (self.sh.setpoint_outlet_C - self.t_ref_c[-1])
+        return m * (h_out - self.h_in_ref) / self.surface_m2.sum()
+
+    def cell_heat_flux(self, heat_flux_wm2) -> np.ndarray:
+        """Scalar, per-section or per-cell flux (optionally per path first) -> (n_paths, n_cells)."""
+        q = np.asarray(heat_flux_wm2, dtype=float)
+        if q.ndim and q.shape[-1] == len(self.sh.sections) and q.shape[-1] != self.n_cells:
+            q = q[..., self.cell_section]
+        return np.broadcast_to(q, (self.n_paths, self.n_cells))
+
+    def _rhs_terms(self, m_paths, t_in_c, q_cells):
+        m_rows = np.repeat(m_paths, 2 * self.n_cells)
+        b = self.b_const.copy()
+        h_in = self.h_in_ref + self.cp_in_ref * (t_in_c - self.sh.setpoint_inlet_C)
+        b[self.inlet_rows] += m_paths * h_in / self.steam_mass_kg[0]
+        b[self.metal_rows] += (q_cells * self.surface_m2 / self.metal_cap_jk).ravel()
+        return m_rows, b
+
+    def steady_state(self, t_in_c: float, steam_flow_th: float, heat_flux_wm2=None) -> np.ndarray:
+        """State vector with all derivatives zero for constant inputs."""
+        if heat_flux_wm2 is None:
+            heat_flux_wm2 = self.design_heat_flux(steam_flow_th)
+        return self._steady_state(self.tube_flow_kgs(steam_flow_th), t_in_c, self.cell_heat_flux(heat_flux_wm2))
+
+    def _steady_state(self, m_paths, t_in_c, q_cells) -> np.ndarray:
+        m_rows, b = self._rhs_terms(m_paths, t_in_c, q_cells)
+        jac = (self.j_const + sp.diags(m_rows) @ self.j_flow).tocsc()
+        return spsolve(jac, -b)
+
+    def simulate(self, t_s, t_in_c, steam_flow_th, heat_flux_wm2=None, heat_flux_scale=1.0,
+                 x0: Optional[np.ndarray] = None, rtol: float = 1e-6, atol: float = 1e-3) -> Dict[str, np.ndarray]:
+        """Integrate over the grid t_s; t_in_c, steam_flow_th and heat_flux_scale are scalars or
+        series on t_s (linear in between). heat_flux_wm2 is the static profile (None: design
+        flux at the initial flow). Starts from steady state unless x0 is given.
+        """
+        t_s = np.asarray(t_s, dtype=float)
+        t_in = np.broadcast_to(np.asarray(t_in_c, dtype=float), t_s.shape)
+        m_paths = np.broadcast_to(self.tube_flow_kgs(steam_flow_th), t_s.shape + (self.n_paths,))
+        scale = np.broadcast_to(np.asarray(heat_flux_scale, dtype=float), t_s.shape)
+        if heat_flux_wm2 is None:
+            heat_flux_wm2 = self.design_heat_flux(m_paths[0].mean() * 3.6 * self.sh.total_tube_count)
+        q_cells = self.cell_heat_flux(heat_flux_wm2)
+
+        def inputs(t):
+            i = int(np.clip(np.searchsorted(t_s, t, side='right') - 1, 0, t_s.size - 1))
+            j = min(i + 1, t_s.size - 1)
+            w = 0.0 if j == i else min(max((t - t_s[i]) / (t_s[j] - t_s[i]), 0.0), 1.0)
+            lerp = lambda series: (1 - w) * series[i] + w * series[j]
+            return self._rhs_terms(lerp(m_paths), lerp(t_in), lerp(scale) * q_cells)
+
+        def rhs(t, x):
+            m_rows, b = inputs(t)
+            return self.j_const @ x + m_rows * (self.j_flow @ x) + b
+
+        def jac(t, x):
+            m_rows, _ = inputs(t)
+            return (self.j_const + sp.diags(m_rows) @ self.j_flow).tocsc()
+
+        if x0 is None:
+            x0 = self._steady_state(m_paths[0], t_in[0], scale[0] * q_cells)
+        sol = solve_ivp(rhs, (t_s[0], t_s[-1]), x0, method='BDF', t_eval=t_s, jac=jac, rtol=rtol, atol=atol)
+        if not sol.success:
+            raise RuntimeError(f"distributed tube integration failed: {sol.message}")
+        return self.unpack(sol.y.T, t_s)
+
+    def discretise(self, dt: float, steam_flow_th: float, heat_flux_wm2=None) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact ZOH at constant flow: x[n+1] = phi @ x[n] + gamma @ [1, t_in_c, heat_flux_scale].
+
+        Returns phi (n_paths, 2n, 2n) and gamma (n_paths, 2n, 3); each path's
+        augmented expm goes through the shared discretisation cache (bounded by
+        bytes), keyed by the model's matrices, the path flow and flux profile, and dt.
+        """
+        m_paths = self.tube_flow_kgs(steam_flow_th)
+        if heat_flux_wm2 is None:
+            heat_flux_wm2 = self.design_heat_flux(steam_flow_th)
+        q_cells = self.cell_heat_flux(heat_flux_wm2)
+        cache = shared_discretisation_cache()
+        blocks = [cache.get('distributed', (self._discrete_key, float(m), array_key(q)), dt,
+                            lambda m=m, q=q: self._discretise_path(dt, m, q))
+                  for m, q in zip(m_paths.tolist(), q_cells)]
+        return np.stack([phi for phi, _ in blocks]), np.stack([gamma for _, gamma in blocks])
+
+    def _discretise_path(self, dt: float, m: float, q_cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        j_const, j_flow, b = self._path_blocks
+        n = b.size
+        aug = np.zeros((n + 3, n + 3))
+        aug[:n, :n] = j_const + m * j_flow  # Upwind rows already carry the per-cell 1/ms
+        aug[:n, n] = b
+        aug[0, n] += m * (self.h_in_ref - self.cp_in_ref * self.sh.setpoint_inlet_C) / self.steam_mass_kg[0]
+        aug[0, n + 1] = m * self.cp_in_ref / self.steam_mass_kg[0]
+        aug[1:n:2, n + 2] = q_cells * self.surface_m2 / self.metal_cap_jk
+        e = expm(aug * dt)
+        return e[:n, :n], e[:n, n:]
+
+    def simulate_discrete(self, dt: float, n_steps: int, t_in_c, steam_flow_th: float, heat_flux_wm2=None,
+                          heat_flux_scale=1.0, x0: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Fixed-step alternative to simulate() at constant flow: t_in_c and heat_flux_scale are
+        scalars or n_steps values held over each interval (ZOH). Repeated runs at the same load
+        point and dt reuse the cached discretisation, so each costs only the recursion.
+        """
+        t_in = np.broadcast_to(np.asarray(t_in_c, dtype=float), (n_steps,))
+        scale = np.broadcast_to(np.asarray(heat_flux_scale, dtype=float), (n_steps,))
+        if heat_flux_wm2 is None:
+            heat_flux_wm2 = self.design_heat_flux(steam_flow_th)
+        phi, gamma = self.discretise(dt, steam_flow_th, heat_flux_wm2)
+        if x0 is None:
+            x0 = self.steady_state(t_in[0] if n_steps else float(np.asarray(t_in_c)), steam_flow_th,
+                                   self.cell_heat_flux(heat_flux_wm2) * (scale[0] if n_steps else 1.0))
+        x = np.empty((n_steps + 1, self.n_paths, phi.shape[1]))
+        x[0] = np.asarray(x0, dtype=float).reshape(self.n_paths, -1)
+        forced = gamma @ np.stack([np.ones(n_steps), t_in, scale])  # (n_paths, 2n, n_steps)
+        phi_t = phi.transpose(0, 2, 1)
+        for i in range(n_steps):
+            x[i + 1] = np.matmul(x[i][:, None, :], phi_t)[:, 0] + forced[..., i]
+        return self.unpack(x.reshape(n_steps + 1, -1), np.arange(n_steps + 1) * dt)
+
+    def unpack(self, x: np.ndarray, t_s: np.ndarray) -> Dict[str, np.ndarray]:
+        """(n_t, n_states) -> steam/metal fields shaped (n_t, n_paths, n_cells)."""
+        x = x.reshape(x.shape[0], self.n_paths, self.n_cells, 2)
+        h = x[..., 0]
+        steam_c = self.t_ref_c + (h - self.h_ref) / self.cp_ref
+        return {'t_s': t_s, 'h_kjkg': h / 1000, 'steam_c': steam_c, 'metal_c': x[..., 1],
+                'outlet_c': steam_c[..., -1], 'x': x.reshape(x.shape[0], -1)}
+
+    def section_metal_c(self, metal_c) -> np.ndarray:
+        """Hottest cell per section: (..., n_cells) -> (..., n_sections)."""
+        return np.maximum.reduceat(np.asarray(metal_c), self.section_start, axis=-1)
+
+    def check_metal_limits(self, result: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Per tube/section overtemperature report for a simulate() result (see metal_limit_report)."""
+        return metal_limit_report(self.section_metal_c(result['metal_c']), self.section_limits_c, result['t_s'])
@@ -0,0 +1,26 @@
+# steamlib/files.py
+# Atomic file replacement for the persisted tables and checkpoints (IF97 grid, creep state).
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path: str):
+    """Binary file that replaces `path` only once fully written (temp file + os.replace).
+
+    Concurrent readers and a crash mid-write never see a partial file; on
+    error the temp file is removed and `path` is left untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(tmp_path, 0o644)  # mkstemp defaults to owner-only
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -3,13 +3,15 @@
 # Focus: Final temp control (post-SP2) to 540°C.
 
 import yaml
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
-from pyXSteam.XSteam import XSteam
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional, Tuple
+from steamlib.fopdt import fopdt_step
+from steamlib.steam_properties import CachedBackend, PropertyBackend, shared_property_backend, tube_geometry
+from steamlib.superheater import SuperheaterModels
 
 @dataclass
-class FinalSuperheater:
+class FinalSuperheater(SuperheaterModels):
     """Final SH class: Geometry from YAML, dynamic calcs."""
     config_file: str = "config/final_superheater.yaml"
     n_coils: int = 43
@@ -22,13 +24,22 @@ class FinalSuperheater:
     U_W_m2K_low_load: float = 900.0
     setpoint_inlet_C: float = 410.0
     setpoint_outlet_C: float = 540.0
+    property_backend: Optional[PropertyBackend] = field(default=None, repr=False, compare=False)  # None: shared XSteam; or GridBackend()
+    property_cache_size: int = 0  # LRU entries in front of the backend, 0 = off
+    property_cache_quantum: Tuple[float, float] = (0.01, 0.01)  # Key resolution (bar, °C)
+    default_gain: ClassVar[float] = 0.7  # Convective stage temperature gain
+    bank_attribute: ClassVar[str] = 'n_coils'
 
     def __post_init__(self):
         self.load_yaml()
+        if self.property_backend is None:
+            self.property_backend = shared_property_backend()
+        if self.property_cache_size > 0:
+            self.property_backend = CachedBackend(self.property_backend, self.property_cache_size,
+                                                  *self.property_cache_quantum)
         self.total_tube_count = self.n_coils * self.tubes_per_coil  # 172
-        self.cross_section_m2 = np.pi * (self.tube_id_mm / 2000) ** 2
-        self.a_total_m2 = self.total_tube_count * self.cross_section_m2
-        self.outer_surface_m2 = np.pi * (self.tube_od_mm / 1000) * self.total_length_m * self.total_tube_count
+        self.cross_section_m2, self.a_total_m2, self.outer_surface_m2 = tube_geometry(  # Per tube, total, total
+            self.total_tube_count, self.tube_id_mm, self.tube_od_mm, self.total_length_m)
 
     def load_yaml(self):
         """Load specs from YAML."""
@@ -47,31 +58,12 @@ class FinalSuperheater:
 
     def calculate_properties(self, p_bar: float, t_c: float, steam_flow_th: float) -> Dict:
         """Dynamic: rho, Cp, v, θ, τ."""
-        steam = XSteam()
-        p_mpa = p_bar / 10.0
-        h_kjkg = steam.t_ph(t_c, p_mpa)
-        cp_kjkgk = steam.Cp_pt(p_mpa, t_c)
-        rho_kgm3 = 1 / steam.t_pv(t_c, p_mpa)
-        m_kgs = steam_flow_th * 1000 / 3600
-        v_ms = m_kgs / (rho_kgm3 * self.a_total_m2)
-        theta_s = self.total_length_m / v_ms
-        v_total_m3 = self.a_total_m2 * self.total_length_m
-        m_kg = rho_kgm3 * v_total_m3
-        c_th_jk = m_kg * (cp_kjkgk * 1000)
-        ua_wk = self.U_W_m2K_low_load * self.outer_surface_m2
-        tau_s = c_th_jk / ua_wk
-        return {
-            'rho': rho_kgm3, 'cp': cp_kjkgk, 'v': v_ms, 'theta_s': theta_s, 'tau_s': tau_s,
-            'h': h_kjkg, 'm_kg': m_kg, 'c_th_jk': c_th_jk, 'ua_wk': ua_wk
-        }
+        h_kjkg, cp_kjkgk, v_m3kg = self.property_backend.props_pt(p_bar, t_c)
+        return self._lumped_properties(h_kjkg, cp_kjkgk, 1 / v_m3kg, steam_flow_th)
 
     def fopdt_step_response(self, t: np.ndarray, k: float = 0.7, theta_s: float = 0, tau_s: float = 0) -> np.ndarray:
         """FOPDT for Final (higher gain 0.7 convective)."""
-        y = np.zeros_like(t)
-        for i, ti in enumerate(t):
-            if ti > theta_s:
-                y[i] = k * (1 - np.exp(-(ti - theta_s) / tau_s))
-        return y
+        return fopdt_step(t, k, theta_s, tau_s)  # Vectorized; tau_s == 0 is a pure delay
 
 # Test
 if __name__ == "__main__":
@@ -0,0 +1,184 @@
+# steamlib/fopdt.py
+# First-order-plus-dead-time (FOPDT) responses shared by the superheater models.
+
+import math
+from typing import Dict, Optional, Tuple
+import numpy as np
+from scipy.signal import lfilter
+
+
+def fopdt_step(t, k: float = 1.0, theta_s: float = 0.0, tau_s: float = 0.0) -> np.ndarray:
+    """Unit-step FOPDT response on any time grid shape; tau_s == 0 gives a pure delay."""
+    t = np.asarray(t)
+    if not np.issubdtype(t.dtype, np.floating):
+        t = t.astype(float)
+    if tau_s <= 0:
+        return np.where(t > theta_s, k, 0).astype(t.dtype)
+    y = t - theta_s  # Single work buffer, everything below is in place
+    np.maximum(y, 0, out=y)
+    np.divide(y, -tau_s, out=y)
+    np.expm1(y, out=y)  # exp(-(t-θ)/τ) - 1, accurate for small t-θ
+    np.multiply(y, -k, out=y)
+    return y
+
+
+def sopdt_step(t, k: float = 1.0, theta_s: float = 0.0, tau1_s: float = 0.0, tau2_s: float = 0.0) -> np.ndarray:
+    """Unit-step SOPDT k e^{-θs} / ((τ1 s + 1)(τ2 s + 1)) in closed form on any time grid shape."""
+    tau1_s, tau2_s = max(tau1_s, tau2_s), min(tau1_s, tau2_s)
+    if tau2_s <= 0:
+        return fopdt_step(t, k, theta_s, tau1_s)
+    t = np.asarray(t, dtype=float)
+    s = np.maximum(t - theta_s, 0.0)
+    if tau1_s - tau2_s <= 1e-6 * tau1_s:  # Repeated pole
+        return k * (1 - (1 + s / tau1_s) * np.exp(-s / tau1_s))
+    return k * (1 - (tau1_s * np.exp(-s / tau1_s) - tau2_s * np.exp(-s / tau2_s)) / (tau1_s - tau2_s))
+
+
+def fopdt_step_chunks(t, k, theta_s, tau_s, dtype=np.float64, max_chunk_bytes: int = 64 * 2**20):
+    """Yield (row slice, block) of the (n_params, n_t) batch response, each block <= max_chunk_bytes."""
+    t = np.asarray(t, dtype=dtype).ravel()
+    k, theta_s, tau_s = (x.astype(dtype) for x in np.broadcast_arrays(
+        np.atleast_1d(np.asarray(k, dtype=float)), np.atleast_1d(np.asarray(theta_s, dtype=float)),
+        np.atleast_1d(np.asarray(tau_s, dtype=float))))
+    rows_per_chunk = max(1, max_chunk_bytes // max(1, t.size * np.dtype(dtype).itemsize))
+    for start in range(0, k.size, rows_per_chunk):
+        rows = slice(start, min(start + rows_per_chunk, k.size))
+        yield rows, _fopdt_step_block(t, k[rows, None], theta_s[rows, None], tau_s[rows, None])
+
+
+def fopdt_step_batch(t, k, theta_s, tau_s, dtype=np.float64, max_chunk_bytes: int = 64 * 2**20) -> np.ndarray:
+    """Unit-step FOPDT for many (k, θ, τ) at once on a shared time vector -> (n_params, n_t)."""
+    out = None
+    for rows, block in fopdt_step_chunks(t, k, theta_s, tau_s, dtype, max_chunk_bytes):
+        if out is None:
+            n_params = np.broadcast(np.atleast_1d(k), np.atleast_1d(theta_s), np.atleast_1d(tau_s)).size
+            out = np.empty((n_params, block.shape[1]), dtype=dtype)
+        out[rows] = block
+    return out
+
+
+def fopdt_discretise(dt: float, k: float, theta_s: float, tau_s: float) -> Tuple[float, float, float, int]:
+    """Exact zero-order-hold FOPDT: y[n+1] = a*y[n] + b0*u[n-d] + b1*u[n-d-1].
+
+    θ = d*dt + δ with 0 <= δ < dt; the fractional part δ splits the input
+    weight between two neighbouring samples (modified z-transform).
+    """
+    d = int(math.floor(theta_s / dt + 1e-9))
+    frac_s = max(theta_s - d * dt, 0.0)
+    if tau_s <= 0:
+        return 0.0, k, 0.0, d  # Pure delay, the τ -> 0 limit
+    a = math.exp(-dt / tau_s)
+    a_frac = math.exp(-(dt - frac_s) / tau_s)
+    return a, k * (1 - a_frac), k * (a_frac - a), d
+
+
+def fopdt_discretise_batch(dt: float, k, theta_s, tau_s) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """fopdt_discretise for arrays of (k, θ, τ) (broadcast); d is an int array."""
+    k, theta_s, tau_s = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (k, theta_s, tau_s)))
+    d = np.floor(theta_s / dt + 1e-9).astype(int)
+    frac_s = np.maximum(theta_s - d * dt, 0.0)
+    lag = tau_s > 0
+    tau = np.where(lag, tau_s, 1.0)
+    a = np.where(lag, np.exp(-dt / tau), 0.0)
+    a_frac = np.where(lag, np.exp(-(dt - frac_s) / tau), 0.0)
+    return a, k * (1 - a_frac), k * (a_frac - a), d
+
+
+def fopdt_simulate(u, dt: float, k: float = 1.0, theta_s: float = 0.0, tau_s: float = 0.0,
+                   u_initial: float = 0.0) -> np.ndarray:
+    """FOPDT response to an arbitrary ZOH input sequence (last axis), O(1) work per sample.
+
+    The process starts at steady state for the input level `u_initial`.
+    """
+    u = np.asarray(u, dtype=float)
+    a, b0, b1, d = fopdt_discretise(dt, k, theta_s, tau_s)
+    history = np.full(u.shape[:-1] + (d + 1,), float(u_initial))  # Dead-time line before t = 0
+    n = u.shape[-1]
+    delayed = np.concatenate([history, u[..., :max(n - d, 0)]], axis=-1)[..., :n + 1]  # u[n-d-1], n = 0..N-1
+    x = b0 * delayed[..., 1:] + b1 * delayed[..., :-1]
+    y0 = k * u_initial
+    w, _ = lfilter([1.0], [1.0, -a], x, axis=-1, zi=np.full(u.shape[:-1] + (1,), a * y0))  # w[n] = y[n+1]
+    return np.concatenate([np.full(u.shape[:-1] + (1,), y0), w[..., :-1]], axis=-1)
+
+
+def sopdt_simulate(u, dt: float, k: float = 1.0, theta_s: float = 0.0, tau1_s: float = 0.0, tau2_s: float = 0.0,
+                   u_initial: float = 0.0) -> np.ndarray:
+    """SOPDT k e^{-θs} / ((τ1 s + 1)(τ2 s + 1)) response, exact ZOH.
+
+    Partial fractions split it into two FOPDT lags sharing the dead time;
+    a repeated pole is separated by 1e-5 relative (response error ~1e-5).
+    """
+    tau1_s, tau2_s = max(tau1_s, tau2_s), min(tau1_s, tau2_s)
+    if tau2_s <= 0:
+        return fopdt_simulate(u, dt, k, theta_s, tau1_s, u_initial)
+    tau2_s = min(tau2_s, tau1_s * (1 - 1e-5))
+    c1 = tau1_s / (tau1_s - tau2_s)
+    return (fopdt_simulate(u, dt, k * c1, theta_s, tau1_s, u_initial)
+            + fopdt_simulate(u, dt, k * (1 - c1), theta_s, tau2_s, u_initial))
+
+
+class FopdtStream:
+    """Streaming FOPDT for live data: O(1) time and memory per sample.
+
+    Same exact ZOH update as fopdt_simulate, with the dead time held in a
+    ring buffer. step(u) ingests the input for the current interval and
+    returns the predicted output at the end of it.
+    """
+    __slots__ = ('dt', 'k', 'theta_s', 'tau_s', 'y', '_a', '_b0', '_b1', '_d', '_buffer', '_head')
+
+    def __init__(self, dt: float, k: float = 1.0, theta_s: float = 0.0, tau_s: float = 0.0,
+                 u_initial: float = 0.0, max_theta_s: Optional[float] = None):
+        self.dt = dt
+        self.y = k * u_initial  # Steady state for u_initial
+        capacity = int(math.ceil(max(theta_s, max_theta_s or 0.0) / dt)) + 2
+        self._buffer = [float(u_initial)] * capacity
+        self._head = 0  # Index of the newest input
+        self.k, self.theta_s, self.tau_s = k, theta_s, tau_s
+        self.set_parameters()
+
+    def set_parameters(self, k: Optional[float] = None, theta_s: Optional[float] = None,
+                       tau_s: Optional[float] = None):
+        """Change gain/dead time/time constant on the fly; state and input history are kept."""
+        self.k = self.k if k is None else k
+        self.theta_s = self.theta_s if theta_s is None else theta_s
+        self.tau_s = self.tau_s if tau_s is None else tau_s
+        self._a, self._b0, self._b1, self._d = fopdt_discretise(self.dt, self.k, self.theta_s, self.tau_s)
+        if self._d + 2 > len(self._buffer):
+            self._grow(self._d + 2)
+
+    def update_from_properties(self, props: Dict, k: Optional[float] = None):
+        """Track load changes with theta_s/tau_s from calculate_properties()."""
+        self.set_parameters(k, float(props['theta_s']), float(props['tau_s']))
+
+    def step(self, u: float) -> float:
+        buffer, capacity = self._buffer, len(self._buffer)
+        self._head = head = (self._head + 1) % capacity
+        buffer[head] = u
+        self.y = (self._a * self.y + self._b0 * buffer[(head - self._d) % capacity]
+                  + self._b1 * buffer[(head - self._d - 1) % capacity])
+        return self.y
+
+    def step_block(self, u) -> np.ndarray:
+        """Ingest a small block of samples; returns one prediction per sample."""
+        step = self.step
+        return np.array([step(x) for x in np.asarray(u, dtype=float).ravel().tolist()])
+
+    def _grow(self, capacity: int):
+        history = self._buffer[self._head + 1:] + self._buffer[:self._head + 1]  # Oldest first
+        self._buffer = [history[0]] * (capacity - len(history)) + history
+        self._head = capacity - 1
+
+
+def _fopdt_step_block(t, k, theta_s, tau_s) -> np.ndarray:
+    y = np.subtract(t, theta_s)  # (rows, n_t) work buffer, everything below is in place
+    np.maximum(y, 0, out=y)
+    lag = tau_s[:, 0] > 0
+    if lag.any():
+        y_lag = y[lag]
+        np.divide(y_lag, -tau_s[lag], out=y_lag)
+        np.expm1(y_lag, out=y_lag)
+        np.multiply(y_lag, -k[lag], out=y_lag)
+        y[lag] = y_lag
+    if not lag.all():  # τ == 0 rows: pure delay
+        y[~lag] = np.where(y[~lag] > 0, k[~lag], 0)
+    return y
@@ -0,0 +1,108 @@
+# steamlib/gain_schedule.py
+# Load-scheduled controller gains: FOPDT parameters + tuned PI/PID gains on a (steam flow, pressure) grid.
+# Generated in batch offline; the runtime lookup is plain-float bilinear interpolation (microseconds).
+
+from bisect import bisect_right
+from dataclasses import dataclass
+import numpy as np
+from typing import Dict, Sequence, Tuple
+from steamlib.steam_properties import check_superheated
+from steamlib.tuning import imc_pid, simc_pi, tune_pid
+
+FIELDS = ('kc', 'ti_s', 'td_s', 'k', 'theta_s', 'tau_s')
+
+
+@dataclass
+class GainSchedule:
+    """Gains and model parameters on a flow x pressure grid; edges hold outside the grid."""
+    flow_th: np.ndarray  # (n_flow,) ascending
+    p_bar: np.ndarray  # (n_p,) ascending
+    table: np.ndarray  # (n_flow, n_p, len(fields))
+    fields: Tuple[str, ...] = FIELDS
+
+    def __post_init__(self):
+        self.flow_th = np.asarray(self.flow_th, dtype=float)
+        self.p_bar = np.asarray(self.p_bar, dtype=float)
+        self.table = np.asarray(self.table, dtype=float)
+        self.fields = tuple(self.fields)
+        # Plain Python copies for the scalar path (no numpy call overhead per lookup)
+        self._flows, self._ps, self._rows = self.flow_th.tolist(), self.p_bar.tolist(), self.table.tolist()
+
+    @classmethod
+    def generate(cls, sh, flow_th: Sequence[float], p_bar: Sequence[float], t_c=None, k: float = 0.6,
+                 method: str = 'simc', superheat_margin_c: float = 5.0, **tune_kwargs) -> 'GainSchedule':
+        """Sweep the grid through sh.calculate_properties_batch (t_c defaults to setpoint_inlet_C).
+
+        method: 'simc' (PI), 'imc' (PID) closed-form rules, or 'search' (tune_pid
+        closed-loop search; tune_kwargs such as mode/criterion/workers pass through).
+        Grid points closer than superheat_margin_c to saturation raise ValueError.
+        Gains are for the temperature-to-temperature stage (kc > 0); see
+        tuning.spray_valve_pid for a loop driving the spray valve directly.
+        """
+        flow_th, p_bar = np.asarray(flow_th, dtype=float), np.asarray(p_bar, dtype=float)
+        flow_grid, p_grid = np.meshgrid(flow_th, p_bar, indexing='ij')
+        t_c = sh.setpoint_inlet_C if t_c is None else t_c
+        check_superheated(p_grid, t_c, superheat_margin_c)
+        props = sh.calculate_properties_batch(p_grid.ravel(), np.broadcast_to(t_c, p_grid.shape).ravel(), flow_grid.ravel())
+        theta_s, tau_s = props['theta_s'], props['tau_s']
+        if method == 'simc':
+            kc, ti_s = simc_pi(k, theta_s, tau_s)
+            td_s = np.zeros_like(kc)
+        elif method == 'imc':
+            kc, ti_s, td_s = imc_pid(k, theta_s, tau_s)
+        elif method == 'search':
+            gains = tune_pid(k, theta_s, tau_s, **tune_kwargs)
+            kc, ti_s, td_s = gains['kc'], gains['ti_s'], gains['td_s']
+        else:
+            raise ValueError(f"method must be 'simc', 'imc' or 'search', got {method!r}")
+        columns = np.broadcast_arrays(kc, ti_s, td_s, k, theta_s, tau_s)
+        return cls(flow_th, p_bar, np.stack(columns, axis=-1).reshape(flow_grid.shape + (len(FIELDS),)))
+
+    def lookup(self, flow_th: float, p_bar: float) -> Dict[str, float]:
+        """All fields at one operating point (scalar fast path)."""
+        return dict(zip(self.fields, self.interpolate(flow_th, p_bar)))
+
+    def interpolate(self, flow_th: float, p_bar: float) -> list:
+        """Bilinear values in `fields` order; a few microseconds per call."""
+        i, wf = _bracket(self._flows, flow_th)
+        j, wp = _bracket(self._ps, p_bar)
+        r0, r1 = self._rows[i], self._rows[min(i + 1, len(self._rows) - 1)]
+        j1 = min(j + 1, len(self._ps) - 1)
+        a, b, c, d = r0[j], r0[j1], r1[j], r1[j1]
+        return [(1 - wf) * ((1 - wp) * a[n] + wp * b[n]) + wf * ((1 - wp) * c[n] + wp * d[n]) for n in range(len(a))]
+
+    def lookup_batch(self, flow_th, p_bar) -> Dict[str, np.ndarray]:
+        """Vectorized lookup for arrays of operating points (e.g. a load trajectory)."""
+        flow_th, p_bar = np.broadcast_arrays(np.asarray(flow_th, dtype=float), np.asarray(p_bar, dtype=float))
+        i, wf = _bracket_array(self.flow_th, flow_th)
+        j, wp = _bracket_array(self.p_bar, p_bar)
+        i1, j1 = np.minimum(i + 1, self.flow_th.size - 1), np.minimum(j + 1, self.p_bar.size - 1)
+        wf, wp = wf[..., None], wp[..., None]
+        t = self.table
+        values = (1 - wf) * ((1 - wp) * t[i, j] + wp * t[i, j1]) + wf * ((1 - wp) * t[i1, j] + wp * t[i1, j1])
+        return {name: values[..., n] for n, name in enumerate(self.fields)}
+
+    def save(self, path: str):
+        np.savez(path, flow_th=self.flow_th, p_bar=self.p_bar, table=self.table, fields=np.array(self.fields))
+
+    @classmethod
+    def load(cls, path: str) -> 'GainSchedule':
+        with np.load(path) as data:
+            return cls(data['flow_th'], data['p_bar'], data['table'], tuple(data['fields'].tolist()))
+
+
+def _bracket(nodes: list, x: float) -> Tuple[int, float]:
+    """Lower node index and weight, clamped to the grid."""
+    if x <= nodes[0] or len(nodes) == 1:
+        return 0, 0.0
+    if x >= nodes[-1]:
+        return len(nodes) - 1, 0.0
+    i = bisect_right(nodes, x) - 1
+    return i, (x - nodes[i]) / (nodes[i + 1] - nodes[i])
+
+
+def _bracket_array(nodes: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    x = np.clip(x, nodes[0], nodes[-1])
+    i = np.clip(np.searchsorted(nodes, x, side='right') - 1, 0, max(nodes.size - 2, 0))
+    span = nodes[np.minimum(i + 1, nodes.size - 1)] - nodes[i]
+    return i, np.where(span > 0, (x - nodes[i]) / np.where(span > 0, span, 1.0), 0.0)
@@ -0,0 +1,137 @@
+# steamlib/identification.py
+# FOPDT / SOPDT identification from recorded spray-valve moves (historian traces).
+# Batched least squares over a dead-time grid, then output-error refinement with the recursive simulators.
+
+import math
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.optimize import least_squares
+from typing import Dict, Optional
+from steamlib.fopdt import fopdt_simulate, sopdt_simulate
+
+
+def arx_dead_time_scan(u, y, dt: float = 1.0, max_delay_s: float = 120.0, order: int = 1,
+                       block: int = 1 << 14) -> Dict[str, np.ndarray]:
+    """Least-squares ARX fit for every integer dead time 0..max_delay_s at once.
+
+    y[n+1] = a1 y[n] (+ a2 y[n-1]) + b0 u[n-d] + b1 u[n-d-1] + c, on the same
+    samples for every d. The normal equations for all d are accumulated in one
+    blocked pass over the data (memmaps fine): a lagged-input matmul for the
+    y-u products and running sums for the u-u products, so cost is
+    O(N * n_delays) flops with O(block * n_delays) memory.
+    Returns 'delays_s', 'sse' (per d), 'coef' (per d: a.., b0, b1, c), and the
+    centring values 'u_ref', 'y_ref'.
+    """
+    if order not in (1, 2):
+        raise ValueError(f"order must be 1 or 2, got {order}")
+    n_delays = int(math.floor(max_delay_s / dt + 1e-9)) + 1
+    n_lags = n_delays + 1  # u[n-l], l = 0..n_delays
+    n = len(u)
+    start = n_lags + order  # First target index n (y[n+1]) with all regressors available
+    if n - 1 - start < 10 * (order + 4):
+        raise ValueError(f"{n} samples are too few for a {max_delay_s} s dead-time scan")
+    head = slice(0, min(n, 100_000))
+    u_ref, y_ref = float(np.mean(u[head])), float(np.mean(y[head]))  # Centring for conditioning
+    n_rows = order + 1  # y[n+1], y[n], (y[n-1])
+    cyu = np.zeros((n_rows, n_lags))
+    yy = np.zeros((n_rows, n_rows))
+    ysum = np.zeros(n_rows)
+    uu, u1, us = np.zeros(n_lags), np.zeros(n_lags - 1), np.zeros(n_lags)
+    offsets = n_lags - 1 - np.arange(n_lags)  # Window column of lag l
+    for s in range(start, n - 1, block):
+        e = min(s + block, n - 1)
+        b = e - s
+        yb = np.stack([np.asarray(y[s + 1 - j:e + 1 - j], dtype=float) - y_ref for j in range(n_rows)])
+        ub = np.asarray(u[s - n_lags:e], dtype=float) - u_ref  # One extra sample for u[m]u[m-1]
+        window = sliding_window_view(ub[1:], n_lags)  # (b, n_lags); column c is u[n - (n_lags-1-c)]
+        cyu += (yb @ window)[:, ::-1]
+        yy += yb @ yb.T
+        ysum += yb.sum(axis=1)
+        c_sq = np.concatenate([[0.0], np.cumsum(ub[1:] * ub[1:])])
+        c_lin = np.concatenate([[0.0], np.cumsum(ub[1:])])
+        c_prod = np.concatenate([[0.0], np.cumsum(ub[1:] * ub[:-1])])
+        uu += c_sq[offsets + b] - c_sq[offsets]
+        us += c_lin[offsets + b] - c_lin[offsets]
+        u1 += (c_prod[offsets + b] - c_prod[offsets])[:-1]  # Σ u[n-l] u[n-l-1], l = 0..n_lags-2
+    count = float(n - 1 - start)
+    # Per-delay normal equations; features [y[n], (y[n-1]), u[n-d], u[n-d-1], 1]
+    d = np.arange(n_delays)
+    p = order + 3
+    gram = np.empty((n_delays, p, p))
+    rhs = np.empty((n_delays, p))
+    gram[:, :order, :order] = yy[1:, 1:]
+    gram[:, :order, order] = cyu[1:, d].T
+    gram[:, :order, order + 1] = cyu[1:, d + 1].T
+    gram[:, :order, order + 2] = ysum[1:]
+    gram[:, order, order], gram[:, order + 1, order + 1] = uu[d], uu[d + 1]
+    gram[:, order, order + 1] = u1[d]
+    gram[:, order, order + 2], gram[:, order + 1, order + 2] = us[d], us[d + 1]
+    gram[:, order + 2, order + 2] = count
+    upper = np.triu_indices(p, 1)
+    gram[:, upper[1], upper[0]] = gram[:, upper[0], upper[1]]
+    rhs[:, :order] = yy[0, 1:]
+    rhs[:, order], rhs[:, order + 1], rhs[:, order + 2] = cyu[0, d], cyu[0, d + 1], ysum[0]
+    coef = np.linalg.solve(gram, rhs[..., None])[..., 0]
+    sse = yy[0, 0] - np.einsum('dp,dp->d', coef, rhs)
+    return {'delays_s': d * dt, 'sse': np.maximum(sse, 0.0), 'coef': coef, 'u_ref': u_ref, 'y_ref': y_ref}
+
+
+def identify_fopdt(u, y, dt: float = 1.0, max_delay_s: float = 120.0, refine: bool = True,
+                   refine_samples: Optional[int] = None, block: int = 1 << 14) -> Dict:
+    """Fit k, theta_s, tau_s (as consumed by fopdt_step_response) to recorded input/output.
+
+    The ARX scan picks the dead time; b0/b1 give its fractional part. With
+    refine, output-error least squares over (k, θ, τ, offset) on
+    fopdt_simulate (first refine_samples samples, default all) polishes the
+    equation-error estimate. 'fit' is 1 - |y - ŷ| / |y - ȳ| of the simulation
+    over the refinement window.
+    """
+    scan = arx_dead_time_scan(u, y, dt, max_delay_s, 1, block)
+    i = int(np.argmin(scan['sse']))
+    a, b0, b1, _ = scan['coef'][i]
+    a = min(max(a, 1e-9), 1 - 1e-9)
+    k = (b0 + b1) / (1 - a)
+    tau_s = -dt / math.log(a)
+    a_frac = min(max(1 - b0 / k, a), 1.0) if k else 1.0
+    frac_s = min(max(dt + tau_s * math.log(a_frac), 0.0), dt) if a_frac > 0 else 0.0
+    params = {'k': k, 'theta_s': i * dt + frac_s, 'tau_s': tau_s}
+    simulate = lambda x, uc: fopdt_simulate(uc, dt, x[0], x[1], x[2], uc[0]) + x[3]
+    return _output_error(u, y, scan, params, ('k', 'theta_s', 'tau_s'), simulate, refine, refine_samples)
+
+
+def identify_sopdt(u, y, dt: float = 1.0, max_delay_s: float = 120.0, refine: bool = True,
+                   refine_samples: Optional[int] = None, block: int = 1 << 14) -> Dict:
+    """Fit k, theta_s, tau1_s >= tau2_s; ARX(2) poles give the start lags (complex or
+    non-positive poles fall back to a split of the FOPDT lag), refined on sopdt_simulate."""
+    scan = arx_dead_time_scan(u, y, dt, max_delay_s, 2, block)
+    i = int(np.argmin(scan['sse']))
+    a1, a2, b0, b1, _ = scan['coef'][i]
+    k = (b0 + b1) / (1 - a1 - a2)
+    poles = np.roots([1.0, -a1, -a2])
+    if np.all(np.isreal(poles)) and np.all((poles.real > 0) & (poles.real < 1)):
+        tau1_s, tau2_s = sorted((-dt / math.log(z) for z in poles.real), reverse=True)
+    else:
+        first = identify_fopdt(u, y, dt, max_delay_s, refine=False, block=block)
+        tau1_s, tau2_s = 0.7 * first['tau_s'], 0.3 * first['tau_s']
+    params = {'k': k, 'theta_s': i * dt, 'tau1_s': tau1_s, 'tau2_s': tau2_s}
+    simulate = lambda x, uc: sopdt_simulate(uc, dt, x[0], x[1], x[2], x[3], uc[0]) + x[4]
+    return _output_error(u, y, scan, params, ('k', 'theta_s', 'tau1_s', 'tau2_s'), simulate, refine, refine_samples)
+
+
+def _output_error(u, y, scan, params: Dict, names, simulate, refine: bool, refine_samples: Optional[int]) -> Dict:
+    n = len(u) if refine_samples is None else min(len(u), refine_samples)
+    uc = np.asarray(u[:n], dtype=float) - scan['u_ref']
+    yc = np.asarray(y[:n], dtype=float) - scan['y_ref']
+    x0 = np.array([params[name] for name in names] + [0.0])
+    x0[-1] = float(np.mean(yc - simulate(np.r_[x0[:-1], 0.0], uc)))
+    if refine:
+        lower = np.r_[-np.inf, np.zeros(len(names) - 1), -np.inf]
+        solution = least_squares(lambda x: simulate(x, uc) - yc, np.clip(x0, lower + 1e-9, np.inf), bounds=(lower, np.inf),
+                                 x_scale='jac', diff_step=1e-4, max_nfev=50)
+        x0 = solution.x
+    residual = simulate(x0, uc) - yc
+    result = {name: float(value) for name, value in zip(names, x0[:-1])}
+    result.update(offset=float(x0[-1]) + scan['y_ref'], u_ref=scan['u_ref'],
+                  fit=1 - float(np.linalg.norm(residual) / np.linalg.norm(yc - yc.mean())),
+                  delays_s=scan['delays_s'], sse=scan['sse'])
+    return result
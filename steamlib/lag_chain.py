@@ -0,0 +1,101 @@
+# steamlib/lag_chain.py
+# Tanks-in-series (n lags) plus dead time, with lags distributed over the YAML `sections`.
+# Exact ZOH state space: one augmented matrix exponential per sample time, reused for every input.
+
+import math
+import numpy as np
+from scipy.linalg import expm
+from scipy.signal import lfilter, lfilter_zi, ss2tf
+from typing import Dict, List, Sequence, Tuple
+from steamlib.discretisation import shared_discretisation_cache
+
+
+class LagChain:
+    """k e^{-θs} / Π (τ_i s + 1); tanks with τ_i <= 0 pass through.
+
+    discretise(dt) is computed once per (k, θ, τ_i, dt) in the shared discretisation
+    cache (expm of the augmented [[A, B], [0, 0]]) and turned into a transfer
+    function, so simulate() is a single lfilter.
+    """
+
+    def __init__(self, k: float, theta_s: float, taus_s: Sequence[float]):
+        self.k, self.theta_s = float(k), float(theta_s)
+        self.taus_s = np.array([tau for tau in taus_s if tau > 0], dtype=float)
+        n = self.taus_s.size
+        self.a = np.diag(-1 / self.taus_s) + np.diag(1 / self.taus_s[1:], -1)  # x_i' = (x_{i-1} - x_i) / τ_i
+        self.b = np.zeros(n)
+        if n:
+            self.b[0] = self.k / self.taus_s[0]
+        self.c = np.eye(n)[-1] if n else np.zeros(0)
+
+    def discretise(self, dt: float) -> Tuple[np.ndarray, np.ndarray, int]:
+        """(num, den, d): y = num/den applied to u[n-d], fractional delay in num (cached)."""
+        params = (self.k, self.theta_s) + tuple(self.taus_s.tolist())
+        return shared_discretisation_cache().get('lag_chain', params, dt, lambda: self._discretise(dt))
+
+    def _discretise(self, dt: float) -> Tuple[np.ndarray, np.ndarray, int]:
+        d = int(math.floor(self.theta_s / dt + 1e-9))
+        frac_s = max(self.theta_s - d * dt, 0.0)
+        n = self.taus_s.size
+        if n == 0:  # Pure delay, as fopdt_discretise's τ -> 0 limit
+            return np.array([0.0, self.k]), np.array([1.0]), d
+        aug = np.zeros((n + 1, n + 1))
+        aug[:n, :n], aug[:n, n] = self.a, self.b
+        late = expm(aug * (dt - frac_s))  # Input u[n-d] acts over the last dt - δ
+        early = expm(aug * frac_s)  # Input u[n-d-1] acts over the first δ
+        phi = late[:n, :n] @ early[:n, :n]
+        gamma0, gamma1 = late[:n, n], late[:n, :n] @ early[:n, n]
+        num0, den = ss2tf(phi, gamma0[:, None], self.c[None, :], np.zeros((1, 1)))
+        num1, _ = ss2tf(phi, gamma1[:, None], self.c[None, :], np.zeros((1, 1)))
+        return np.concatenate([num0[0], [0.0]]) + np.concatenate([[0.0], num1[0]]), den, d
+
+    def simulate(self, u, dt: float, u_initial: float = 0.0) -> np.ndarray:
+        """Response to a ZOH input sequence (last axis) from steady state at u_initial."""
+        u = np.asarray(u, dtype=float)
+        num, den, d = self.discretise(dt)
+        delayed = np.concatenate([np.full(u.shape[:-1] + (d,), float(u_initial)), u], axis=-1)[..., :u.shape[-1]]
+        zi = lfilter_zi(num, den) * u_initial
+        y, _ = lfilter(num, den, delayed, axis=-1, zi=np.broadcast_to(zi, u.shape[:-1] + zi.shape))
+        return y
+
+    def step(self, t) -> np.ndarray:
+        """Unit-step response on any time grid: uniform grids via simulate(), others via batched expm."""
+        t = np.asarray(t, dtype=float)
+        flat = t.ravel()
+        if flat.size > 2:
+            dt = flat[1] - flat[0]
+            if dt > 0 and 0 <= flat[0] <= self.theta_s and np.allclose(np.diff(flat), dt, rtol=1e-9, atol=1e-12):
+                shifted = LagChain(self.k, self.theta_s - flat[0], self.taus_s)  # Step applied at t[0]
+                return shifted.simulate(np.ones(flat.size), dt).reshape(t.shape)
+        s = flat - self.theta_s
+        y = np.zeros(flat.size)
+        after = s > 0
+        if self.taus_s.size == 0:
+            y[after] = self.k
+            return y.reshape(t.shape)
+        values, inverse = np.unique(s[after], return_inverse=True)
+        decay = expm(self.a[None] * values[:, None, None]) @ np.ones(self.taus_s.size)  # e^{As} x_ss / k
+        y[after] = self.k * (1 - decay[:, -1])[inverse]
+        return y.reshape(t.shape)
+
+
+def section_lags(sections: List[Dict], tau_s: float) -> np.ndarray:
+    """Split a lumped τ over the YAML sections by length (same tube, so capacity ~ length); Στ_i = τ."""
+    lengths = np.array([s['length_m'] for s in sections], dtype=float)
+    return tau_s * lengths / lengths.sum()
+
+
+def sopdt_from_lags(theta_s: float, taus_s: Sequence[float]) -> Dict[str, float]:
+    """Moment-matched SOPDT for a lag chain: same mean (θ + Στ) and variance (Στ²).
+
+    If two lags cannot carry that little variance, they are made equal and
+    the surplus mean moves into the dead time.
+    """
+    taus_s = np.asarray(taus_s, dtype=float)
+    mean, var = taus_s.sum(), (taus_s ** 2).sum()
+    disc = var / 2 - mean ** 2 / 4
+    if disc >= 0:
+        root = math.sqrt(disc)
+        return {'theta_s': float(theta_s), 'tau1_s': mean / 2 + root, 'tau2_s': max(mean / 2 - root, 0.0)}
+    tau = math.sqrt(var / 2)
+    return {'theta_s': float(theta_s + mean - 2 * tau), 'tau1_s': tau, 'tau2_s': tau}
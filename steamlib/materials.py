@@ -0,0 +1,51 @@
+# steamlib/materials.py
+# Tube materials named in the YAML `sections` (properties near 450-550 °C service).
+# max_metal_c: allowable mid-wall metal temperature (oxidation/creep design practice).
+# Larson-Miller: T_K * (lmp_c + log10 t_r_h) = lmp_a - lmp_b * log10(sigma_MPa), fitted to
+# indicative 1e5 h rupture strengths; replace with certified curves for life assessment.
+
+import numpy as np
+from typing import Dict, List
+
+MATERIALS: Dict[str, Dict[str, float]] = {
+    '12Cr1MoV': {'density_kgm3': 7850.0, 'cp_jkgk': 550.0, 'max_metal_c': 580.0,
+                 'lmp_c': 20.0, 'lmp_a': 29335.0, 'lmp_b': 4505.0},
+    '12Cr2MoWVTiB': {'density_kgm3': 7830.0, 'cp_jkgk': 560.0, 'max_metal_c': 600.0,  # G102 (GB 5310)
+                     'lmp_c': 20.0, 'lmp_a': 27777.0, 'lmp_b': 3226.0},
+    'SA-213 T91': {'density_kgm3': 7770.0, 'cp_jkgk': 620.0, 'max_metal_c': 650.0,
+                   'lmp_c': 20.0, 'lmp_a': 30961.0, 'lmp_b': 4568.0},
+}
+
+
+def material(name: str) -> Dict[str, float]:
+    """Property row for a YAML material name."""
+    try:
+        return MATERIALS[name]
+    except KeyError:
+        raise KeyError(f"unknown tube material {name!r}; known: {', '.join(MATERIALS)}") from None
+
+
+def section_limits_c(sections: List[Dict]) -> np.ndarray:
+    """Allowable metal temperature per YAML section, in section order."""
+    return np.array([material(s['material'])['max_metal_c'] for s in sections])
+
+
+def metal_limit_report(section_metal_c, limits_c, t_s=None) -> Dict[str, np.ndarray]:
+    """Overtemperature evaluation of (n_t, ..., n_sections) metal temperatures in one pass.
+
+    Leading axes after time (e.g. 172 tubes) are kept; 'first_alarm_s' is
+    NaN where the limit is never exceeded.
+    """
+    section_metal_c = np.asarray(section_metal_c, dtype=float)
+    n_t = section_metal_c.shape[0]
+    t_s = np.arange(n_t, dtype=float) if t_s is None else np.asarray(t_s, dtype=float)
+    margin_c = np.asarray(limits_c, dtype=float) - section_metal_c
+    alarm = margin_c < 0
+    ever = alarm.any(axis=0)
+    first = np.where(ever, t_s[np.argmax(alarm, axis=0)], np.nan)
+    dt_s = np.diff(t_s, append=t_s[-1])  # Sample-and-hold time weights
+    over_s = np.tensordot(dt_s, alarm, axes=(0, 0))
+    return {
+        'peak_c': section_metal_c.max(axis=0), 'min_margin_c': margin_c.min(axis=0),
+        'alarm': ever, 'first_alarm_s': first, 'time_over_s': over_s,
+    }
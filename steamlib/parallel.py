@@ -0,0 +1,39 @@
+# steamlib/parallel.py
+# Process-pool fan-out shared by the sweeps (tuning, Monte Carlo, Sobol indices).
+# Read-only sweep data goes to each worker once, through the pool initializer; tasks carry only indices.
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+worker_data: Dict = {}  # Read-only sweep data, set once per worker process (or in-process when serial)
+
+
+def _init_worker(data: Dict):
+    worker_data.clear()
+    worker_data.update(data)
+
+
+@contextmanager
+def sweep_pool(data: Dict, workers: Optional[int] = None) -> Iterator[Callable[[Callable, Sequence], List]]:
+    """run(fn, tasks) -> [fn(task), ...], with fn reading worker_data.
+
+    workers > 1: one process pool for the whole block (reused across run()
+    calls); otherwise tasks run in-process. fn must be a module-level function.
+    """
+    if workers and workers > 1:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(data,)) as pool:
+            yield lambda fn, tasks: list(pool.map(fn, tasks))
+    else:
+        _init_worker(data)
+        yield lambda fn, tasks: [fn(task) for task in tasks]
+
+
+def map_batches(fn: Callable[[List], Any], batches: List, data: Dict, workers: Optional[int] = None) -> List:
+    """fn over interleaved groups of batches, up to 4 groups per worker; one partial result per group.
+
+    Serial (workers <= 1 or a single batch): one group holding every batch.
+    """
+    n_tasks = min(len(batches), 4 * workers) if workers and workers > 1 and len(batches) > 1 else 1
+    with sweep_pool(data, workers if n_tasks > 1 else None) as run:
+        return run(fn, [batches[i::n_tasks] for i in range(n_tasks)])
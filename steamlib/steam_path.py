@@ -0,0 +1,52 @@
+# steamlib/steam_path.py
+# Series steam path: platen SH -> attemperator (SP2 spray) -> final SH -> main steam.
+# Whole time series per stage in one vectorized pass (LPV FOPDT per superheater).
+
+from dataclasses import dataclass
+import numpy as np
+from typing import Dict, Optional
+from steamlib.attemperator import Attemperator
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.platen_superheater import PlatenSuperheater
+from steamlib.steam_properties import operating_point_arrays
+
+
+@dataclass
+class SteamPath:
+    """Platen -> attemperator -> final; each SH stage: T_out = setpoint_out + LPV(T_in - setpoint_in)."""
+    platen: PlatenSuperheater
+    final: FinalSuperheater
+    k_platen: float = 0.6
+    k_final: float = 0.7
+    attemperator: Optional[Attemperator] = None  # Any .outlet(p, T, flow, spray, T_spray) -> (T_out, flow_out)
+
+    def __post_init__(self):
+        if self.attemperator is None:
+            self.attemperator = Attemperator(self.final.property_backend)
+
+    def simulate(self, dt: float, p_bar, t_in_c, steam_flow_th, spray_flow_th=0.0,
+                 t_spray_c=200.0) -> Dict[str, np.ndarray]:
+        """Main steam temperature for whole trajectories (sampled every dt).
+
+        Each stage starts at its steady state (inlet at setpoint); returns
+        every intermediate temperature plus θ/τ of both superheaters.
+        """
+        p_bar, t_in_c, steam_flow_th = operating_point_arrays(p_bar, t_in_c, steam_flow_th)
+        p_bar, t_in_c, steam_flow_th, spray_flow_th, t_spray_c = np.broadcast_arrays(
+            p_bar, t_in_c, steam_flow_th, np.asarray(spray_flow_th, dtype=float), np.asarray(t_spray_c, dtype=float))
+        platen = self.stage(self.platen, self.k_platen, dt, p_bar, t_in_c, steam_flow_th)
+        t_attemp_c, final_flow_th = self.attemperator.outlet(p_bar, platen['outlet_c'], steam_flow_th,
+                                                             spray_flow_th, t_spray_c)
+        final = self.stage(self.final, self.k_final, dt, p_bar, t_attemp_c, final_flow_th)
+        return {
+            'platen_out_c': platen['outlet_c'], 'attemperator_out_c': t_attemp_c, 'main_steam_c': final['outlet_c'],
+            'final_flow_th': final_flow_th, 'platen_theta_s': platen['theta_s'], 'platen_tau_s': platen['tau_s'],
+            'final_theta_s': final['theta_s'], 'final_tau_s': final['tau_s'],
+        }
+
+    @staticmethod
+    def stage(sh, k: float, dt: float, p_bar, t_in_c, steam_flow_th) -> Dict[str, np.ndarray]:
+        """One superheater: properties along its own inlet temperature, LPV response to inlet deviation."""
+        result = sh.lpv_simulate(p_bar, t_in_c, steam_flow_th, t_in_c - sh.setpoint_inlet_C, dt, k)
+        result['outlet_c'] = sh.setpoint_outlet_C + result['y']
+        return result
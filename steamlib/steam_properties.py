@@ -0,0 +1,311 @@
+# steamlib/steam_properties.py
+# Shared steam property helpers for the superheater models (IF97 via pyXSteam).
+# Batch evaluation over arrays of operating points + lumped θ/τ arithmetic.
+
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+import pyXSteam
+from pyXSteam.XSteam import XSteam  # For IF97 properties
+from steamlib.cache import LRUCache
+from steamlib.files import atomic_write
+from typing import Dict, Optional, Protocol, Tuple
+
+OPERATING_POINT_FIELDS = ('p_bar', 't_c', 'steam_flow_th')
+GRID_MAGIC = b'STMGRID\x00'
+GRID_FORMAT_VERSION = 1
+GRID_ALIGN = 64  # Byte alignment of the memmapped arrays
+DEFAULT_CACHE_DIR = os.environ.get('STEAMLIB_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'steamlib'))
+
+
+def operating_point_arrays(p_bar, t_c=None, steam_flow_th=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Broadcast p, T, flow to float arrays; also accepts one structured array/DataFrame."""
+    if t_c is None and steam_flow_th is None:
+        records = p_bar  # Structured array, DataFrame or dict with p_bar/t_c/steam_flow_th
+        p_bar, t_c, steam_flow_th = (records[name] for name in OPERATING_POINT_FIELDS)
+    arrays = [np.asarray(x, dtype=float) for x in (p_bar, t_c, steam_flow_th)]
+    return tuple(np.broadcast_arrays(*arrays))
+
+
+def xsteam_props_pt(p_bar, t_c, steam: Optional[XSteam] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """h [kJ/kg], cp [kJ/kgK], v [m3/kg] over arrays; XSteam runs once per unique (p, T)."""
+    steam = steam or XSteam(XSteam.UNIT_SYSTEM_MKS)  # bar, °C, kJ/kg
+    p_bar, t_c = np.broadcast_arrays(np.asarray(p_bar, dtype=float), np.asarray(t_c, dtype=float))
+    pairs = np.stack([p_bar.ravel(), t_c.ravel()], axis=1)
+    unique_pairs, inverse = np.unique(pairs, axis=0, return_inverse=True)  # Historian data repeats
+    table = np.empty((len(unique_pairs), 3))
+    for i, (p, t) in enumerate(unique_pairs):
+        table[i] = steam.h_pt(p, t), steam.Cp_pt(p, t), steam.v_pt(p, t)
+    table = table[inverse.ravel()]
+    return tuple(table[:, j].reshape(p_bar.shape) for j in range(3))
+
+
+def tube_geometry(tube_count, tube_id_mm, tube_od_mm, total_length_m) -> Tuple:
+    """(per-tube flow area, total flow area, total outer surface) [m2]; all inputs broadcast."""
+    cross_section_m2 = np.pi * (tube_id_mm / 2000) ** 2
+    return cross_section_m2, tube_count * cross_section_m2, np.pi * (tube_od_mm / 1000) * total_length_m * tube_count
+
+
+def saturation_temperature_c(p_bar) -> float:
+    """IF97 Tsat [°C]; NaN at or above the critical pressure."""
+    return float(XSteam(XSteam.UNIT_SYSTEM_MKS).tsat_p(float(p_bar)))
+
+
+def check_superheated(p_bar, t_c, margin_c: float = 5.0):
+    """Raise ValueError unless every (p_bar, t_c) is at least margin_c above Tsat(p_bar).
+
+    The lumped θ/τ model and everything tuned from it assume superheated
+    steam; supercritical pressures (Tsat NaN) pass. Arrays broadcast.
+    """
+    p_bar, t_c = (x.ravel() for x in np.broadcast_arrays(np.asarray(p_bar, dtype=float), np.asarray(t_c, dtype=float)))
+    p_unique, inverse = np.unique(p_bar, return_inverse=True)
+    t_sat_c = np.array([saturation_temperature_c(p) for p in p_unique])[inverse.ravel()]
+    bad = np.flatnonzero(t_c < t_sat_c + margin_c)  # NaN compares False
+    if bad.size:
+        i = bad[0]
+        raise ValueError(f"{bad.size} of {p_bar.size} points are not superheated steam, e.g. {t_c[i]:g} °C at "
+                         f"{p_bar[i]:g} bar (Tsat {t_sat_c[i]:.1f} °C, margin {margin_c} °C); lower p_bar or raise t_c")
+
+
+def lumped_properties(h_kjkg, cp_kjkgk, rho_kgm3, steam_flow_th, a_total_m2, total_length_m,
+                      outer_surface_m2, U_W_m2K) -> Dict:
+    """Lumped transport delay θ and thermal time constant τ; all inputs broadcast."""
+    m_kgs = steam_flow_th * 1000 / 3600
+    v_ms = m_kgs / (rho_kgm3 * a_total_m2)
+    theta_s = total_length_m / v_ms  # Transport delay
+    v_total_m3 = a_total_m2 * total_length_m
+    m_kg = rho_kgm3 * v_total_m3
+    c_th_jk = m_kg * (cp_kjkgk * 1000)
+    ua_wk = U_W_m2K * outer_surface_m2
+    tau_s = c_th_jk / ua_wk  # Thermal time constant
+    return {
+        'rho': rho_kgm3, 'cp': cp_kjkgk, 'v': v_ms, 'theta_s': theta_s, 'tau_s': tau_s,
+        'h': h_kjkg, 'm_kg': m_kg, 'c_th_jk': c_th_jk, 'ua_wk': ua_wk
+    }
+
+
+class PropertyBackend(Protocol):
+    """Anything that maps (p [bar], T [°C]) to (h [kJ/kg], cp [kJ/kgK], v [m3/kg])."""
+
+    def props_pt(self, p_bar, t_c) -> Tuple:
+        ...
+
+
+class XSteamBackend:
+    """Reference backend: every lookup goes through one pyXSteam (IF97) instance."""
+
+    def __init__(self):
+        self.steam = XSteam(XSteam.UNIT_SYSTEM_MKS)  # bar, °C, kJ/kg
+        self._lock = threading.Lock()  # One XSteam shared by all superheaters/threads
+
+    def props_pt(self, p_bar, t_c) -> Tuple:
+        with self._lock:
+            if np.ndim(p_bar) == 0 and np.ndim(t_c) == 0:  # Scalar fast path, plain floats out
+                return self.steam.h_pt(p_bar, t_c), self.steam.Cp_pt(p_bar, t_c), self.steam.v_pt(p_bar, t_c)
+            return xsteam_props_pt(p_bar, t_c, self.steam)
+
+
+_shared_backend: Optional[PropertyBackend] = None
+_shared_backend_lock = threading.Lock()
+
+
+def shared_property_backend() -> PropertyBackend:
+    """Process-wide default backend (one XSteam), created on first use."""
+    global _shared_backend
+    if _shared_backend is None:
+        with _shared_backend_lock:
+            if _shared_backend is None:
+                _shared_backend = XSteamBackend()
+    return _shared_backend
+
+
+def set_shared_property_backend(backend: Optional[PropertyBackend]):
+    """Swap the process-wide default (e.g. a stub in tests); None resets to XSteam."""
+    global _shared_backend
+    with _shared_backend_lock:
+        _shared_backend = backend
+
+
+class GridBackend:
+    """Bilinear interpolation on a dense IF97 (p, T) table of h, cp and p*v.
+
+    Cells closer than `superheat_margin_c` to saturation (and points outside the
+    grid) fall back to `fallback` (XSteam). With the defaults (1 bar x 1 °C,
+    10 °C margin) the relative error is below 4e-5 for h, 1e-3 for cp and
+    1e-4 for v (worst at cell centres); `max_rel_error()` measures it for any grid.
+    `GridBackend.cached()` persists the table once and memory-maps it afterwards.
+    """
+
+    def __init__(self, p_range_bar: Tuple[float, float] = (20.0, 200.0),
+                 t_range_c: Tuple[float, float] = (300.0, 600.0), dp_bar: float = 1.0, dt_c: float = 1.0,
+                 superheat_margin_c: float = 10.0, fallback: Optional[PropertyBackend] = None):
+        self.fallback = fallback or XSteamBackend()
+        self._set_grid(p_range_bar, t_range_c, dp_bar, dt_c, superheat_margin_c)
+        p_grid, t_grid = np.meshgrid(self.p_nodes, self.t_nodes, indexing='ij')
+        h, cp, v = xsteam_props_pt(p_grid, t_grid)
+        self.tables = np.stack([h, cp, p_grid * v])  # p*v ~ RT is near-linear in p
+        steam = XSteam(XSteam.UNIT_SYSTEM_MKS)
+        tsat_c = np.array([steam.tsat_p(p) for p in self.p_nodes])
+        self.valid_cells = self.t_nodes[None, :-1] - tsat_c[1:, None] >= superheat_margin_c
+
+    def _set_grid(self, p_range_bar, t_range_c, dp_bar, dt_c, superheat_margin_c):
+        self.p_range_bar, self.t_range_c = tuple(p_range_bar), tuple(t_range_c)
+        self.p_nodes = np.arange(p_range_bar[0], p_range_bar[1] + dp_bar / 2, dp_bar)
+        self.t_nodes = np.arange(t_range_c[0], t_range_c[1] + dt_c / 2, dt_c)
+        self.dp_bar, self.dt_c = dp_bar, dt_c
+        self.superheat_margin_c = superheat_margin_c
+
+    def grid_key(self) -> Dict:
+        """Everything the table contents depend on (bounds, resolution, IF97 source)."""
+        return grid_key(self.p_range_bar, self.t_range_c, self.dp_bar, self.dt_c, self.superheat_margin_c)
+
+    def save(self, path: str):
+        """Write the versioned binary table: magic, JSON header, aligned raw arrays."""
+        header = dict(self.grid_key(), tables_shape=list(self.tables.shape),
+                      valid_shape=list(self.valid_cells.shape))
+        prefix_len = len(GRID_MAGIC) + 4
+        for _ in range(2):  # Offsets change the header length, settle in two passes
+            blob = json.dumps(header).encode()
+            header['tables_offset'] = _align(prefix_len + len(blob) + GRID_ALIGN)
+            header['valid_offset'] = _align(header['tables_offset'] + self.tables.size * 8)
+        blob = json.dumps(header).encode()
+        assert prefix_len + len(blob) <= header['tables_offset']
+        with atomic_write(path) as f:  # Concurrent workers never see a partial file
+            f.write(GRID_MAGIC + len(blob).to_bytes(4, 'little') + blob)
+            f.seek(header['tables_offset'])
+            f.write(np.ascontiguousarray(self.tables, dtype='<f8').tobytes())
+            f.seek(header['valid_offset'])
+            f.write(np.ascontiguousarray(self.valid_cells, dtype='|b1').tobytes())
+
+    @classmethod
+    def load(cls, path: str, fallback: Optional[PropertyBackend] = None) -> 'GridBackend':
+        """Open a saved table read-only via np.memmap (pages shared between processes).
+
+        Raises ValueError for a foreign file, another format version or a
+        table built with a different pyXSteam release.
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(GRID_MAGIC)) != GRID_MAGIC:
+                raise ValueError(f"{path} is not a steam property grid")
+            header = json.loads(f.read(int.from_bytes(f.read(4), 'little')))
+        if header['format_version'] != GRID_FORMAT_VERSION:
+            raise ValueError(f"{path}: grid format {header['format_version']}, expected {GRID_FORMAT_VERSION}")
+        if header.get('pyxsteam_version') != pyXSteam.__version__:  # Tables are IF97 as computed by that release
+            raise ValueError(f"{path}: built with pyXSteam {header.get('pyxsteam_version')}, "
+                             f"running {pyXSteam.__version__}; rebuild the grid")
+        grid = cls.__new__(cls)
+        grid.fallback = fallback or XSteamBackend()
+        grid._set_grid(header['p_range_bar'], header['t_range_c'], header['dp_bar'], header['dt_c'],
+                       header['superheat_margin_c'])
+        grid.tables = np.memmap(path, dtype='<f8', mode='r', offset=header['tables_offset'],
+                                shape=tuple(header['tables_shape']))
+        grid.valid_cells = np.memmap(path, dtype='|b1', mode='r', offset=header['valid_offset'],
+                                     shape=tuple(header['valid_shape']))
+        return grid
+
+    @classmethod
+    def cached(cls, cache_dir: Optional[str] = None, fallback: Optional[PropertyBackend] = None,
+               **grid_kwargs) -> 'GridBackend':
+        """Load the table for these bounds/resolution from `cache_dir`, building it once if missing."""
+        path = grid_cache_path(cache_dir, **grid_kwargs)
+        if not os.path.exists(path):
+            cls(fallback=fallback, **grid_kwargs).save(path)
+        return cls.load(path, fallback=fallback)
+
+    def props_pt(self, p_bar, t_c) -> Tuple:
+        scalar = np.ndim(p_bar) == 0 and np.ndim(t_c) == 0
+        p_bar, t_c = np.broadcast_arrays(np.asarray(p_bar, dtype=float), np.asarray(t_c, dtype=float))
+        fi = (p_bar - self.p_nodes[0]) / self.dp_bar
+        fj = (t_c - self.t_nodes[0]) / self.dt_c
+        i = np.clip(np.floor(fi).astype(int), 0, len(self.p_nodes) - 2)
+        j = np.clip(np.floor(fj).astype(int), 0, len(self.t_nodes) - 2)
+        ok = (fi >= 0) & (fi <= len(self.p_nodes) - 1) & (fj >= 0) & (fj <= len(self.t_nodes) - 1)
+        ok &= self.valid_cells[i, j]
+        wp, wt = fi - i, fj - j
+        tab = self.tables
+        out = ((1 - wp) * (1 - wt) * tab[:, i, j] + wp * (1 - wt) * tab[:, i + 1, j]
+               + (1 - wp) * wt * tab[:, i, j + 1] + wp * wt * tab[:, i + 1, j + 1])
+        out[2] /= p_bar
+        if not ok.all():
+            out[:, ~ok] = np.stack(self.fallback.props_pt(p_bar[~ok], t_c[~ok]))
+        if scalar:
+            return tuple(float(x) for x in out)
+        return out[0], out[1], out[2]
+
+    def max_rel_error(self) -> Dict[str, float]:
+        """Worst relative error vs XSteam at the centres of all valid cells."""
+        p_c = (self.p_nodes[:-1] + self.p_nodes[1:]) / 2
+        t_c = (self.t_nodes[:-1] + self.t_nodes[1:]) / 2
+        p_grid, t_grid = np.meshgrid(p_c, t_c, indexing='ij')
+        p_grid, t_grid = p_grid[self.valid_cells], t_grid[self.valid_cells]
+        exact = xsteam_props_pt(p_grid, t_grid)
+        approx = self.props_pt(p_grid, t_grid)
+        return {name: float(np.max(np.abs(a - e) / np.abs(e)))
+                for name, a, e in zip(('h', 'cp', 'v'), approx, exact)}
+
+
+class CachedBackend:
+    """LRU memoisation in front of another backend, keyed on quantised (p, T).
+
+    Lookups snap to the nearest (`p_quantum_bar`, `t_quantum_c`) node and the
+    wrapped backend is evaluated at that node, so a cached value never depends
+    on which raw sample filled it. Array calls count one lookup per distinct key.
+    """
+
+    def __init__(self, backend: PropertyBackend, maxsize: int = 65536, p_quantum_bar: float = 0.01,
+                 t_quantum_c: float = 0.01):
+        self.backend = backend
+        self.p_quantum_bar, self.t_quantum_c = p_quantum_bar, t_quantum_c
+        self.cache = LRUCache(maxsize)
+
+    def props_pt(self, p_bar, t_c) -> Tuple:
+        if np.ndim(p_bar) == 0 and np.ndim(t_c) == 0:
+            key = (round(p_bar / self.p_quantum_bar), round(t_c / self.t_quantum_c))
+            return self.cache.get_or_compute(key, lambda: self._evaluate(*key))
+        p_bar, t_c = np.broadcast_arrays(np.asarray(p_bar, dtype=float), np.asarray(t_c, dtype=float))
+        keys = np.stack([np.rint(p_bar / self.p_quantum_bar), np.rint(t_c / self.t_quantum_c)], axis=-1)
+        unique_keys, inverse = np.unique(keys.reshape(-1, 2).astype(np.int64), axis=0, return_inverse=True)
+        values = np.empty((len(unique_keys), 3))
+        missing = []
+        for i, key in enumerate(map(tuple, unique_keys.tolist())):
+            cached = self.cache.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                values[i] = cached
+        if missing:  # One batched backend call for all misses
+            miss_keys = unique_keys[missing]
+            computed = np.stack(self.backend.props_pt(miss_keys[:, 0] * self.p_quantum_bar,
+                                                      miss_keys[:, 1] * self.t_quantum_c), axis=1)
+            values[missing] = computed
+            for key, row in zip(map(tuple, miss_keys.tolist()), computed.tolist()):
+                self.cache.put(key, tuple(row))
+        values = values[inverse.ravel()]
+        return tuple(values[:, j].reshape(p_bar.shape) for j in range(3))
+
+    def _evaluate(self, p_key: int, t_key: int) -> Tuple:
+        return tuple(float(x) for x in self.backend.props_pt(p_key * self.p_quantum_bar, t_key * self.t_quantum_c))
+
+    def stats(self) -> Dict[str, int]:
+        return self.cache.stats()
+
+
+def grid_key(p_range_bar=(20.0, 200.0), t_range_c=(300.0, 600.0), dp_bar=1.0, dt_c=1.0,
+             superheat_margin_c=10.0) -> Dict:
+    return {
+        'format_version': GRID_FORMAT_VERSION, 'pyxsteam_version': pyXSteam.__version__,
+        'p_range_bar': [float(x) for x in p_range_bar], 't_range_c': [float(x) for x in t_range_c],
+        'dp_bar': float(dp_bar), 'dt_c': float(dt_c), 'superheat_margin_c': float(superheat_margin_c),
+    }
+
+
+def grid_cache_path(cache_dir: Optional[str] = None, **grid_kwargs) -> str:
+    """Cache file name derived from the grid key, so changed bounds or versions never collide."""
+    digest = hashlib.sha1(json.dumps(grid_key(**grid_kwargs), sort_keys=True).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"if97_grid_v{GRID_FORMAT_VERSION}_{digest}.bin")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // GRID_ALIGN) * GRID_ALIGN
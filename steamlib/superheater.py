@@ -0,0 +1,136 @@
+# steamlib/superheater.py
+# Model entry points shared by PlatenSuperheater and FinalSuperheater.
+# Each stage sets default_gain (platen 0.6 radiant, final 0.7 convective); k=None picks it.
+
+import numpy as np
+from typing import ClassVar, Dict, Optional
+from steamlib.convolution import ConvolutionEngine
+from steamlib.creep import CreepLifeAccumulator
+from steamlib.distributed import DistributedTubeModel
+from steamlib.fopdt import FopdtStream, fopdt_simulate, fopdt_step_batch, sopdt_step
+from steamlib.gain_schedule import GainSchedule
+from steamlib.lag_chain import LagChain, section_lags, sopdt_from_lags
+from steamlib.lpv import simulate_lpv
+from steamlib.sensitivity import sobol_indices
+from steamlib.steam_properties import CachedBackend, check_superheated, lumped_properties, operating_point_arrays
+from steamlib.tube_bank import TubeBankModel
+from steamlib.tuning import tune_pid
+from steamlib.uncertainty import MonteCarlo
+
+
+class SuperheaterModels:
+    """Batch properties, FOPDT/SOPDT/LPV responses, tuning and analysis for a superheater stage.
+
+    Needs the stage's YAML geometry (total_length_m, sections, tube sizes,
+    a_total_m2, outer_surface_m2, ...) and property_backend.
+    """
+    default_gain: ClassVar[float] = 0.6  # Temperature gain k of the stage FOPDT
+    bank_attribute: ClassVar[str]  # YAML count of parallel tube banks: 'n_panels' (platen) / 'n_coils' (final)
+
+    def _gain(self, k: Optional[float]) -> float:
+        return self.default_gain if k is None else k
+
+    @property
+    def n_banks(self) -> int:
+        """Panels (platen) or coils (final) in parallel."""
+        return getattr(self, self.bank_attribute)
+
+    @property
+    def tubes_per_bank(self) -> int:
+        return self.total_tube_count // self.n_banks
+
+    def calculate_properties_batch(self, p_bar, t_c=None, steam_flow_th=None) -> Dict[str, np.ndarray]:
+        """Array-in/array-out calculate_properties (arrays or structured array/DataFrame)."""
+        p_bar, t_c, steam_flow_th = operating_point_arrays(p_bar, t_c, steam_flow_th)
+        h_kjkg, cp_kjkgk, v_m3kg = self.property_backend.props_pt(p_bar, t_c)
+        props = self._lumped_properties(h_kjkg, cp_kjkgk, 1 / v_m3kg, steam_flow_th)
+        return {key: np.broadcast_to(value, p_bar.shape).astype(float) for key, value in props.items()}
+
+    def property_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Hit/miss/eviction counters of the property cache (None when disabled)."""
+        if isinstance(self.property_backend, CachedBackend):
+            return self.property_backend.stats()
+        return None
+
+    def _lumped_properties(self, h_kjkg, cp_kjkgk, rho_kgm3, steam_flow_th) -> Dict:
+        return lumped_properties(h_kjkg, cp_kjkgk, rho_kgm3, steam_flow_th, self.a_total_m2,
+                                 self.total_length_m, self.outer_surface_m2, self.U_W_m2K_low_load)
+
+    def fopdt_step_response_batch(self, t: np.ndarray, k=None, theta_s=0.0, tau_s=0.0, dtype=np.float64,
+                                  max_chunk_bytes: int = 64 * 2**20) -> np.ndarray:
+        """FOPDT for arrays of (k, θ, τ) on a shared t -> (n_params, n_t); float32 halves memory."""
+        return fopdt_step_batch(t, self._gain(k), theta_s, tau_s, dtype, max_chunk_bytes)
+
+    def sopdt_step_response(self, t: np.ndarray, k: Optional[float] = None, theta_s: float = 0, tau1_s: float = 0,
+                            tau2_s: float = 0) -> np.ndarray:
+        """SOPDT response for temp rise (closed form)."""
+        return sopdt_step(t, self._gain(k), theta_s, tau1_s, tau2_s)
+
+    def section_lag_chain(self, props: Dict, k: Optional[float] = None) -> LagChain:
+        """Tanks in series, one per YAML section, τ_i = tau_s * length share (dead time theta_s)."""
+        return LagChain(self._gain(k), props['theta_s'], section_lags(self.sections, props['tau_s']))
+
+    def sopdt_parameters(self, props: Dict) -> Dict[str, float]:
+        """theta_s/tau1_s/tau2_s moment-matched to the section lag chain."""
+        return sopdt_from_lags(props['theta_s'], section_lags(self.sections, props['tau_s']))
+
+    def fopdt_simulate(self, u: np.ndarray, dt: float, k: Optional[float] = None, theta_s: float = 0,
+                       tau_s: float = 0, u_initial: float = 0.0) -> np.ndarray:
+        """FOPDT response to an arbitrary input (spray valve, firing rate) sampled every dt."""
+        return fopdt_simulate(u, dt, self._gain(k), theta_s, tau_s, u_initial)
+
+    def convolution_engine(self, dt: float, props: Dict, k: Optional[float] = None,
+                           tol: float = 1e-9) -> ConvolutionEngine:
+        """Precomputed impulse response at one operating point (props from calculate_properties)."""
+        return ConvolutionEngine.from_properties(dt, self._gain(k), props, tol)
+
+    def fopdt_stream(self, dt: float, props: Dict, k: Optional[float] = None, u_initial: float = 0.0,
+                     max_theta_s: Optional[float] = None) -> FopdtStream:
+        """Streaming FOPDT for live data; refresh with stream.update_from_properties() as load moves."""
+        return FopdtStream(dt, self._gain(k), float(props['theta_s']), float(props['tau_s']), u_initial, max_theta_s)
+
+    def lpv_simulate(self, p_bar, t_c, steam_flow_th, u, dt: float, k: Optional[float] = None,
+                     u_initial: float = 0.0) -> Dict[str, np.ndarray]:
+        """FOPDT with θ/τ recomputed along a p, T, flow trajectory (e.g. startup); adds 'y'."""
+        return simulate_lpv(self, p_bar, t_c, steam_flow_th, u, dt, self._gain(k), u_initial)
+
+    def tune_pid(self, p_bar, t_c, steam_flow_th, k: Optional[float] = None, superheat_margin_c: float = 5.0,
+                 **kwargs) -> Dict[str, np.ndarray]:
+        """PI/PID gains per operating point from theta_s/tau_s (see steamlib.tuning.tune_pid).
+
+        Points closer than superheat_margin_c to saturation raise ValueError (check_superheated).
+        """
+        p_bar, t_c, steam_flow_th = operating_point_arrays(p_bar, t_c, steam_flow_th)
+        check_superheated(p_bar, t_c, superheat_margin_c)
+        props = self.calculate_properties_batch(p_bar, t_c, steam_flow_th)
+        return tune_pid(self._gain(k), props['theta_s'], props['tau_s'], **kwargs)
+
+    def gain_schedule(self, flow_th, p_bar, k: Optional[float] = None, **kwargs) -> GainSchedule:
+        """Gains over a steam flow x pressure grid for runtime scheduling (see GainSchedule.generate)."""
+        return GainSchedule.generate(self, flow_th, p_bar, k=self._gain(k), **kwargs)
+
+    def monte_carlo(self, parameters, p_bar: float, steam_flow_th: float, k: Optional[float] = None,
+                    **kwargs) -> MonteCarlo:
+        """Uncertainty bands on theta_s/tau_s/outlet response; run with .run(n_samples) (see MonteCarlo)."""
+        return MonteCarlo(self, parameters, p_bar=p_bar, steam_flow_th=steam_flow_th, k=self._gain(k), **kwargs)
+
+    def sobol_sensitivity(self, p_bar: float, parameters=None, n_samples: int = 1 << 12, **kwargs) -> Dict:
+        """Sobol indices of theta_s/tau_s to the YAML geometry and U (see steamlib.sensitivity.sobol_indices)."""
+        return sobol_indices(self, p_bar, parameters, n_samples, **kwargs)
+
+    def distributed_model(self, p_bar: float, cell_length_m: float = 1.0, n_paths: int = 1) -> DistributedTubeModel:
+        """1-D finite-volume tube over the YAML sections (steam enthalpy + metal temperature per cell).
+
+        n_paths=self.total_tube_count tracks every tube; pass a (n_paths, n_sections)
+        heat flux to simulate() and check_metal_limits() the result.
+        """
+        return DistributedTubeModel(self, p_bar, cell_length_m, n_paths)
+
+    def tube_bank_model(self, p_bar: float, cell_length_m: float = 1.0, **kwargs) -> TubeBankModel:
+        """Every tube as its own path with header flow maldistribution (see TubeBankModel)."""
+        return TubeBankModel(self, p_bar, cell_length_m, **kwargs)
+
+    def creep_accumulator(self, n_tubes: Optional[int] = None) -> CreepLifeAccumulator:
+        """Streaming creep-life consumption per tube and YAML section (default: every tube)."""
+        return CreepLifeAccumulator(self.sections, self.tube_od_mm, self.tube_id_mm,
+                                    n_tubes or self.total_tube_count)
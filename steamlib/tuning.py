@@ -0,0 +1,150 @@
+# steamlib/tuning.py
+# PID auto-tuning for the superheater loops: SIMC/IMC start points + closed-loop grid search.
+# Candidates are simulated together against the FOPDT (k, θ, τ) of each load point.
+
+import math
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+from steamlib.control import PID
+from steamlib.fopdt import fopdt_discretise_batch
+from steamlib.parallel import sweep_pool, worker_data
+
+KC_FACTORS = np.geomspace(0.2, 3.0, 24)  # Search grid relative to the start point
+TI_FACTORS = np.geomspace(0.2, 3.0, 16)
+TD_FACTORS = (0.0, 0.5, 1.0, 2.0)  # x IMC derivative time (PID mode only)
+
+
+def simc_pi(k, theta_s, tau_s, tc_s=None) -> Tuple[np.ndarray, np.ndarray]:
+    """SIMC PI (Skogestad): kc = τ / (k (τc + θ)), ti = min(τ, 4 (τc + θ)); τc defaults to θ."""
+    k, theta_s, tau_s = (np.asarray(x, dtype=float) for x in (k, theta_s, tau_s))
+    tc_s = theta_s if tc_s is None else np.asarray(tc_s, dtype=float)
+    tau = np.maximum(tau_s, 1e-3 * (theta_s + 1e-3))  # Pure delay: integral-only limit
+    return tau / (k * (tc_s + theta_s)), np.minimum(tau, 4 * (tc_s + theta_s))
+
+
+def imc_pid(k, theta_s, tau_s, lambda_s=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """IMC PID for FOPDT (Rivera et al.): ti = τ + θ/2, td = τθ / (2τ + θ); λ defaults to θ."""
+    k, theta_s, tau_s = (np.asarray(x, dtype=float) for x in (k, theta_s, tau_s))
+    lambda_s = theta_s if lambda_s is None else np.asarray(lambda_s, dtype=float)
+    ti = tau_s + theta_s / 2
+    return ti / (k * (lambda_s + theta_s / 2)), ti, tau_s * theta_s / np.maximum(2 * tau_s + theta_s, 1e-9)
+
+
+def fopdt_closed_loop(k, theta_s, tau_s, pid: PID, dt: float, n_steps: int, disturbance_step: Optional[int] = None,
+                      record: bool = False) -> Dict[str, np.ndarray]:
+    """Unit setpoint step at t = 0, then an input disturbance worth -1 at the output from
+    sample disturbance_step (default n_steps // 2). Gains in `pid` may be arrays (one loop each).
+
+    Returns 'ise', 'iae', 'overshoot' (fraction of the setpoint step, before the
+    disturbance); unstable loops score inf. 'y' (n_steps, n) when record.
+    """
+    n_d = n_steps // 2 if disturbance_step is None else disturbance_step
+    shape = np.broadcast_shapes(np.shape(k), np.shape(theta_s), np.shape(tau_s), np.shape(pid.kp),
+                                np.shape(pid.ti_s), np.shape(pid.td_s))
+    a, b0, b1, d = (np.broadcast_to(x, shape) for x in fopdt_discretise_batch(dt, k, theta_s, tau_s))
+    load = -1.0 / np.broadcast_to(np.asarray(k, dtype=float), shape)  # Input step giving -1 at steady state
+    size = int(d.max()) + 2
+    buffer = np.zeros((size,) + shape)
+    cols = np.indices(shape) if shape else ()
+    y = np.zeros(shape)
+    pid.reset(dt, y, np.zeros(shape), 0.0)  # Setpoint 0 before t = 0: the step hits the P term
+    ise, iae, peak = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+    trace = np.empty((n_steps,) + shape) if record else None
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(n_steps):
+            u = pid.step(1.0, y)
+            buffer[i % size] = u + (load if i >= n_d else 0.0)
+            e = 1.0 - y
+            ise += e * e * dt
+            iae += np.abs(e) * dt
+            if i < n_d:
+                np.maximum(peak, y, out=peak)
+            if record:
+                trace[i] = y
+            y = a * y + b0 * buffer[((i - d) % size, *cols)] + b1 * buffer[((i - d - 1) % size, *cols)]
+    unstable = ~np.isfinite(iae) | (np.abs(y) > 1e6)
+    result = {'ise': np.where(unstable, np.inf, ise), 'iae': np.where(unstable, np.inf, iae),
+              'overshoot': np.where(unstable, np.inf, np.maximum(peak - 1.0, 0.0))}
+    if record:
+        result['y'] = trace
+    return result
+
+
+def tune_pid(k, theta_s, tau_s, dt: float = 0.25, mode: str = 'pi', criterion: str = 'iae',
+             overshoot_weight: float = 0.0, overshoot_limit: float = np.inf, horizon_s=None,
+             kc_factors: Sequence[float] = KC_FACTORS, ti_factors: Sequence[float] = TI_FACTORS,
+             td_factors: Sequence[float] = TD_FACTORS, refine: int = 1, workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Best PI/PID gains per load point (arrays of k, θ, τ) by closed-loop grid search.
+
+    Starts from SIMC (PI) / IMC (PID) gains, scores every grid candidate by
+    criterion ('ise' or 'iae') + overshoot_weight * overshoot, excluding
+    overshoot > overshoot_limit, then `refine` times zooms a 5x5(x3) grid
+    around the best. horizon_s defaults to 40 (θ + τ) per load point.
+    workers > 1 evaluates load points in a process pool; the sweep data is
+    shipped once per worker, tasks carry only indices.
+    """
+    if mode not in ('pi', 'pid') or criterion not in ('ise', 'iae'):
+        raise ValueError(f"mode must be 'pi'/'pid' and criterion 'ise'/'iae', got {mode!r}/{criterion!r}")
+    k, theta_s, tau_s = (np.atleast_1d(x).astype(float) for x in np.broadcast_arrays(k, theta_s, tau_s))
+    if mode == 'pi':
+        kc0, ti0 = simc_pi(k, theta_s, tau_s)
+        td0 = np.zeros_like(kc0)
+        td_factors = (0.0,)
+    else:
+        kc0, ti0, td0 = imc_pid(k, theta_s, tau_s)
+    horizon = 40 * (theta_s + tau_s) if horizon_s is None else np.broadcast_to(np.asarray(horizon_s, dtype=float), k.shape)
+    shared = {'k': k, 'theta_s': theta_s, 'tau_s': tau_s, 'n_steps': np.ceil(horizon / dt).astype(int), 'dt': dt,
+              'criterion': criterion, 'overshoot_weight': overshoot_weight, 'overshoot_limit': overshoot_limit,
+              'kc_factors': np.asarray(kc_factors, dtype=float), 'ti_factors': np.asarray(ti_factors, dtype=float),
+              'td_factors': np.asarray(td_factors, dtype=float)}
+    centres = [(kc0[i], ti0[i], td0[i], None) for i in range(k.size)]
+    with sweep_pool(shared, workers) as run:
+        best = run(_search, [(i,) + centres[i] for i in range(k.size)])
+        zoom = 1.0
+        for _ in range(refine):
+            zoom /= 2
+            best = run(_search, [(i, b['kc'], b['ti_s'], b['td_s'], zoom) for i, b in enumerate(best)])
+    out = {key: np.array([b[key] for b in best]) for key in best[0]}
+    out.update(start_kc=kc0, start_ti_s=ti0, start_td_s=td0)
+    return out
+
+
+def spray_valve_pid(gains: Dict[str, np.ndarray], valve_gain_c_per_pct, u_min: float = 0.0,
+                    u_max: float = 100.0) -> PID:
+    """PID driving the spray valve [%] from gains tuned for the temperature-to-temperature stage.
+
+    tune_pid/GainSchedule tune against the stage FOPDT with k > 0 (°C outlet per
+    °C attemperator outlet), so kc > 0. A single SprayLoop (slave None) moves
+    the valve instead, through the attemperator gain (Attemperator.valve_gain,
+    °C/%, negative): the plant gain becomes k * valve_gain, so kp = kc / valve_gain
+    (< 0, direct acting) while ti/td carry over. A cascade master, which sets the
+    attemperator outlet setpoint, uses kc as is.
+    """
+    kp = np.asarray(gains['kc'], dtype=float) / np.asarray(valve_gain_c_per_pct, dtype=float)
+    return PID(kp=kp, ti_s=np.asarray(gains['ti_s'], dtype=float), td_s=np.asarray(gains['td_s'], dtype=float),
+               u_min=u_min, u_max=u_max)
+
+
+def _search(task) -> Dict[str, float]:
+    """Evaluate one load point's candidate grid (full grid around the start, or a zoomed 5x5x3)."""
+    i, kc, ti, td, zoom = task
+    s = worker_data
+    if zoom is None:
+        kcf, tif, tdf = s['kc_factors'], s['ti_factors'], s['td_factors']
+    else:
+        kcf = np.exp(np.linspace(-2, 2, 5) * _log_step(s['kc_factors']) * zoom)
+        tif = np.exp(np.linspace(-2, 2, 5) * _log_step(s['ti_factors']) * zoom)
+        tdf = np.exp(np.linspace(-1, 1, 3) * zoom) if td > 0 else np.zeros(1)
+    grid = [g.ravel() for g in np.meshgrid(kc * kcf, ti * tif, np.unique(td * tdf), indexing='ij')]
+    pid = PID(kp=grid[0], ti_s=grid[1], td_s=grid[2])
+    metrics = fopdt_closed_loop(s['k'][i], s['theta_s'][i], s['tau_s'][i], pid, s['dt'], int(s['n_steps'][i]))
+    ok = np.isfinite(metrics[s['criterion']]) & (metrics['overshoot'] <= s['overshoot_limit'])
+    overshoot = np.where(ok, metrics['overshoot'], 0.0)
+    score = np.where(ok, metrics[s['criterion']] + s['overshoot_weight'] * overshoot, np.inf)
+    j = int(np.argmin(score))
+    return {'kc': float(pid.kp[j]), 'ti_s': float(pid.ti_s[j]), 'td_s': float(pid.td_s[j]), 'score': float(score[j]),
+            'ise': float(metrics['ise'][j]), 'iae': float(metrics['iae'][j]), 'overshoot': float(metrics['overshoot'][j])}
+
+
+def _log_step(factors: np.ndarray) -> float:
+    return math.log(factors[-1] / factors[0]) / (len(factors) - 1) if len(factors) > 1 else 0.0
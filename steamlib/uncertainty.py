@@ -0,0 +1,261 @@
+# steamlib/uncertainty.py
+# Monte Carlo propagation of parameter uncertainty (U, tube dimensions, flow) to theta_s, tau_s and the outlet response.
+# Quasi-random batches through the vectorized lumped model; percentile bands from a mergeable streaming sketch.
+
+import warnings
+from dataclasses import dataclass, field
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+from typing import Dict, List, Optional, Sequence, Tuple
+from steamlib.fopdt import fopdt_step_batch
+from steamlib.parallel import map_batches, worker_data
+from steamlib.steam_properties import check_superheated, lumped_properties, tube_geometry
+
+SAMPLED = ('U_W_m2K_low_load', 'tube_id_mm', 'tube_od_mm', 'total_length_m', 'n_panels', 'n_coils',
+           'steam_flow_th', 'k')
+DISTRIBUTIONS = ('uniform', 'normal', 'lognormal')
+
+
+def nominal_parameters(sh, p_bar: float, t_c: Optional[float] = None, steam_flow_th: float = 500.0,
+                       k: float = 0.6, superheat_margin_c: float = 5.0) -> Dict[str, float]:
+    """Plain-float YAML geometry, operating point and steam state (t_c defaults to setpoint_inlet_C).
+
+    Steam properties are looked up once here, so sampled_properties() needs no
+    property backend and the dict can be shipped to worker processes. The
+    lumped model is for superheated steam: t_c closer than superheat_margin_c
+    to Tsat(p_bar) raises ValueError.
+    """
+    t_c = sh.setpoint_inlet_C if t_c is None else t_c
+    check_superheated(p_bar, t_c, superheat_margin_c)
+    h_kjkg, cp_kjkgk, v_m3kg = sh.property_backend.props_pt(float(p_bar), float(t_c))
+    return {'U_W_m2K_low_load': float(sh.U_W_m2K_low_load), 'tube_id_mm': float(sh.tube_id_mm),
+            'tube_od_mm': float(sh.tube_od_mm), 'total_length_m': float(sh.total_length_m),
+            sh.bank_attribute: float(sh.n_banks), 'tubes_per_bank': float(sh.total_tube_count / sh.n_banks),
+            'steam_flow_th': float(steam_flow_th), 'k': float(k), 'p_bar': float(p_bar), 't_c': float(t_c),
+            'setpoint_outlet_C': float(sh.setpoint_outlet_C),
+            'h_kjkg': float(h_kjkg), 'cp_kjkgk': float(cp_kjkgk), 'rho_kgm3': 1 / float(v_m3kg)}
+
+
+def sampled_properties(nominal: Dict[str, float], samples: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """calculate_properties for arrays of overridden parameters (tube_geometry + lumped_properties, as the superheaters)."""
+    p = dict(nominal, **samples)
+    banks = np.rint(p['n_panels'] if 'n_panels' in p else p['n_coils'])
+    _, a_total_m2, outer_surface_m2 = tube_geometry(banks * p['tubes_per_bank'], np.asarray(p['tube_id_mm']),
+                                                    np.asarray(p['tube_od_mm']), p['total_length_m'])
+    return lumped_properties(p['h_kjkg'], p['cp_kjkgk'], p['rho_kgm3'], p['steam_flow_th'], a_total_m2,
+                             p['total_length_m'], outer_surface_m2, p['U_W_m2K_low_load'])
+
+
+def unit_samples(n: int, d: int, method: str = 'sobol', seed: int = 0, start: int = 0) -> np.ndarray:
+    """Points start..start+n-1 of a reproducible (n, d) design in (0, 1).
+
+    'sobol' is one scrambled sequence however it is batched (power-of-2
+    batches keep its balance); 'lhs' is stratified within each batch;
+    'random' is plain Monte Carlo.
+    """
+    if method == 'sobol':
+        engine = qmc.Sobol(d, scramble=True, seed=seed)
+        if start:
+            engine.fast_forward(start)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # Balance warning for non power-of-2 batches
+            u = engine.random(n)
+    elif method == 'lhs':
+        u = qmc.LatinHypercube(d, seed=np.random.default_rng([seed, start])).random(n)
+    elif method == 'random':
+        u = np.random.default_rng([seed, start]).random((n, d))
+    else:
+        raise ValueError(f"method must be 'sobol', 'lhs' or 'random', got {method!r}")
+    return np.clip(u, 1e-12, 1 - 1e-12)
+
+
+def scale_samples(u: np.ndarray, parameters: Dict[str, Tuple[str, float, float]]) -> Dict[str, np.ndarray]:
+    """Map unit-cube columns to parameters: ('uniform', low, high), ('normal', mean, sd) or
+    ('lognormal', median, sigma of ln)."""
+    out = {}
+    for j, (name, (kind, a, b)) in enumerate(parameters.items()):
+        if kind == 'uniform':
+            out[name] = a + (b - a) * u[:, j]
+        elif kind == 'normal':
+            out[name] = a + b * ndtri(u[:, j])
+        elif kind == 'lognormal':
+            out[name] = a * np.exp(b * ndtri(u[:, j]))
+        else:
+            raise ValueError(f"{name}: distribution must be one of {DISTRIBUTIONS}, got {kind!r}")
+    return out
+
+
+class StreamingQuantiles:
+    """Quantiles of many channels (e.g. one per time point) in O(channels * bins) memory.
+
+    Fixed-count histogram per channel; when data leave the range the bin
+    width doubles (adjacent bins merge), so a quantile is exact to one bin
+    width, about range / bins. Mean/std/min/max are tracked exactly.
+    Sketches merge (process pools) to within one bin as well.
+    """
+
+    def __init__(self, n_channels: int = 1, bins: int = 1024):
+        self.bins = bins + bins % 2  # Even, so bins merge in pairs
+        self.counts = np.zeros((n_channels, self.bins), dtype=np.int64)
+        self.lo: Optional[np.ndarray] = None
+        self.width: Optional[np.ndarray] = None
+        self.n = 0
+        self._shift = self._sum = self._sumsq = None
+        self.min = np.full(n_channels, np.inf)
+        self.max = np.full(n_channels, -np.inf)
+
+    def update(self, x, weights=None):
+        """Add samples x (n,) or (n, n_channels); weights are integer multiplicities."""
+        x = np.asarray(x, dtype=float).reshape(len(x), -1)
+        if not len(x):
+            return
+        w = np.ones(len(x), dtype=np.int64) if weights is None else np.asarray(weights, dtype=np.int64)
+        lo, hi = x.min(axis=0), x.max(axis=0)
+        if self.lo is None:
+            span = hi - lo
+            self.width = np.maximum(span / (self.bins - 1), np.maximum(np.abs(lo), 1.0) * 1e-12)
+            self.lo = lo - self.width / 2
+            self._shift = x.mean(axis=0)
+            self._sum, self._sumsq = np.zeros_like(lo), np.zeros_like(lo)
+        self._grow(lo, hi)
+        idx = np.clip(((x - self.lo) / self.width).astype(np.int64), 0, self.bins - 1)
+        idx += np.arange(self.counts.shape[0]) * self.bins
+        self.counts += np.bincount(idx.ravel(), np.repeat(w, x.shape[1]),
+                                   minlength=self.counts.size).astype(np.int64).reshape(self.counts.shape)
+        centred = x - self._shift
+        self._sum += w @ centred
+        self._sumsq += w @ (centred * centred)
+        self.n += int(w.sum())
+        np.minimum(self.min, lo, out=self.min)
+        np.maximum(self.max, hi, out=self.max)
+
+    def merge(self, other: 'StreamingQuantiles'):
+        """Fold in another sketch of the same channels (its bin centres re-binned here)."""
+        if other.lo is None:
+            return
+        centres = other.lo[:, None] + other.width[:, None] * (np.arange(other.bins) + 0.5)
+        if self.lo is None:
+            self.lo, self.width = other.lo.copy(), other.width.copy()
+            self._shift = other._shift.copy()
+            self._sum, self._sumsq = np.zeros_like(self.lo), np.zeros_like(self.lo)
+        self._grow(other.min, other.max)  # Occupied centres lie within half a bin of these
+        idx = np.clip(((centres - self.lo[:, None]) / self.width[:, None]).astype(np.int64), 0, self.bins - 1)
+        for channel in range(self.counts.shape[0]):
+            np.add.at(self.counts[channel], idx[channel], other.counts[channel])
+        delta = other._shift - self._shift  # Re-centre the other's moments
+        self._sumsq += other._sumsq + 2 * delta * other._sum + other.n * delta ** 2
+        self._sum += other._sum + other.n * delta
+        self.n += other.n
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+
+    def quantile(self, q) -> np.ndarray:
+        """(len(q), n_channels), linear within the bin; q scalar gives (n_channels,)."""
+        q = np.asarray(q, dtype=float)
+        if self.n == 0:
+            return np.full(q.shape + (self.counts.shape[0],), np.nan)
+        cum = np.cumsum(self.counts, axis=1)
+        rows = np.arange(self.counts.shape[0])
+        out = []
+        for target in np.atleast_1d(q).ravel() * self.n:
+            i = np.minimum((cum < target).sum(axis=1), self.bins - 1)
+            before = np.where(i > 0, cum[rows, np.maximum(i - 1, 0)], 0)
+            inside = np.clip((target - before) / np.maximum(self.counts[rows, i], 1), 0.0, 1.0)
+            out.append(np.clip(self.lo + self.width * (i + inside), self.min, self.max))
+        return np.array(out).reshape(q.shape + (self.counts.shape[0],))
+
+    def mean(self) -> np.ndarray:
+        return self._shift + self._sum / self.n
+
+    def std(self) -> np.ndarray:
+        mean_c = self._sum / self.n
+        return np.sqrt(np.maximum(self._sumsq / self.n - mean_c ** 2, 0.0) * self.n / max(self.n - 1, 1))
+
+    def summary(self, quantiles: Sequence[float]) -> Dict[str, np.ndarray]:
+        return {'mean': self.mean(), 'std': self.std(), 'min': self.min.copy(), 'max': self.max.copy(),
+                'bands': self.quantile(quantiles)}
+
+    def _grow(self, lo: np.ndarray, hi: np.ndarray):
+        """Double bin widths per channel until [lo, hi] fits; the old range becomes one half."""
+        half = self.bins // 2
+        while True:
+            below = lo < self.lo
+            above = ~below & (hi >= self.lo + self.width * self.bins)
+            grow = below | above
+            if not grow.any():
+                return
+            merged = self.counts[grow, 0::2] + self.counts[grow, 1::2]
+            counts = np.zeros_like(self.counts[grow])
+            down = below[grow]
+            counts[down, half:] = merged[down]
+            counts[~down, :half] = merged[~down]
+            self.counts[grow] = counts
+            self.lo = np.where(below, self.lo - self.width * self.bins, self.lo)
+            self.width = np.where(grow, self.width * 2, self.width)
+
+
+@dataclass
+class MonteCarlo:
+    """Uncertainty bands on theta_s, tau_s and the outlet step response of a superheater.
+
+    parameters maps names in SAMPLED to distributions (see scale_samples),
+    e.g. {'U_W_m2K_low_load': ('normal', 900, 90), 'steam_flow_th': ('uniform', 400, 600)};
+    n_panels / n_coils samples are rounded. Everything else stays at the YAML
+    values and the operating point. The outlet response is
+    setpoint_outlet_C + k * step * FOPDT unit step on t_s.
+    """
+    sh: object  # PlatenSuperheater / FinalSuperheater
+    parameters: Dict[str, Tuple[str, float, float]]
+    p_bar: float  # No default: the superheated range differs per stage (see nominal_parameters)
+    t_c: Optional[float] = None  # Default setpoint_inlet_C
+    steam_flow_th: float = 500.0
+    k: float = 0.6
+    step: float = 1.0  # Input step size for the outlet response
+    t_s: np.ndarray = field(default_factory=lambda: np.arange(0.0, 1800.0 + 1e-9, 5.0))
+    method: str = 'sobol'
+    seed: int = 0
+    quantiles: Tuple[float, ...] = (0.05, 0.5, 0.95)
+    bins: int = 1024
+
+    def __post_init__(self):
+        unknown = set(self.parameters) - set(SAMPLED)
+        if unknown:
+            raise ValueError(f"cannot sample {sorted(unknown)}; choose from {SAMPLED}")
+        self.t_s = np.asarray(self.t_s, dtype=float)
+        self.nominal = nominal_parameters(self.sh, self.p_bar, self.t_c, self.steam_flow_th, self.k)
+
+    def run(self, n_samples: int, batch_size: int = 1 << 13, workers: Optional[int] = None) -> Dict:
+        """Stream n_samples through in batches; memory is O(batch_size * len(t_s)) regardless of n_samples.
+
+        workers > 1 splits the batches over a process pool (each worker keeps its
+        own sketches, merged at the end). Returns per output mean/std/min/max
+        and 'bands' at `quantiles` (rows), plus 'n_samples', 'quantiles', 't_s'.
+        """
+        batches = [(start, min(batch_size, n_samples - start)) for start in range(0, n_samples, batch_size)]
+        shared = {'nominal': self.nominal, 'parameters': dict(self.parameters), 't_s': self.t_s, 'step': self.step,
+                  'method': self.method, 'seed': self.seed, 'bins': self.bins}
+        parts = map_batches(_evaluate, batches, shared, workers)
+        scalars, outlet = parts[0]
+        for part_scalars, part_outlet in parts[1:]:
+            scalars.merge(part_scalars)
+            outlet.merge(part_outlet)
+        summary = scalars.summary(self.quantiles)
+        out = {name: {key: value[..., i] for key, value in summary.items()} for i, name in enumerate(('theta_s', 'tau_s'))}
+        out.update(outlet_c=outlet.summary(self.quantiles), n_samples=n_samples, quantiles=tuple(self.quantiles),
+                   t_s=self.t_s)
+        return out
+
+
+def _evaluate(batches: List[Tuple[int, int]]) -> Tuple[StreamingQuantiles, StreamingQuantiles]:
+    s = worker_data
+    parameters, nominal = s['parameters'], s['nominal']
+    scalars, outlet = StreamingQuantiles(2, s['bins']), StreamingQuantiles(s['t_s'].size, s['bins'])
+    for start, size in batches:
+        samples = scale_samples(unit_samples(size, len(parameters), s['method'], s['seed'], start), parameters)
+        props = sampled_properties(nominal, samples)
+        theta_s, tau_s = np.broadcast_arrays(props['theta_s'], props['tau_s'], np.empty(size))[:2]
+        scalars.update(np.stack([theta_s, tau_s], axis=1))
+        gain = np.broadcast_to(samples.get('k', nominal['k']) * s['step'], (size,))
+        outlet.update(nominal['setpoint_outlet_C'] + fopdt_step_batch(s['t_s'], gain, theta_s, tau_s))
+    return scalars, outlet
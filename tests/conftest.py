@@ -0,0 +1,22 @@
+import os
+import pytest
+from steamlib.final_superheater import FinalSuperheater
+from steamlib.platen_superheater import PlatenSuperheater
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'steamlib', 'config')
+
+
+@pytest.fixture(scope='session')
+def final():
+    return FinalSuperheater(config_file=os.path.join(CONFIG_DIR, 'final_superheater.yaml'))
+
+
+@pytest.fixture(scope='session')
+def platen():
+    return PlatenSuperheater(config_file=os.path.join(CONFIG_DIR, 'platen_superheater.yaml'))
+
+
+@pytest.fixture(scope='session')
+def grid():
+    from steamlib.steam_properties import GridBackend
+    return GridBackend()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from steamlib.cache import LRUCache
+from steamlib.steam_properties import CachedBackend
+
+
+class CountingBackend:
+    """props_pt = (p, T, p * T), recording every point it is asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    def props_pt(self, p_bar, t_c):
+        self.calls.append((np.copy(p_bar), np.copy(t_c)))
+        return p_bar, t_c, np.multiply(p_bar, t_c)
+
+
+def test_lru_counters_and_eviction_order():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now least recently used
+    cache.put('c', 3)
+    assert cache.get('b') is None and cache.get('c') == 3
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2}
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_lru_weight_budget():
+    cache = LRUCache(10, max_weight=100, weigh=len)
+    cache.put('a', 'x' * 60)
+    cache.put('b', 'x' * 30)
+    cache.put('c', 'x' * 30)  # 120 > 100: 'a' goes
+    assert cache.get('a') is None and cache.weight == 60
+    cache.put('b', 'x' * 101)  # Too heavy to keep: the old 'b' must not survive either
+    assert cache.get('b') is None and cache.weight == 30 and len(cache) == 1
+    cache.clear()
+    assert cache.weight == 0 and len(cache) == 0
+
+
+def test_cached_backend_quantises_keys():
+    backend = CountingBackend()
+    cached = CachedBackend(backend, p_quantum_bar=0.1, t_quantum_c=0.5)
+    first = cached.props_pt(100.04, 450.2)
+    assert first == pytest.approx((100.0, 450.0, 45000.0))  # Evaluated at the node, not the raw sample
+    assert cached.props_pt(99.96, 449.8) == first  # Same node
+    assert cached.props_pt(100.06, 450.2) != first  # Next pressure node
+    assert len(backend.calls) == 2
+    assert cached.stats() == {'hits': 1, 'misses': 2, 'evictions': 0, 'size': 2, 'maxsize': 65536}
+
+
+def test_cached_backend_array_path_counts_distinct_keys():
+    backend = CountingBackend()
+    cached = CachedBackend(backend, maxsize=3, p_quantum_bar=1.0, t_quantum_c=1.0)
+    p_bar = np.array([10.2, 10.4, 20.0, 30.0, 10.0])
+    h, cp, v = cached.props_pt(p_bar, np.full(5, 400.0))
+    assert np.array_equal(h, [10.0, 10.0, 20.0, 30.0, 10.0]) and np.array_equal(v, h * 400.0)
+    assert len(backend.calls) == 1 and backend.calls[0][0].size == 3  # One batched call for the 3 misses
+    assert cached.stats()['misses'] == 3
+    cached.props_pt(np.array([10.0, 40.0]), 400.0)  # 10 hits, 40 misses and evicts the oldest (20)
+    assert cached.stats() == {'hits': 1, 'misses': 4, 'evictions': 1, 'size': 3, 'maxsize': 3}
+    cached.props_pt(20.0, 400.0)
+    assert cached.stats()['misses'] == 5 and len(backend.calls) == 3
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from steamlib.attemperator import Attemperator
+from steamlib.closed_loop import ClosedLoopSimulator, SprayLoop
+from steamlib.control import PID, SprayValve
+from steamlib.tuning import spray_valve_pid
+
+
+def _loops(platen, final, kp1=-3.0, ti1=60.0, kp2=1.0):
+    """SP1 single PI loop, SP2 cascade (as in benchmarks/bench_closed_loop.py)."""
+    sp1 = SprayLoop(platen, PID(kp=kp1, ti_s=ti1, u_min=0, u_max=100), valve=SprayValve(40.0, 5.0), k=0.6)
+    sp2 = SprayLoop(final, PID(kp=kp2, ti_s=120.0, u_min=400, u_max=560), PID(kp=-3.0, ti_s=20.0, u_min=0, u_max=100),
+                    valve=SprayValve(40.0, 5.0), k=0.7, setpoint_c=535.0)
+    return [sp1, sp2]
+
+
+def test_holds_setpoint_without_disturbance(platen, final):
+    result = ClosedLoopSimulator(_loops(platen, final)).run(600, 100.0, 500.0, 370.0)
+    for loop, out in zip((platen, final), result):
+        setpoint = 535.0 if loop is final else loop.setpoint_outlet_C
+        assert np.allclose(out['outlet_c'], setpoint, rtol=0, atol=1e-9)
+        assert np.ptp(out['valve_pct']) < 1e-9 and out['valve_pct'][0, 0] > 0  # Steady spray, not at a limit
+        assert out['iae'][0] < 1e-6 and out['valve_travel_pct'][0] < 1e-9
+
+
+def test_back_calculation_limits_integrator(platen):
+    """Valve pinned open by an over-firing step: integral held near the limit, quick recovery."""
+    n, disturbance = 700, np.r_[np.zeros(50), np.full(300, 20.0), np.zeros(350)]
+    integral, recovery = {}, {}
+    for tt_s in (None, np.inf):  # inf: no tracking
+        loop = SprayLoop(platen, PID(kp=-3.0, ti_s=60.0, u_min=0, u_max=100, tt_s=tt_s), valve=SprayValve(20.0, 5.0))
+        sim = ClosedLoopSimulator([loop])
+        sim.run(350, 100.0, 500.0, 370.0, disturbance_c=[disturbance[:350]])
+        assert loop.valve.position_pct[0] == 100.0
+        integral[tt_s] = float(loop.master._i[0])
+        valve = sim.run(n, 100.0, 500.0, 370.0, disturbance_c=[disturbance])[0]['valve_pct'][350:, 0]
+        recovery[tt_s] = np.argmax(valve < 100.0) if (valve < 100.0).any() else n
+    assert integral[None] == pytest.approx(100.0, abs=1.0)
+    assert integral[np.inf] > 200.0
+    assert recovery[None] < 30 < recovery[np.inf]
+
+
+def test_master_integrator_frozen_while_slave_saturated(final):
+    """Too small a valve for the disturbance: slave at 100 %, master setpoint stops moving."""
+    def run(n):
+        loop = SprayLoop(final, PID(kp=1.0, ti_s=120.0, u_min=300, u_max=560),
+                         PID(kp=-3.0, ti_s=20.0, u_min=0, u_max=100), valve=SprayValve(5.0, 5.0), k=0.7)
+        ClosedLoopSimulator([loop]).run(n, 100.0, 500.0, 420.0, disturbance_c=[np.r_[np.zeros(50), np.full(n - 50, 30.0)]])
+        return loop
+    short, long = run(400), run(800)
+    assert short.slave.saturated()[0] and long.slave.saturated()[0]
+    assert short.master.u_min < long.master.u[0] < short.master.u_max
+    assert long.master._i[0] == pytest.approx(short.master._i[0], abs=1e-9)
+    assert long.master.u[0] == pytest.approx(short.master.u[0], abs=1e-9)
+
+
+def test_batch_equals_single_runs(platen, final):
+    kp1, ti1, kp2 = np.array([-2.0, -4.0, -6.0]), np.array([40.0, 80.0, 120.0]), np.array([0.5, 1.0, 2.0])
+    p_bar, flow_th = np.array([90.0, 100.0, 110.0]), np.array([450.0, 500.0, 550.0])
+    disturbance = np.r_[np.zeros(60), np.full(240, 8.0)]
+    batch = ClosedLoopSimulator(_loops(platen, final, kp1, ti1, kp2)).run(
+        300, p_bar, flow_th, 370.0, disturbance_c=[disturbance, None])
+    for j in range(3):
+        single = ClosedLoopSimulator(_loops(platen, final, kp1[j], ti1[j], kp2[j])).run(
+            300, p_bar[j], flow_th[j], 370.0, disturbance_c=[disturbance, None])
+        for b, s in zip(batch, single):
+            for key, value in s.items():
+                assert np.allclose(b[key][..., j], value[..., 0], rtol=1e-12, atol=1e-9), key
+
+
+def test_tuned_stage_gains_drive_the_valve(platen):
+    """tune_pid gains (temperature loop, kc > 0) converted through the attemperator valve gain."""
+    att = Attemperator()
+    p_bar, flow_th, t_up = 100.0, 500.0, 370.0
+    spray = att.spray_for_outlet(p_bar, t_up, flow_th, platen.setpoint_inlet_C, 200.0)
+    valve_gain = att.valve_gain(p_bar, t_up, flow_th, 200.0, 40.0, spray)
+    step = (att.mix(p_bar, t_up, flow_th, spray + 0.2, 200.0)['t_out_c']
+            - att.mix(p_bar, t_up, flow_th, spray - 0.2, 200.0)['t_out_c'])  # 1 % of a 40 t/h valve
+    assert valve_gain == pytest.approx(step, rel=1e-4)
+    gains = platen.tune_pid(p_bar, platen.setpoint_inlet_C, flow_th + spray)
+    pid = spray_valve_pid(gains, valve_gain)
+    assert gains['kc'][0] > 0 > pid.kp[0] and pid.ti_s[0] == gains['ti_s'][0]
+    loop = SprayLoop(platen, pid, valve=SprayValve(40.0, 5.0), k=0.6, sensor_tau_s=0.0)
+    disturbance = np.r_[np.zeros(20), np.full(580, 5.0)]
+    out = ClosedLoopSimulator([loop], dt=0.25).run(600, p_bar, flow_th, t_up, disturbance_c=[disturbance])[0]
+    assert out['max_error_c'][0] < 0.6 * 5.0  # Better than the open-loop offset
+    assert out['outlet_c'][-1, 0] == pytest.approx(platen.setpoint_outlet_C, abs=1e-3)
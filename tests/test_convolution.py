@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+from steamlib.convolution import ConvolutionEngine
+from steamlib.fopdt import fopdt_simulate
+
+
+@pytest.mark.parametrize('method', ['direct', 'fft'])
+def test_batched_apply_matches_fopdt_simulate(method):
+    rng = np.random.default_rng(0)
+    u = rng.normal(size=(3, 4, 600))
+    engine = ConvolutionEngine.from_fopdt(1.0, 0.7, 12.5, 40.0)
+    y = engine.apply(u, u_initial=0.3, method=method)
+    assert y.shape == u.shape
+    assert np.allclose(y, fopdt_simulate(u, 1.0, 0.7, 12.5, 40.0, u_initial=0.3), atol=1e-8)
+
+
+def test_direct_and_fft_agree_on_short_taps():
+    rng = np.random.default_rng(1)
+    engine = ConvolutionEngine.from_fopdt(1.0, 0.7, 3.0, 5.0, tol=1e-6)
+    u = rng.normal(size=(50, 2000))
+    assert np.allclose(engine.apply(u, method='direct'), engine.apply(u, method='fft'), atol=1e-10)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+
+def _chunks(n_sections, n_chunks=6, size=50, n_tubes=3):
+    rng = np.random.default_rng(3)
+    t = np.arange(n_chunks * size, dtype=float) * 60.0
+    metal = 560.0 + 20.0 * rng.random((t.size, n_tubes, n_sections))
+    p_bar = 160.0 + 5.0 * rng.random(t.size)
+    return [(t[i:i + size], metal[i:i + size], p_bar[i:i + size]) for i in range(0, t.size, size)]
+
+
+def _state(acc):
+    return acc.life_fraction, acc.peak_metal_c, acc.hours, acc.samples
+
+
+def test_resume_from_checkpoint_equals_single_pass(final, tmp_path):
+    chunks = _chunks(len(final.sections))
+    single = final.creep_accumulator(n_tubes=3)
+    single.consume(chunks)
+    path = str(tmp_path / 'creep.npz')
+    first = final.creep_accumulator(n_tubes=3)
+    first.consume(chunks[:4], checkpoint_path=path)
+    resumed = final.creep_accumulator(n_tubes=3)
+    assert resumed.restore(path)
+    resumed.consume(chunks[2:])  # The restarted job replays from an earlier chunk
+    for a, b in zip(_state(resumed), _state(single)):
+        assert np.allclose(a, b, rtol=1e-12, atol=0)
+    assert np.all(single.life_fraction > 0)
+
+
+def test_overlapping_replay_is_not_double_counted(final):
+    chunks = _chunks(len(final.sections))
+    acc = final.creep_accumulator(n_tubes=3)
+    acc.consume(chunks[:3])
+    before = acc.life_fraction.copy()
+    acc.update(*chunks[2])  # Fully seen block: no change
+    assert np.array_equal(acc.life_fraction, before)
+    t, metal, p_bar = (np.concatenate(parts) for parts in zip(chunks[2], chunks[3]))
+    acc.update(t, metal, p_bar)  # Half old, half new
+    single = final.creep_accumulator(n_tubes=3)
+    single.consume(chunks[:4])
+    assert np.allclose(acc.life_fraction, single.life_fraction, rtol=1e-12, atol=0)
+    assert acc.samples == single.samples == 200
+
+
+def test_missing_or_corrupt_checkpoint_raises(final, tmp_path):
+    acc = final.creep_accumulator(n_tubes=3)
+    missing = str(tmp_path / 'missing.npz')
+    with pytest.raises(FileNotFoundError):
+        acc.restore(missing)
+    assert acc.restore(missing, missing_ok=True) is False
+    corrupt = tmp_path / 'corrupt.npz'
+    corrupt.write_bytes(b'not a checkpoint')
+    with pytest.raises(ValueError, match='corrupt'):
+        acc.restore(str(corrupt))
+    acc.save(str(corrupt))
+    truncated = corrupt.read_bytes()[:200]
+    corrupt.write_bytes(truncated)
+    with pytest.raises(ValueError, match='corrupt'):
+        acc.restore(str(corrupt))
+    incomplete = str(tmp_path / 'incomplete.npz')
+    np.savez(incomplete, life_fraction=acc.life_fraction)
+    with pytest.raises(ValueError, match='corrupt'):
+        acc.restore(incomplete)
+    other = final.creep_accumulator(n_tubes=2)
+    other.save(str(tmp_path / 'other.npz'))
+    with pytest.raises(ValueError, match='layout'):
+        acc.restore(str(tmp_path / 'other.npz'))
+    assert list(tmp_path.glob('*.tmp')) == []
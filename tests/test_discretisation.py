@@ -0,0 +1,55 @@
+import math
+import numpy as np
+import pytest
+from steamlib.cache import LRUCache
+from steamlib.discretisation import DiscretisationCache, set_shared_discretisation_cache, shared_discretisation_cache
+from steamlib.lag_chain import LagChain
+
+
+@pytest.fixture
+def small_cache():
+    cache = DiscretisationCache(maxsize=256, max_bytes=256 * 2**10)
+    set_shared_discretisation_cache(cache)
+    yield cache
+    set_shared_discretisation_cache(None)
+
+
+def test_lru_weight_budget():
+    cache = LRUCache(100, max_weight=1000, weigh=len)
+    for key in range(10):
+        cache.put(key, 'x' * 300)
+    assert cache.weight <= 1000 and len(cache) == 3
+    cache.put('big', 'x' * 2000)  # Heavier than the budget: not kept
+    assert cache.get('big') is None and cache.weight <= 1000
+
+
+def test_distributed_matrices_stay_within_byte_budget(final, small_cache):
+    model = final.distributed_model(170.0, cell_length_m=2.0, n_paths=12)
+    flux = model.design_heat_flux(500.0) * np.linspace(0.8, 1.2, 12)[:, None]  # Every path distinct
+    phi, _ = model.discretise(1.0, 500.0, np.broadcast_to(flux, (12, model.n_cells)))
+    assert phi.nbytes > small_cache.stats()['max_weight']
+    stats = small_cache.stats()
+    assert stats['weight'] <= stats['max_weight'] and stats['evictions'] > 0
+
+
+def test_simulate_discrete_matches_bdf(final, small_cache):
+    model = final.distributed_model(170.0, cell_length_m=2.0)
+    x0 = model.steady_state(final.setpoint_inlet_C - 10.0, 500.0)  # Relax towards the nominal inlet
+    discrete = model.simulate_discrete(2.0, 300, final.setpoint_inlet_C, 500.0, x0=x0)
+    bdf = model.simulate(discrete['t_s'], final.setpoint_inlet_C, 500.0, x0=x0, rtol=1e-8, atol=1e-6)
+    assert np.allclose(discrete['outlet_c'], bdf['outlet_c'], atol=1e-3)
+    assert small_cache.stats()['misses'] == 1
+    model.simulate_discrete(2.0, 300, final.setpoint_inlet_C + 5.0, 500.0)
+    assert small_cache.stats()['misses'] == 1  # Same load point and dt: reused
+
+
+def test_lag_chain_matches_erlang_and_shares_discretisation(small_cache):
+    tau = 20.0
+    t = np.arange(0.0, 400.0, 1.0)
+    s = np.maximum(t - 7.5, 0.0) / tau
+    erlang = 0.7 * (1 - np.exp(-s) * sum(s ** i / math.factorial(i) for i in range(3)))
+    assert np.allclose(LagChain(0.7, 7.5, [tau] * 3).simulate(np.ones(t.size), 1.0)[1:], erlang[1:], atol=1e-11)
+    misses = small_cache.stats()['misses']
+    LagChain(0.7, 7.5, [tau] * 3).discretise(1.0)
+    assert small_cache.stats()['misses'] == misses
+    assert shared_discretisation_cache() is small_cache
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+from pyXSteam.XSteam import XSteam
+
+
+def test_design_flux_steady_state_closes_the_energy_balance(final):
+    model = final.distributed_model(170.0, cell_length_m=2.0)
+    steady = model.unpack(model.steady_state(final.setpoint_inlet_C, 500.0)[None], np.zeros(1))
+    assert steady['outlet_c'][0, 0] == pytest.approx(final.setpoint_outlet_C, abs=1e-9)
+    m_kgs = 500.0 * 1000 / 3600 / final.total_tube_count
+    absorbed_w = (model.design_heat_flux(500.0) * model.surface_m2).sum()
+    assert m_kgs * (steady['h_kjkg'][0, 0, -1] * 1000 - model.h_in_ref) == pytest.approx(absorbed_w, rel=1e-9)
+    assert np.all(steady['metal_c'] > steady['steam_c'])  # Heat flows from metal to steam everywhere
+
+
+@pytest.mark.parametrize('t_in_c, flux_scale', [(410.0, 1.0), (410.0, 1.05), (415.0, 1.0)])
+def test_distributed_model_settles_to_lumped_steady_state(final, t_in_c, flux_scale):
+    """From a perturbed start, constant inputs settle to steady_state() and the outlet to the
+    whole-tube IF97 energy balance T(p, h_in + Q / m) (within the Ts(h) linearisation)."""
+    model = final.distributed_model(170.0, cell_length_m=2.0)
+    x0 = model.steady_state(final.setpoint_inlet_C - 10.0, 500.0)
+    result = model.simulate_discrete(2.0, 600, t_in_c, 500.0, heat_flux_scale=flux_scale, x0=x0)
+    flux = model.design_heat_flux(500.0) * flux_scale
+    assert np.allclose(result['x'][-1], model.steady_state(t_in_c, 500.0, flux), rtol=1e-7)
+    steam = XSteam(XSteam.UNIT_SYSTEM_MKS)
+    m_kgs = 500.0 * 1000 / 3600 / final.total_tube_count
+    h_out_kjkg = steam.h_pt(170.0, t_in_c) + (flux * model.surface_m2).sum() / m_kgs / 1000
+    assert result['outlet_c'][-1, 0] == pytest.approx(steam.t_ph(170.0, h_out_kjkg), abs=0.1)
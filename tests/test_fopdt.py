@@ -0,0 +1,52 @@
+import numpy as np
+from steamlib.fopdt import (FopdtStream, fopdt_simulate, fopdt_step, fopdt_step_batch, fopdt_step_chunks, sopdt_simulate,
+                            sopdt_step)
+
+
+def test_stream_matches_fopdt_simulate():
+    u = np.random.default_rng(0).normal(size=2000)
+    stream = FopdtStream(1.0, 0.7, 12.4, 35.0, u_initial=0.2)
+    y = stream.step_block(u)
+    reference = fopdt_simulate(np.r_[u, 0.0], 1.0, 0.7, 12.4, 35.0, u_initial=0.2)[1:]
+    assert np.allclose(y, reference, rtol=0, atol=1e-12)
+
+
+def test_zoh_simulation_matches_step_response():
+    t = np.arange(300.0)
+    assert np.allclose(fopdt_simulate(np.ones(300), 1.0, 0.7, 12.4, 35.0), fopdt_step(t, 0.7, 12.4, 35.0), atol=1e-12)
+    assert np.allclose(sopdt_simulate(np.ones(300), 1.0, 0.7, 12.4, 35.0, 8.0), sopdt_step(t, 0.7, 12.4, 35.0, 8.0),
+                       atol=1e-5)
+
+
+def test_zero_tau_is_a_pure_delay(final):
+    t = np.arange(0.0, 60.0, 0.5)
+    delay = np.where(t > 12.0, 0.7, 0.0)
+    assert np.array_equal(fopdt_step(t, 0.7, 12.0, 0.0), delay)
+    assert np.array_equal(final.fopdt_step_response(t, theta_s=12.0, tau_s=0.0), delay)
+    assert np.allclose(fopdt_step(t, 0.7, 12.0, 1e-6), delay, atol=1e-12)  # tau -> 0 limit
+    u = np.random.default_rng(2).normal(size=200)
+    y = fopdt_simulate(u, 1.0, 0.7, 12.0, 0.0, u_initial=0.3)
+    assert np.allclose(y[:13], 0.7 * 0.3) and np.allclose(y[13:], 0.7 * u[:-13])  # Sampled: y[n] = k u[n - d - 1]
+    assert np.allclose(fopdt_simulate(u, 1.0, 0.7, 12.4, 1e-6, u_initial=0.3), y, atol=1e-12)
+    stream = FopdtStream(1.0, 0.7, 12.0, 0.0, u_initial=0.3)
+    assert np.allclose(stream.step_block(u), y[1:].tolist() + [0.7 * u[-13]])
+
+
+def test_chunked_batch_equals_one_shot():
+    t = np.linspace(0.0, 900.0, 1801)
+    rng = np.random.default_rng(3)
+    k, theta_s, tau_s = rng.uniform(0.5, 1.0, 250), rng.uniform(0.0, 60.0, 250), rng.uniform(0.0, 200.0, 250)
+    tau_s[::7] = 0.0  # Pure-delay rows mixed in
+    one_shot = fopdt_step_batch(t, k, theta_s, tau_s)
+    assert one_shot.shape == (250, t.size)
+    assert np.array_equal(one_shot[5], fopdt_step(t, k[5], theta_s[5], tau_s[5]))
+    assert np.array_equal(one_shot[7], fopdt_step(t, k[7], theta_s[7], 0.0))
+    small = fopdt_step_batch(t, k, theta_s, tau_s, max_chunk_bytes=10 * t.size * 8 + 1)
+    assert np.array_equal(small, one_shot)
+    chunks = list(fopdt_step_chunks(t, k, theta_s, tau_s, max_chunk_bytes=10 * t.size * 8))
+    assert len(chunks) == 25 and all(block.nbytes <= 10 * t.size * 8 for _, block in chunks)
+    assert np.array_equal(np.concatenate([block for _, block in chunks]), one_shot)
+    broadcast = fopdt_step_batch(t, 0.7, theta_s, 30.0)  # Scalar k, tau broadcast over the theta rows
+    assert np.array_equal(broadcast[3], fopdt_step(t, 0.7, theta_s[3], 30.0))
+    single = fopdt_step_batch(t, k, theta_s, tau_s, dtype=np.float32, max_chunk_bytes=1)
+    assert single.dtype == np.float32 and np.allclose(single, one_shot, atol=1e-6)
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from steamlib.control import PID
+from steamlib.tuning import fopdt_closed_loop
+
+
+def test_search_gains_hold_their_overshoot_limit(final):
+    schedule = final.gain_schedule([200.0, 600.0], [80.0, 120.0], method='search', overshoot_limit=0.1)
+    for row in schedule.table.reshape(-1, len(schedule.fields)):
+        r = dict(zip(schedule.fields, row))
+        n_steps = int(np.ceil(40 * (r['theta_s'] + r['tau_s']) / 0.25))
+        result = fopdt_closed_loop(r['k'], r['theta_s'], r['tau_s'], PID(kp=r['kc'], ti_s=r['ti_s']), 0.25, n_steps)
+        assert result['overshoot'] <= 0.1 + 1e-9
+
+
+def test_lookup_is_bilinear_and_clamped(final):
+    schedule = final.gain_schedule([200.0, 400.0, 600.0], [80.0, 120.0])
+    assert np.allclose(schedule.interpolate(400.0, 80.0), schedule.table[1, 0])
+    mid = schedule.lookup(300.0, 100.0)
+    expected = schedule.table[:2, :2].mean(axis=(0, 1))
+    assert np.allclose([mid[name] for name in schedule.fields], expected)
+    assert np.allclose(schedule.interpolate(1e4, 1.0), schedule.table[-1, 0])
+    batch = schedule.lookup_batch([300.0, 1e4], [100.0, 1.0])
+    assert np.allclose(batch['kc'], [mid['kc'], schedule.table[-1, 0, 0]])
+
+
+def test_generate_rejects_compressed_liquid(platen):
+    with pytest.raises(ValueError, match='not superheated'):  # 350 °C platen inlet, Tsat(170 bar) 352.3 °C
+        platen.gain_schedule([200.0, 600.0], [100.0, 170.0])
+    platen.gain_schedule([200.0, 600.0], [100.0, 140.0])
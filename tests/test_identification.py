@@ -0,0 +1,27 @@
+import numpy as np
+from steamlib.fopdt import fopdt_simulate, sopdt_simulate
+from steamlib.identification import identify_fopdt, identify_sopdt
+
+
+def valve_moves(n, seed=0):
+    """Random steps held 30-300 samples, like operator spray-valve moves."""
+    rng = np.random.default_rng(seed)
+    holds = rng.integers(30, 300, n // 30)
+    levels = rng.uniform(-1, 1, holds.size)
+    return np.repeat(levels, holds)[:n]
+
+
+def test_identify_fopdt_recovers_parameters():
+    u = valve_moves(20000)
+    y = fopdt_simulate(u, 1.0, 0.7, 23.4, 45.0, u[0]) + 410.0
+    y += np.random.default_rng(1).normal(0.0, 0.01, y.size)
+    fit = identify_fopdt(u, y, 1.0, max_delay_s=60.0)
+    assert np.allclose([fit['k'], fit['theta_s'], fit['tau_s']], [0.7, 23.4, 45.0], rtol=0.01)
+    assert fit['fit'] > 0.95
+
+
+def test_identify_sopdt_recovers_parameters():
+    u = valve_moves(20000, seed=2)
+    y = sopdt_simulate(u, 1.0, 0.6, 15.0, 40.0, 12.0, u[0]) + 350.0
+    fit = identify_sopdt(u, y, 1.0, max_delay_s=40.0)
+    assert np.allclose([fit['k'], fit['theta_s'], fit['tau1_s'], fit['tau2_s']], [0.6, 15.0, 40.0, 12.0], rtol=0.01)
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from steamlib.fopdt import fopdt_simulate
+from steamlib.lpv import ltv_first_order, transport_delayed
+
+
+@pytest.mark.parametrize('stage', ['final', 'platen'])
+def test_constant_load_reproduces_fopdt_simulate(stage, request):
+    sh = request.getfixturevalue(stage)
+    props = sh.calculate_properties(120.0, sh.setpoint_inlet_C + 20.0, 400.0)
+    n, dt = 900, 1.0
+    for u in (np.ones(n), np.random.default_rng(4).normal(size=n)):
+        result = sh.lpv_simulate(np.full(n, 120.0), sh.setpoint_inlet_C + 20.0, 400.0, u, dt, u_initial=0.2)
+        reference = fopdt_simulate(u, dt, sh.default_gain, props['theta_s'], props['tau_s'], u_initial=0.2)
+        assert np.allclose(result['y'], reference, rtol=0, atol=1e-12)
+
+
+def test_varying_flow_converges_to_fine_steps(platen):
+    n = 1200
+    ramp = np.linspace(0.0, 1.0, n)
+    p_bar, t_c, flow_th = 60 + 60 * ramp, 380 + 20 * ramp, 200 + 300 * ramp
+    flow_th[600:610] *= np.linspace(1.0, 2.0, 10)  # Sudden flow increase: several samples enter per step
+    u = np.repeat(np.random.default_rng(5).normal(size=n // 50), 50)
+    y = platen.lpv_simulate(p_bar, t_c, flow_th, u, 1.0)['y']
+    props = platen.calculate_properties_batch(p_bar, t_c, flow_th)
+    errors = []
+    for m in (20, 2000):  # Sub-sampled plug tracking converges at O(1/m) to the split form
+        a = np.exp(-1.0 / m / np.repeat(props['tau_s'], m))
+        fine = transport_delayed(np.repeat(u, m), np.repeat(props['v'], m), 1.0 / m, platen.total_length_m)
+        errors.append(np.abs(ltv_first_order(a, 0.6 * (1 - a) * fine)[:-1][::m] - y).max())
+    assert errors[1] < errors[0] / 10 and errors[1] < 1e-3
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from steamlib.materials import material, metal_limit_report, section_limits_c
+
+
+def test_metal_limit_report_flags_overtemperature():
+    t_s = np.array([0.0, 10.0, 20.0, 30.0, 40.0])
+    metal_c = np.array([[500.0, 590.0], [560.0, 600.0], [585.0, 605.0], [590.0, 595.0], [570.0, 590.0]])[:, None, :]
+    report = metal_limit_report(metal_c, [580.0, 600.0], t_s)  # One tube, two sections
+    assert report['alarm'].tolist() == [[True, True]]
+    assert report['first_alarm_s'].tolist() == [[20.0, 20.0]]
+    assert report['time_over_s'].tolist() == [[20.0, 10.0]]  # Sample-and-hold: each sample holds to the next
+    assert report['peak_c'].tolist() == [[590.0, 605.0]] and report['min_margin_c'].tolist() == [[-10.0, -5.0]]
+    calm = metal_limit_report(metal_c - 30.0, [580.0, 600.0], t_s)
+    assert not calm['alarm'].any() and np.isnan(calm['first_alarm_s']).all() and not calm['time_over_s'].any()
+
+
+def test_yaml_materials_and_limits(final):
+    assert section_limits_c(final.sections).tolist() == [580.0, 600.0, 650.0, 600.0, 600.0, 580.0]
+    with pytest.raises(KeyError, match='unknown tube material'):
+        material('P22')
+
+
+def test_distributed_over_firing_trips_only_the_hot_tube(final):
+    model = final.distributed_model(170.0, cell_length_m=2.0, n_paths=2)
+    flux = model.design_heat_flux(500.0) * np.array([[1.0], [1.6]])  # Tube 1 sees 60 % more heat
+    t_s = np.arange(0.0, 1201.0, 10.0)
+    result = model.simulate(t_s, final.setpoint_inlet_C, 500.0, heat_flux_wm2=flux,
+                            heat_flux_scale=np.where(t_s < 300.0, 0.625, 1.0))  # Both tubes step up at 300 s
+    report = model.check_metal_limits(result)
+    assert report['alarm'].shape == (2, len(final.sections))
+    assert not report['alarm'][0].any() and np.all(report['min_margin_c'][0] > 0)
+    hot = report['alarm'][1]
+    assert hot.any() and np.all(report['first_alarm_s'][1, hot] > 300.0)
+    assert np.all(report['peak_c'][1, hot] > model.section_limits_c[hot])
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from steamlib.sensitivity import _indices, saltelli_sums, sobol_indices
+from steamlib.uncertainty import unit_samples
+
+
+def ishigami(x):
+    return np.sin(x[..., 0]) + 7 * np.sin(x[..., 1]) ** 2 + 0.1 * x[..., 2] ** 4 * np.sin(x[..., 0])
+
+
+def test_estimators_on_ishigami():
+    n, d = 1 << 15, 3
+    x = -np.pi + 2 * np.pi * unit_samples(n, 2 * d, 'sobol', seed=1)
+    a, b = x[:, :d], x[:, d:]
+    columns = np.arange(d)[:, None, None] == np.arange(d)
+    ab, ba = np.where(columns, b, a), np.where(columns, a, b)
+    result = _indices(saltelli_sums(ishigami(a), ishigami(b), ishigami(ab), ishigami(ba)), n, True)
+    assert np.allclose(result['S1'], [0.3139, 0.4424, 0.0], atol=3e-3)
+    assert np.allclose(result['ST'], [0.5576, 0.4424, 0.2437], atol=3e-3)
+    assert np.isclose(result['S2'][0, 2], 0.2437, atol=3e-3)
+
+
+def test_superheater_indices(final):
+    result = sobol_indices(final, 170.0, n_samples=1 << 12)
+    names = list(result['names'])
+    tau_st = dict(zip(names, result['tau_s']['ST']))
+    theta_st = dict(zip(names, result['theta_s']['ST']))
+    assert tau_st['total_length_m'] < 1e-6 and tau_st['n_coils'] < 1e-6  # Capacity and UA both scale with them
+    assert theta_st['U_W_m2K_low_load'] < 1e-6 and theta_st['tube_od_mm'] < 1e-6
+    assert max(tau_st, key=tau_st.get) == 'tube_id_mm'
+    assert np.all(result['theta_s']['ST'] >= result['theta_s']['S1'] - 1e-3)
+    assert result['n_evaluations'] == (1 << 12) * (2 * len(names) + 2)
+    pooled = sobol_indices(final, 170.0, n_samples=1 << 12, batch_size=1 << 10, workers=2)
+    assert np.allclose(pooled['tau_s']['ST'], result['tau_s']['ST'], atol=1e-12)
+
+
+def test_subcooled_platen_point_is_rejected(platen):
+    with pytest.raises(ValueError, match='not superheated'):
+        platen.sobol_sensitivity(170.0)
+    assert platen.sobol_sensitivity(120.0, n_samples=1 << 8)['n_evaluations'] == (1 << 8) * 12
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from steamlib.steam_path import SteamPath
+
+
+@pytest.fixture(scope='module')
+def path(platen, final):
+    return SteamPath(platen, final)
+
+
+def test_steady_state_matches_stage_by_stage(path, platen, final):
+    dt, n = 0.5, 1200
+    t_in = np.where(np.arange(n) * dt < 60.0, platen.setpoint_inlet_C, platen.setpoint_inlet_C + 5.0)
+    p_bar, flow_th, spray_th, t_spray = 120.0, 400.0, 8.0, 200.0
+    out = path.simulate(dt, p_bar, t_in, flow_th, spray_th, t_spray)
+    for i in (119, n - 1):  # Settled just before the inlet step, and at the end
+        t_platen_out = platen.setpoint_outlet_C + 0.6 * (t_in[i] - platen.setpoint_inlet_C)
+        mixed = path.attemperator.mix(p_bar, t_platen_out, flow_th, spray_th, t_spray)
+        t_main = final.setpoint_outlet_C + 0.7 * (mixed['t_out_c'] - final.setpoint_inlet_C)
+        assert out['platen_out_c'][i] == pytest.approx(t_platen_out, abs=1e-9)
+        assert out['attemperator_out_c'][i] == pytest.approx(float(mixed['t_out_c']), abs=1e-9)
+        assert out['main_steam_c'][i] == pytest.approx(float(t_main), abs=1e-9)
+    assert np.all(out['final_flow_th'] == flow_th + spray_th)
+
+
+def test_trajectory_equals_chained_stages(path, platen, final):
+    dt, n = 1.0, 600
+    t = np.arange(n) * dt
+    p_bar = 110.0 + 10.0 * t / t[-1]
+    flow_th = 350.0 + 100.0 * t / t[-1]
+    t_in = platen.setpoint_inlet_C + 4.0 * np.sin(2 * np.pi * t / 200.0)
+    spray_th = np.where(t > 300.0, 12.0, 4.0)
+    out = path.simulate(dt, p_bar, t_in, flow_th, spray_th, 200.0)
+    stage1 = platen.lpv_simulate(p_bar, t_in, flow_th, t_in - platen.setpoint_inlet_C, dt, 0.6)
+    t_platen_out = platen.setpoint_outlet_C + stage1['y']
+    t_attemp, final_flow = path.attemperator.outlet(p_bar, t_platen_out, flow_th, spray_th, 200.0)
+    stage2 = final.lpv_simulate(p_bar, t_attemp, final_flow, t_attemp - final.setpoint_inlet_C, dt, 0.7)
+    assert np.allclose(out['platen_out_c'], t_platen_out, rtol=0, atol=1e-12)
+    assert np.allclose(out['attemperator_out_c'], t_attemp, rtol=0, atol=1e-12)
+    assert np.allclose(out['main_steam_c'], final.setpoint_outlet_C + stage2['y'], rtol=0, atol=1e-12)
+    assert np.allclose(out['final_theta_s'], stage2['theta_s']) and np.allclose(out['platen_tau_s'], stage1['tau_s'])
@@ -0,0 +1,74 @@
+import numpy as np
+import pyXSteam
+import pytest
+from pyXSteam.XSteam import XSteam
+from steamlib import steam_properties
+from steamlib.steam_properties import GridBackend, check_superheated, xsteam_props_pt
+
+GRID_REL_ERROR = {'h': 4e-5, 'cp': 1e-3, 'v': 1e-4}  # GridBackend docstring, default grid
+
+
+def _tsat(p_bar):
+    steam = XSteam(XSteam.UNIT_SYSTEM_MKS)
+    return np.array([steam.tsat_p(p) for p in p_bar])
+
+
+def test_grid_within_stated_error_bound(grid):
+    rng = np.random.default_rng(0)
+    p_bar = rng.uniform(20.0, 200.0, 5000)
+    t_c = rng.uniform(np.maximum(_tsat(p_bar) + grid.superheat_margin_c, 300.0), 600.0)
+    for name, approx, exact in zip(GRID_REL_ERROR, grid.props_pt(p_bar, t_c), xsteam_props_pt(p_bar, t_c)):
+        assert np.max(np.abs(approx - exact) / np.abs(exact)) < GRID_REL_ERROR[name], name
+    assert all(error < GRID_REL_ERROR[name] for name, error in grid.max_rel_error().items())
+
+
+def test_grid_matches_xsteam_near_saturation_and_off_grid(grid):
+    rng = np.random.default_rng(1)
+    p_bar = rng.uniform(90.0, 200.0, 500)  # Tsat above the 300 °C grid edge
+    t_c = _tsat(p_bar) + rng.uniform(0.5, grid.superheat_margin_c, p_bar.size)
+    p_bar = np.r_[p_bar, 10.0, 210.0, 100.0]  # Below / above the pressure range, above the temperature range
+    t_c = np.r_[t_c, 400.0, 450.0, 620.0]
+    for approx, exact in zip(grid.props_pt(p_bar, t_c), xsteam_props_pt(p_bar, t_c)):
+        assert np.array_equal(approx, exact)
+    assert grid.props_pt(p_bar[0], t_c[0]) == tuple(float(x) for x in xsteam_props_pt(p_bar[0], t_c[0]))  # Scalar path
+
+
+def test_grid_save_load_round_trip(tmp_path):
+    grid = GridBackend((100.0, 110.0), (400.0, 420.0))
+    path = tmp_path / 'grid.bin'
+    grid.save(str(path))
+    loaded = GridBackend.load(str(path))
+    assert isinstance(loaded.tables, np.memmap) and isinstance(loaded.valid_cells, np.memmap)
+    assert np.array_equal(loaded.tables, grid.tables) and np.array_equal(loaded.valid_cells, grid.valid_cells)
+    assert loaded.grid_key() == grid.grid_key()
+    p_bar, t_c = np.linspace(100.0, 110.0, 7), np.linspace(401.0, 419.0, 7)
+    for a, b in zip(loaded.props_pt(p_bar, t_c), grid.props_pt(p_bar, t_c)):
+        assert np.array_equal(a, b)
+    cached = GridBackend.cached(str(tmp_path), p_range_bar=(100.0, 110.0), t_range_c=(400.0, 420.0))
+    assert cached.grid_key() == grid.grid_key() and isinstance(cached.tables, np.memmap)
+
+
+def test_grid_load_rejects_foreign_or_stale_files(tmp_path, monkeypatch):
+    grid = GridBackend((100.0, 102.0), (400.0, 402.0))
+    foreign = tmp_path / 'foreign.bin'
+    foreign.write_bytes(b'NOTAGRID' + bytes(64))
+    with pytest.raises(ValueError, match='not a steam property grid'):
+        GridBackend.load(str(foreign))
+    old_format = str(tmp_path / 'old_format.bin')
+    with monkeypatch.context() as m:
+        m.setattr(steam_properties, 'GRID_FORMAT_VERSION', 0)
+        grid.save(old_format)
+    with pytest.raises(ValueError, match='grid format 0'):
+        GridBackend.load(old_format)
+    other_release = str(tmp_path / 'other_release.bin')
+    grid.save(other_release)
+    monkeypatch.setattr(pyXSteam, '__version__', '0.0.0')
+    with pytest.raises(ValueError, match='pyXSteam'):
+        GridBackend.load(other_release)
+
+
+def test_check_superheated_flags_compressed_liquid():
+    check_superheated(np.array([60.0, 140.0, 250.0]), 350.0)  # Tsat 275.6 / 336.7 °C; 250 bar is supercritical
+    with pytest.raises(ValueError, match=r'2 of 4 points are not superheated.*170 bar'):
+        check_superheated(np.array([[60.0, 140.0], [170.0, 160.0]]), 350.0)  # Tsat(160) 347.4: inside the margin
+    check_superheated(160.0, 350.0, margin_c=2.0)
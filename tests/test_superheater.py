@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize('stage', ['final', 'platen'])
+def test_batch_properties_match_scalar_path(stage, request):
+    sh = request.getfixturevalue(stage)
+    p_bar = np.array([40.0, 60.0, 80.0, 100.0])
+    t_c = sh.setpoint_inlet_C + np.array([0.0, 15.0, 30.0, 45.0])
+    flow_th = np.array([200.0, 300.0, 400.0, 500.0])
+    scalar = [sh.calculate_properties(p, t, f) for p, t, f in zip(p_bar, t_c, flow_th)]
+    records = np.rec.fromarrays([p_bar, t_c, flow_th], names='p_bar,t_c,steam_flow_th')
+    inputs = {'arrays': (p_bar, t_c, flow_th), 'structured': (records,),
+              'dict': ({'p_bar': p_bar, 't_c': t_c, 'steam_flow_th': flow_th},)}
+    for kind, args in inputs.items():
+        batch = sh.calculate_properties_batch(*args)
+        assert set(batch) == set(scalar[0]), kind
+        for key, values in batch.items():
+            assert values.shape == p_bar.shape, kind
+            assert np.allclose(values, [props[key] for props in scalar], rtol=1e-12, atol=0), (kind, key)
+
+
+def test_broadcast_and_stage_gain(final, platen):
+    props = final.calculate_properties_batch(np.array([[60.0], [80.0]]), final.setpoint_inlet_C, np.array([300.0, 400.0]))
+    assert props['theta_s'].shape == (2, 2)
+    t = np.arange(0.0, 100.0)
+    assert final.fopdt_step_response_batch(t, theta_s=5.0, tau_s=20.0)[0, -1] == pytest.approx(0.7, rel=1e-2)
+    assert platen.fopdt_step_response_batch(t, theta_s=5.0, tau_s=20.0)[0, -1] == pytest.approx(0.6, rel=1e-2)
+    assert platen.fopdt_step_response_batch(t, k=1.0, theta_s=5.0, tau_s=20.0)[0, -1] == pytest.approx(1.0, rel=1e-2)
+
+
+def test_tube_banks(final, platen):
+    assert (platen.bank_attribute, platen.n_banks, platen.tubes_per_bank) == ('n_panels', platen.n_panels,
+                                                                               platen.tubes_per_panel)
+    assert (final.bank_attribute, final.n_banks, final.tubes_per_bank) == ('n_coils', final.n_coils, final.tubes_per_coil)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+
+def test_uniform_bank_splits_evenly_and_conserves_mass(final):
+    bank = final.tube_bank_model(170.0, cell_length_m=5.0)
+    assert bank.n_paths == final.total_tube_count and bank.n_panels == final.n_coils
+    assert np.allclose(bank.flow_split, 1 / bank.n_paths)
+    flow_th = np.array([300.0, 500.0])
+    assert np.allclose(bank.tube_flow_kgs(flow_th).sum(axis=-1), flow_th / 3.6)
+    uniform = bank.solve_flow_split(final.setpoint_inlet_C, 500.0)
+    assert np.allclose(uniform, 1 / bank.n_paths, rtol=1e-9)
+    subset = final.tube_bank_model(170.0, cell_length_m=5.0, n_paths=8)  # Modelled share of the bank flow
+    assert subset.tube_flow_kgs(500.0).sum() == pytest.approx(500.0 / 3.6 * 8 / final.total_tube_count)
+
+
+def test_flow_split_converges_and_starves_the_hot_panel(final):
+    bank = final.tube_bank_model(170.0, cell_length_m=5.0)
+    profile = np.ones(bank.n_panels)
+    profile[10] = 1.3  # Panel 10 over-fired
+    flux = bank.panel_heat_flux(profile, steam_flow_th=500.0)
+    split = bank.solve_flow_split(final.setpoint_inlet_C, 500.0, flux, n_iter=50, tol=1e-12).copy()
+    assert split.sum() == pytest.approx(1.0, abs=1e-12)
+    assert bank.tube_flow_kgs(500.0).sum() == pytest.approx(500.0 / 3.6, rel=1e-12)
+    # Fixed point: the split implied by the converged steady temperatures is the split itself
+    steam_c = bank.unpack(bank.steady_state(final.setpoint_inlet_C, 500.0, flux)[None], np.zeros(1))['steam_c'][0]
+    rho = (bank.rho_ref * (bank.t_ref_c + 273.15) / (steam_c + 273.15) * bank.dz_m).sum(axis=1) / bank.dz_m.sum()
+    assert np.allclose(bank._split(rho), split, rtol=1e-9)
+    hot = bank.panel_of_path == 10
+    assert np.all(split[hot] < split[~hot].min())  # Lighter steam, less flow
+    assert np.all(steam_c[hot, -1] > steam_c[~hot, -1].max())
+
+
+def test_longer_tubes_take_less_flow(final):
+    length_factor = np.ones(final.total_tube_count)
+    length_factor[:4] = 1.2
+    bank = final.tube_bank_model(170.0, cell_length_m=5.0, length_factor=length_factor)
+    assert bank.flow_split[0] / bank.flow_split[-1] == pytest.approx(np.sqrt(1 / 1.2))
+    assert bank.flow_split.sum() == pytest.approx(1.0)
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+import numpy as np
+import pytest
+from steamlib.control import PID
+from steamlib.tuning import fopdt_closed_loop, simc_pi, tune_pid
+
+
+@dataclass
+class RecordingPID(PID):
+    outputs: list = field(default_factory=list)
+
+    def step(self, sp, pv, freeze=None, track=None):
+        u = super().step(sp, pv, freeze, track)
+        self.outputs.append(np.copy(u))
+        return u
+
+
+def test_setpoint_step_hits_proportional_term():
+    pid = RecordingPID(kp=2.5, ti_s=50.0)
+    fopdt_closed_loop(1.0, 10.0, 50.0, pid, 0.25, 40)
+    assert np.isclose(pid.outputs[0], 2.5)
+
+
+def test_simc_overshoot_matches_full_p_action():
+    kc, ti = simc_pi(1.0, 10.0, 50.0)
+    result = fopdt_closed_loop(1.0, 10.0, 50.0, PID(kp=float(kc), ti_s=float(ti)), 0.25, 8000)
+    assert 0.03 < result['overshoot'] < 0.06
+
+
+def test_tuned_gains_beat_start_point_on_their_own_loop():
+    gains = tune_pid(1.0, 10.0, 50.0, mode='pi', overshoot_limit=0.1)
+    assert gains['overshoot'][0] <= 0.1
+    start = fopdt_closed_loop(1.0, 10.0, 50.0, PID(kp=2.5, ti_s=50.0), 0.25, 8000)
+    tuned = fopdt_closed_loop(1.0, 10.0, 50.0, PID(kp=float(gains['kc'][0]), ti_s=float(gains['ti_s'][0])), 0.25, 8000)
+    assert tuned['overshoot'] <= 0.1 + 1e-9
+    assert tuned['iae'] < start['iae']
+
+
+def test_superheater_tuning_rejects_compressed_liquid(platen):
+    load = np.linspace(0.3, 1.0, 8)
+    with pytest.raises(ValueError, match='not superheated'):  # The old bench sweep: 170 bar at 350 °C
+        platen.tune_pid(60 + 110 * load, platen.setpoint_inlet_C, 600 * load)
+
+
+def test_pooled_search_equals_serial():
+    serial = tune_pid([1.0, 0.7], [10.0, 4.0], [50.0, 20.0])
+    pooled = tune_pid([1.0, 0.7], [10.0, 4.0], [50.0, 20.0], workers=2)
+    assert all(np.array_equal(pooled[key], serial[key]) for key in serial)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from steamlib.uncertainty import MonteCarlo, StreamingQuantiles, nominal_parameters, sampled_properties
+
+
+def test_sampled_properties_match_calculate_properties(final, platen):
+    for sh, p_bar in ((final, 170.0), (platen, 120.0)):
+        nominal = nominal_parameters(sh, p_bar, steam_flow_th=450.0)
+        reference = sh.calculate_properties(p_bar, sh.setpoint_inlet_C, 450.0)
+        props = sampled_properties(nominal, {})
+        for key in ('theta_s', 'tau_s', 'v', 'm_kg', 'ua_wk'):
+            assert np.isclose(props[key], reference[key], rtol=1e-12)
+
+
+def test_subcooled_nominal_point_is_rejected(platen):
+    with pytest.raises(ValueError, match='not superheated'):
+        nominal_parameters(platen, 170.0)  # 350 °C inlet, Tsat 352.3 °C
+
+
+def test_streaming_quantiles_within_one_bin():
+    rng = np.random.default_rng(0)
+    x = np.concatenate([rng.normal(0, 1, (40000, 2)), rng.lognormal(1, 0.5, (40000, 2))])
+    sketch, left, right = StreamingQuantiles(2), StreamingQuantiles(2), StreamingQuantiles(2)
+    for block in np.array_split(x, 17):
+        sketch.update(block)
+    left.update(x[:30000])
+    right.update(x[30000:])
+    left.merge(right)
+    q = [0.01, 0.5, 0.95]
+    exact = np.quantile(x, q, axis=0)
+    bin_width = np.ptp(x, axis=0) / 1024
+    assert np.all(np.abs(sketch.quantile(q) - exact) <= bin_width)
+    assert np.all(np.abs(left.quantile(q) - exact) <= 2 * bin_width)
+    assert np.allclose(left.mean(), x.mean(axis=0)) and np.allclose(left.std(), x.std(axis=0, ddof=1))
+
+
+def test_monte_carlo_bands(final):
+    mc = MonteCarlo(final, {'U_W_m2K_low_load': ('normal', 900.0, 90.0)}, p_bar=170.0, k=0.7,
+                    t_s=np.arange(0.0, 60.0, 1.0))
+    result = mc.run(1 << 12, batch_size=1 << 10)
+    nominal = final.calculate_properties(170.0, final.setpoint_inlet_C, 500.0)
+    assert np.allclose(result['theta_s']['bands'], nominal['theta_s'])  # U does not move the transport delay
+    low, mid, high = result['tau_s']['bands']
+    assert low < nominal['tau_s'] * 0.99 and high > nominal['tau_s'] * 1.01 and np.isclose(mid, nominal['tau_s'], rtol=0.01)
+    outlet = result['outlet_c']['bands']
+    assert np.all(outlet[0] <= outlet[2]) and np.isclose(outlet[1, -1], final.setpoint_outlet_C + 0.7, atol=1e-3)
+    pooled = mc.run(1 << 12, batch_size=1 << 10, workers=2)
+    assert np.allclose(pooled['tau_s']['bands'], result['tau_s']['bands'], rtol=1e-3)